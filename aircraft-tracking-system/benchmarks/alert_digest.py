@@ -0,0 +1,120 @@
+"""
+Outbound notification calls with and without alert digests.
+
+Feeds the same alert stream (mostly INFO trend alerts, some WARNING and a
+few CRITICAL, spread across a fleet) through AlertNotifier to a recording
+stand-in channel, once sending every alert and once in digest mode. Reports
+channel calls and the notify-to-send latency of CRITICAL alerts, which
+must stay immediate in digest mode.
+
+    python -m benchmarks.alert_digest [--alerts N] [--duration S] [--window S] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import numpy as np
+
+from config.settings import AlertConfig
+from src.alerts.notifier import AlertNotifier, NotificationChannel
+from src.sensors.models import Alert, AlertSeverity, SensorType
+
+SEVERITIES = [AlertSeverity.INFO, AlertSeverity.WARNING, AlertSeverity.CRITICAL]
+SEVERITY_MIX = [0.90, 0.08, 0.02]
+
+
+class RecordingChannel(NotificationChannel):
+    """Stand-in channel that records each call."""
+
+    def __init__(self):
+        self.calls = 0
+        self.sent_at = {}
+
+    async def send(self, alert: Alert) -> bool:
+        self.calls += 1
+        self.sent_at[alert.id] = time.perf_counter()
+        return True
+
+
+def make_alerts(count: int, aircraft: int, seed: int):
+    rng = np.random.default_rng(seed)
+    severities = rng.choice(len(SEVERITIES), size=count, p=SEVERITY_MIX)
+    sensors = list(SensorType)
+    alerts = []
+    for i, severity in enumerate(severities.tolist()):
+        sensor = sensors[i % len(sensors)]
+        alerts.append(Alert(
+            aircraft_id=f"AC{rng.integers(aircraft):03d}",
+            sensor_type=sensor,
+            severity=SEVERITIES[severity],
+            title=f"Trend Alert: {sensor.value}" if severity == 0 else f"{sensor.value} alert",
+            value=float(rng.normal(50, 10)),
+        ))
+    return alerts
+
+
+async def run(alerts, duration: float, window: float) -> dict:
+    notifier = AlertNotifier(AlertConfig(
+        telegram_bot_token=None,
+        twilio_account_sid=None,
+        outbox_path="",
+        digest_window=window,
+    ))
+    channel = RecordingChannel()
+    notifier.add_channel(channel)
+
+    interval = duration / len(alerts)
+    notified_at = {}
+    begin = time.perf_counter()
+    for index, alert in enumerate(alerts):
+        delay = begin + index * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        notified_at[alert.id] = time.perf_counter()
+        await notifier.notify(alert)
+    await notifier.close()
+
+    critical = [
+        (channel.sent_at[alert.id] - notified_at[alert.id]) * 1e3
+        for alert in alerts
+        if alert.severity == AlertSeverity.CRITICAL
+    ]
+    return {
+        "channel_calls": channel.calls,
+        "critical_alerts": len(critical),
+        "critical_p99_ms": float(np.percentile(critical, 99)) if critical else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--alerts", type=int, default=3000)
+    parser.add_argument("--aircraft", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds the stream is spread over")
+    parser.add_argument("--window", type=float, default=0.5, help="Digest window (s)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    alerts = make_alerts(args.alerts, args.aircraft, args.seed)
+    direct = asyncio.run(run(alerts, args.duration, 0))
+    digest = asyncio.run(run(alerts, args.duration, args.window))
+    results = {
+        "alerts": args.alerts,
+        "window_s": args.window,
+        "direct": direct,
+        "digest": digest,
+        "call_reduction": direct["channel_calls"] / digest["channel_calls"],
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
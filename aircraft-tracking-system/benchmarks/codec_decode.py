@@ -0,0 +1,99 @@
+"""
+Decode cost per message: JSON vs binary sensor payloads.
+
+Reports microseconds per message for each format, both for payload
+decoding alone and for SensorDataCollector.handle_message end to end
+(no broker, no callbacks).
+
+    python -m benchmarks.codec_decode [--messages N] [--output results.json]
+"""
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+from config.settings import MQTTConfig
+from src.sensors import codec
+from src.sensors.collector import SensorDataCollector
+from src.sensors.models import SensorType
+
+
+def build_payloads(count: int):
+    start = datetime(2024, 1, 15, 10, 30)
+    json_messages, binary_messages = [], []
+    for i in range(count):
+        timestamp = start + timedelta(milliseconds=100 * i)
+        value = 70.0 + (i % 50) * 0.1
+        topic = "aircraft/AC001/sensors/engine_temperature"
+        json_messages.append((topic, json.dumps({
+            "sensor_id": "AC001-ENG1-TEMP",
+            "value": value,
+            "unit": "celsius",
+            "timestamp": timestamp.isoformat(),
+        }).encode()))
+        binary_messages.append((topic, codec.encode_reading(
+            SensorType.ENGINE_TEMP,
+            value,
+            int((timestamp - datetime(1970, 1, 1)).total_seconds() * 1_000_000_000),
+        )))
+    return json_messages, binary_messages
+
+
+def time_json_payload(messages) -> float:
+    """Microseconds per message for json.loads + fromisoformat."""
+    begin = time.perf_counter()
+    for _, payload in messages:
+        data = json.loads(payload.decode())
+        datetime.fromisoformat(data["timestamp"])
+    return (time.perf_counter() - begin) / len(messages) * 1e6
+
+
+def time_binary_payload(messages) -> float:
+    """Microseconds per message for codec.decode."""
+    begin = time.perf_counter()
+    for _, payload in messages:
+        codec.decode(payload)
+    return (time.perf_counter() - begin) / len(messages) * 1e6
+
+
+def time_handle_message(messages) -> float:
+    """Microseconds per message through handle_message."""
+    collector = SensorDataCollector(MQTTConfig(reading_buffer_size=len(messages)))
+    begin = time.perf_counter()
+    for topic, payload in messages:
+        collector.handle_message(topic, payload)
+    elapsed = time.perf_counter() - begin
+    assert len(collector.get_buffered_readings()) == len(messages)
+    return elapsed / len(messages) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=100_000)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    json_messages, binary_messages = build_payloads(args.messages)
+    results = {
+        "messages": args.messages,
+        "json_bytes_per_message": len(json_messages[0][1]),
+        "binary_bytes_per_message": len(binary_messages[0][1]),
+        "json_decode_us": time_json_payload(json_messages),
+        "binary_decode_us": time_binary_payload(binary_messages),
+        "json_handle_message_us": time_handle_message(json_messages),
+        "binary_handle_message_us": time_handle_message(binary_messages),
+    }
+    results["decode_speedup"] = results["json_decode_us"] / results["binary_decode_us"]
+    results["handle_message_speedup"] = (
+        results["json_handle_message_us"] / results["binary_handle_message_us"]
+    )
+
+    for key, value in results.items():
+        print(f"{key:28s} {value:,.2f}" if isinstance(value, float) else f"{key:28s} {value:,}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+"""
+End-to-end ingest benchmark on a synthetic fleet.
+
+Replays generated MQTT messages from a producer thread (standing in for
+the paho network thread) through SensorDataCollector._on_message, the
+ingest queue, MonitoringEngine.process_batch and AlertNotifier with a
+recording stub channel. No broker or external service is involved.
+
+Reports readings/sec, p50/p99 reading-to-alert latency for injected
+faults (message handed to _on_message -> stub channel send) and peak RSS.
+By default messages are sent flat out, so throughput is the saturation
+rate and latency includes queueing; --realtime paces them at the
+simulated report rate to measure latency under nominal load.
+
+--workers N runs the sharded mode (INGEST_WORKERS=N) instead: raw
+messages go to N worker processes and their alerts are merged back into
+the parent engine before notification. Worker start-up is excluded from
+the timing. Compare readings/sec across N to see how ingest scales with
+cores.
+
+    python -m benchmarks.end_to_end [--aircraft N] [--duration S] [--workers N] [--output results.json]
+    python -m benchmarks.end_to_end --baseline results.json  # exit 1 on regression
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import resource
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.fleet import FaultKey, FleetLoad, generate_fleet
+from config.settings import AlertConfig, MQTTConfig
+from src.alerts.notifier import AlertNotifier, NotificationChannel
+from src.monitoring.engine import MonitoringEngine
+from src.sensors.collector import SensorDataCollector
+from src.sensors.models import Alert
+from src.sensors.sharding import ShardedIngestor, shard_for
+
+
+class RecordingChannel(NotificationChannel):
+    """Stub channel that records when each alert would have been sent."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.sent: List[Alert] = []
+        self.sent_at: Dict[FaultKey, int] = {}
+
+    async def send(self, alert: Alert) -> bool:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        key = (alert.aircraft_id, alert.sensor_type.value if alert.sensor_type else "", alert.value)
+        self.sent_at.setdefault(key, time.perf_counter_ns())
+        self.sent.append(alert)
+        return True
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, KiB elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def start_shards(
+    collector: SensorDataCollector,
+    engine: MonitoringEngine,
+    mqtt_config: MQTTConfig,
+    workers: int,
+) -> ShardedIngestor:
+    """Start sharded ingestion merging alerts into ``engine``, as AircraftTrackingSystem does."""
+    loop = asyncio.get_running_loop()
+
+    def on_alerts(alerts: List[Alert]) -> None:
+        for alert in alerts:
+            handler = engine.apply_resolution if alert.resolved else engine.publish_alert
+            loop.call_soon_threadsafe(handler, alert)
+
+    ingestor = ShardedIngestor(mqtt_config, AlertConfig(), on_alerts, workers=workers)
+    collector.enable_sharding(ingestor)
+    ingestor.start()
+
+    # One alerting reading per shard; its alert comes back once the worker is up
+    for shard in range(workers):
+        aircraft_id = next(f"WARMUP{n}" for n in range(10_000) if shard_for(f"WARMUP{n}", workers) == shard)
+        ingestor.submit(aircraft_id, f"aircraft/{aircraft_id}/sensors/engine_temperature", b'{"value": 200.0}')
+    ingestor.flush()
+    while ingestor.alerts_received < workers:
+        await asyncio.sleep(0.01)
+    return ingestor
+
+
+async def run_pipeline(
+    load: FleetLoad,
+    mqtt_config: MQTTConfig,
+    channel_delay: float = 0.0,
+    realtime_s: Optional[float] = None,
+    workers: int = 0,
+) -> dict:
+    """
+    Push the load through the pipeline and collect timings.
+    With ``realtime_s`` set, messages are spread evenly over that many
+    seconds instead of being sent as fast as possible. With ``workers``
+    set, messages are parsed and monitored in that many shard processes.
+    """
+    loop = asyncio.get_running_loop()
+    collector = SensorDataCollector(mqtt_config)
+    collector.attach_event_loop(loop)
+    engine = MonitoringEngine(AlertConfig())
+    notifier = AlertNotifier(AlertConfig(
+        telegram_bot_token=None,
+        twilio_account_sid=None,
+        outbox_path="",
+        digest_window=0,
+    ))
+    channel = RecordingChannel(channel_delay)
+    notifier.add_channel(channel)
+
+    notifications: List[asyncio.Task] = []
+    collector.register_batch_callback(engine.process_batch)
+    engine.register_alert_callback(
+        lambda alert: notifications.append(asyncio.create_task(notifier.notify(alert)))
+    )
+    ingestor = None
+    if workers:
+        ingestor = await start_shards(collector, engine, mqtt_config, workers)
+        await asyncio.sleep(0)  # Let the warm-up alerts merge, then forget them
+        await asyncio.gather(*notifications)
+        notifications.clear()
+        channel.sent.clear()
+
+    # Send times are recorded only for messages carrying a fault
+    fault_sent_at: Dict[FaultKey, int] = {}
+
+    def produce() -> None:
+        messages = load.messages
+        faults = load.faults
+        on_message = collector._on_message
+        interval = realtime_s / len(messages) if realtime_s else 0.0
+        start = time.perf_counter()
+        for index, message in enumerate(messages):
+            if interval:
+                delay = start + index * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            keys = faults.get(index)
+            if keys:
+                now = time.perf_counter_ns()
+                for key in keys:
+                    fault_sent_at[key] = now
+            on_message(None, None, message)
+
+    begin = time.perf_counter()
+    producer = threading.Thread(target=produce, name="bench-producer")
+    producer.start()
+    while producer.is_alive() or collector.ingest_stats["pending"]:
+        await asyncio.sleep(0.001)
+    producer.join()
+    if ingestor:
+        # Flushes, waits for the workers to finish and delivers their last alerts
+        await loop.run_in_executor(None, ingestor.stop)
+    await asyncio.sleep(0)  # Let the last drain (or alert merge) run
+    await asyncio.gather(*notifications)
+    elapsed = time.perf_counter() - begin
+
+    latencies = [
+        (channel.sent_at[key] - sent) / 1e6
+        for key, sent in fault_sent_at.items()
+        if key in channel.sent_at
+    ]
+    return {
+        "elapsed_s": elapsed,
+        "alerts_raised": len(notifications),
+        "notifications_sent": len(channel.sent),
+        "faults_alerted": len(latencies),
+        "latencies_ms": latencies,
+        "ingest": collector.ingest_stats,
+        "buffer_dropped": collector.buffer_dropped,
+        "shard_dropped": ingestor.messages_dropped if ingestor else 0,
+    }
+
+
+def check_regression(results: dict, baseline_path: str, tolerance: float) -> List[str]:
+    """Compare against a previous results file; returns regression messages."""
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    problems = []
+    if results["readings_per_sec"] < baseline["readings_per_sec"] * (1 - tolerance):
+        problems.append(
+            f"readings/sec {results['readings_per_sec']:,.0f} < baseline {baseline['readings_per_sec']:,.0f}"
+        )
+    for key in ("latency_p50_ms", "latency_p99_ms", "peak_rss_mb"):
+        current, previous = results.get(key), baseline.get(key)
+        if current is not None and previous is not None and current > previous * (1 + tolerance):
+            problems.append(f"{key} {current:.2f} > baseline {previous:.2f}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=100)
+    parser.add_argument("--rate", type=float, default=1.0, help="Reports per aircraft per second")
+    parser.add_argument("--duration", type=float, default=60.0, help="Simulated seconds of traffic")
+    parser.add_argument("--fault-rate", type=float, default=0.001, help="Fault probability per aircraft report")
+    parser.add_argument("--binary", action="store_true", help="One binary frame per report instead of JSON per reading")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--realtime", action="store_true", help="Send at the simulated report rate instead of flat out")
+    parser.add_argument("--overflow", default="block", help="Ingest overflow policy")
+    parser.add_argument("--channel-delay", type=float, default=0.0, help="Simulated send time per notification (s)")
+    parser.add_argument("--workers", type=int, default=0, help="Ingest worker processes (0 = in-process)")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Fail if results regress against this results file")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed regression fraction")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    load = generate_fleet(
+        aircraft=args.aircraft,
+        rate_hz=args.rate,
+        duration_s=args.duration,
+        fault_rate=args.fault_rate,
+        binary=args.binary,
+        start_ns=time.time_ns(),
+        seed=args.seed,
+    )
+    mqtt_config = MQTTConfig(
+        ingest_overflow_policy=args.overflow,
+        reading_buffer_size=load.readings,
+        ingest_workers=args.workers,
+        # Room for the whole load, so a shard that falls behind queues instead of dropping
+        shard_queue_batches=len(load.messages) // MQTTConfig.shard_batch_size + 1,
+    )
+    run = asyncio.run(run_pipeline(
+        load,
+        mqtt_config,
+        channel_delay=args.channel_delay,
+        realtime_s=args.duration if args.realtime else None,
+        workers=args.workers,
+    ))
+
+    latencies = run.pop("latencies_ms")
+    results = {
+        "started_at": datetime.utcnow().isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "config": {
+            "aircraft": args.aircraft,
+            "rate_hz": args.rate,
+            "duration_s": args.duration,
+            "fault_rate": args.fault_rate,
+            "format": "binary" if args.binary else "json",
+            "seed": args.seed,
+            "realtime": args.realtime,
+            "overflow": args.overflow,
+            "channel_delay_s": args.channel_delay,
+            "workers": args.workers,
+        },
+        "messages": len(load.messages),
+        "readings": load.readings,
+        "faults_injected": load.fault_count,
+        **run,
+        "readings_per_sec": load.readings / run["elapsed_s"],
+        "latency_p50_ms": float(np.percentile(latencies, 50)) if latencies else None,
+        "latency_p99_ms": float(np.percentile(latencies, 99)) if latencies else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+    for key, value in results.items():
+        if isinstance(value, float):
+            print(f"{key:22s} {value:,.2f}")
+        elif isinstance(value, int):
+            print(f"{key:22s} {value:,}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        problems = check_regression(results, args.baseline, args.tolerance)
+        for problem in problems:
+            print(f"REGRESSION: {problem}")
+        if problems:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
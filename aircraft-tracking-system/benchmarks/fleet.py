@@ -0,0 +1,140 @@
+"""
+Synthetic fleet load generator for benchmarks.
+
+Produces a deterministic stream of MQTT sensor messages for a fleet of
+aircraft reporting all ten sensor types at a fixed rate, with injected
+threshold faults whose readings are expected to raise alerts.
+"""
+import json
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Tuple
+
+import numpy as np
+
+from src.sensors import codec
+from src.sensors.models import SensorType, DEFAULT_UNITS, from_epoch_ns
+
+
+class Message(NamedTuple):
+    """Raw MQTT message (the attributes SensorDataCollector._on_message reads)."""
+    topic: str
+    payload: bytes
+
+
+# (aircraft_id, sensor type value, value) of a reading expected to alert
+FaultKey = Tuple[str, str, float]
+
+# Nominal value and noise (std) per sensor
+SENSOR_PROFILES: Dict[SensorType, Tuple[float, float]] = {
+    SensorType.ENGINE_TEMP: (75.0, 2.0),
+    SensorType.OIL_PRESSURE: (45.0, 1.5),
+    SensorType.FUEL_LEVEL: (80.0, 0.5),
+    SensorType.HYDRAULIC_PRESSURE: (3000.0, 20.0),
+    SensorType.VIBRATION: (2.0, 0.3),
+    SensorType.ALTITUDE: (35000.0, 50.0),
+    SensorType.AIRSPEED: (450.0, 5.0),
+    SensorType.GPS: (45.0, 0.01),
+    SensorType.LANDING_GEAR: (0.0, 0.0),
+    SensorType.BRAKE_TEMP: (150.0, 5.0),
+}
+
+# Value range of an injected fault per thresholded sensor (see AlertConfig)
+FAULT_RANGES: Dict[SensorType, Tuple[float, float]] = {
+    SensorType.ENGINE_TEMP: (97.0, 110.0),
+    SensorType.OIL_PRESSURE: (5.0, 14.0),
+    SensorType.FUEL_LEVEL: (2.0, 9.0),
+    SensorType.HYDRAULIC_PRESSURE: (2400.0, 2750.0),
+    SensorType.VIBRATION: (7.5, 12.0),
+}
+
+SENSOR_TYPES = list(SensorType)
+FAULT_TYPES = list(FAULT_RANGES)
+
+
+@dataclass
+class FleetLoad:
+    """Generated messages plus the injected faults they carry."""
+    messages: List[Message]
+    readings: int
+    # Message index -> fault keys carried by that message
+    faults: Dict[int, List[FaultKey]] = field(default_factory=dict)
+
+    @property
+    def fault_count(self) -> int:
+        return sum(len(keys) for keys in self.faults.values())
+
+
+def generate_fleet(
+    aircraft: int = 100,
+    rate_hz: float = 1.0,
+    duration_s: float = 60.0,
+    fault_rate: float = 0.001,
+    binary: bool = False,
+    start_ns: int = 0,
+    seed: int = 42,
+) -> FleetLoad:
+    """
+    Generate ``duration_s`` seconds of reports for ``aircraft`` aircraft.
+
+    Every aircraft reports all sensors ``rate_hz`` times per second. With
+    probability ``fault_rate`` per aircraft and report, one thresholded
+    sensor reports a value beyond its critical limit. JSON mode publishes
+    one message per reading on aircraft/{id}/sensors/{type}; binary mode
+    one codec frame per aircraft and report. Values depend only on the
+    arguments (and seed); ``start_ns`` only shifts timestamps.
+    """
+    rng = np.random.default_rng(seed)
+    ticks = max(1, int(duration_s * rate_hz))
+    step_ns = int(1_000_000_000 / rate_hz)
+    aircraft_ids = [f"SIM{i:05d}" for i in range(aircraft)]
+
+    nominal = np.array([SENSOR_PROFILES[t][0] for t in SENSOR_TYPES])
+    noise = np.array([SENSOR_PROFILES[t][1] for t in SENSOR_TYPES])
+    values = nominal + rng.standard_normal((ticks, aircraft, len(SENSOR_TYPES))) * noise
+
+    # Injected faults: (tick, aircraft) pairs, one sensor each
+    fault_ticks, fault_aircraft = np.nonzero(rng.random((ticks, aircraft)) < fault_rate)
+    fault_sensors = rng.integers(len(FAULT_TYPES), size=len(fault_ticks))
+    fault_cells = {}
+    for tick, index, choice in zip(fault_ticks.tolist(), fault_aircraft.tolist(), fault_sensors.tolist()):
+        sensor_type = FAULT_TYPES[choice]
+        low, high = FAULT_RANGES[sensor_type]
+        value = round(float(rng.uniform(low, high)), 3)
+        values[tick, index, SENSOR_TYPES.index(sensor_type)] = value
+        fault_cells[(tick, index)] = (sensor_type, value)
+
+    messages: List[Message] = []
+    faults: Dict[int, List[FaultKey]] = {}
+    for tick in range(ticks):
+        timestamp_ns = start_ns + tick * step_ns
+        timestamp = from_epoch_ns(timestamp_ns).isoformat()
+        rows = values[tick].tolist()
+        for index, aircraft_id in enumerate(aircraft_ids):
+            fault = fault_cells.get((tick, index))
+            row = rows[index]
+            if binary:
+                if fault:
+                    faults[len(messages)] = [(aircraft_id, fault[0].value, fault[1])]
+                messages.append(Message(
+                    f"aircraft/{aircraft_id}/sensors/frame",
+                    codec.encode_readings(
+                        (sensor_type, value, timestamp_ns)
+                        for sensor_type, value in zip(SENSOR_TYPES, row)
+                    ),
+                ))
+                continue
+
+            for sensor_type, value in zip(SENSOR_TYPES, row):
+                if fault and fault[0] == sensor_type:
+                    faults[len(messages)] = [(aircraft_id, sensor_type.value, value)]
+                messages.append(Message(
+                    f"aircraft/{aircraft_id}/sensors/{sensor_type.value}",
+                    json.dumps({
+                        "sensor_id": f"{aircraft_id}_{sensor_type.value}",
+                        "value": value,
+                        "unit": DEFAULT_UNITS[sensor_type],
+                        "timestamp": timestamp,
+                    }).encode(),
+                ))
+
+    return FleetLoad(messages, ticks * aircraft * len(SENSOR_TYPES), faults)
@@ -0,0 +1,98 @@
+"""
+Nightly flight-log import: bulk versus per-aircraft flight-hour updates.
+
+Registers a fleet and applies the same rounds of flight-hour totals once
+through ``bulk_update_flight_hours`` (one vectorized due check per round)
+and once through ``update_flight_hours`` per aircraft, checking that both
+schedule the same tasks.
+
+    python -m benchmarks.flight_hours_bulk [--aircraft N] [--rounds R] [--output results.json]
+"""
+import argparse
+import json
+import logging
+import random
+import time
+
+from config.settings import MaintenanceConfig
+from src.maintenance.models import AircraftStatus
+from src.maintenance.scheduler import MaintenanceScheduler
+
+
+def build(aircraft: int, seed: int) -> MaintenanceScheduler:
+    rng = random.Random(seed)
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    for index in range(aircraft):
+        scheduler.register_aircraft(AircraftStatus(
+            aircraft_id=f"AC{index:05d}",
+            registration=f"N{index:05d}",
+            model="A320",
+            total_flight_hours=rng.uniform(0, 30000),
+            cycles=0,
+            hours_since_a_check=rng.uniform(0, 500),
+            hours_since_b_check=rng.uniform(0, 2000),
+            hours_since_c_check=rng.uniform(0, 6000),
+            hours_since_d_check=rng.uniform(0, 25000),
+        ))
+    return scheduler
+
+
+def make_rounds(scheduler: MaintenanceScheduler, rounds: int, seed: int):
+    """Absolute totals per round: each aircraft flies 0-14 hours a day."""
+    rng = random.Random(seed)
+    totals = {aircraft_id: status.total_flight_hours for aircraft_id, status in scheduler._aircraft_status.items()}
+    result = []
+    for _ in range(rounds):
+        for aircraft_id in totals:
+            totals[aircraft_id] += rng.uniform(0, 14)
+        result.append(dict(totals))
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    bulk = build(args.aircraft, args.seed)
+    single = build(args.aircraft, args.seed)
+    rounds = make_rounds(bulk, args.rounds, args.seed)
+
+    begin = time.perf_counter()
+    bulk_tasks = [bulk.bulk_update_flight_hours(totals) for totals in rounds]
+    bulk_ms = (time.perf_counter() - begin) * 1000
+
+    begin = time.perf_counter()
+    single_tasks = [
+        [task for aircraft_id, hours in totals.items() for task in single.update_flight_hours(aircraft_id, hours)]
+        for totals in rounds
+    ]
+    single_ms = (time.perf_counter() - begin) * 1000
+
+    same = all(
+        [(t.aircraft_id, t.maintenance_type) for t in a] == [(t.aircraft_id, t.maintenance_type) for t in b]
+        for a, b in zip(bulk_tasks, single_tasks)
+    )
+    results = {
+        "aircraft": args.aircraft,
+        "rounds": args.rounds,
+        "tasks_created": sum(len(tasks) for tasks in bulk_tasks),
+        "round_ms": {
+            "bulk": bulk_ms / args.rounds,
+            "per_aircraft": single_ms / args.rounds,
+        },
+        "same_tasks": same,
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Flight hours and cycles derived from telemetry.
+
+Generates flight profiles per aircraft (taxi, takeoff roll, climb, cruise,
+descent, landing, taxi) sampled every --interval seconds, streams their
+altitude, airspeed and landing gear readings through FlightTracker in time
+order, and compares the derived flight hours and cycles with the profiles'
+airborne time. Also reports tracker throughput in readings per second.
+
+    python -m benchmarks.flight_tracking [--aircraft N] [--flights F] [--interval S] [--output results.json]
+"""
+import argparse
+import json
+import logging
+import random
+import time
+
+from config.settings import MaintenanceConfig
+from src.maintenance.flight_tracker import FlightTracker
+from src.maintenance.models import AircraftStatus
+from src.maintenance.scheduler import MaintenanceScheduler
+from src.sensors.models import SensorReading, SensorType
+
+NS = 10**9
+
+
+def flight_profile(rng: random.Random, start_s: float, interval: float, origin: float):
+    """
+    (t, altitude, airspeed, gear_down) samples of one flight from an airport
+    at ``origin`` feet, its airborne seconds, end time and destination elevation.
+    """
+    destination = rng.uniform(0, 5000)
+    taxi, roll, climb, descent = rng.uniform(300, 900), 40.0, 1200.0, 1500.0
+    cruise = rng.uniform(1800, 4 * 3600)
+    phases = [
+        (taxi, lambda f: (origin, 15.0, True)),
+        (roll, lambda f: (origin, 160.0 * f, True)),
+        (climb, lambda f: (origin + (35000.0 - origin) * f, 160.0 + 290.0 * f, f < 0.05)),
+        (cruise, lambda f: (35000.0, 450.0, False)),
+        (descent, lambda f: (35000.0 - (35000.0 - destination) * f, 450.0 - 310.0 * f, f > 0.9)),
+        (60.0, lambda f: (destination, 140.0 * (1 - f), True)),
+        (taxi, lambda f: (destination, 15.0, True)),
+    ]
+    samples = []
+    t = start_s
+    for duration, shape in phases:
+        steps = max(1, int(duration / interval))
+        for step in range(steps):
+            altitude, airspeed, gear_down = shape(step / steps)
+            samples.append((t, altitude, airspeed, gear_down))
+            t += interval
+    # Wheels off to touchdown; the tracker also counts the rolls above the speed thresholds
+    return samples, climb + cruise + descent, t, destination
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=50)
+    parser.add_argument("--flights", type=int, default=4, help="Flights per aircraft")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between samples")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    rng = random.Random(args.seed)
+
+    config = MaintenanceConfig()
+    scheduler = MaintenanceScheduler(config)
+    tracker = FlightTracker(config, scheduler)
+
+    readings = []
+    expected_hours = {}
+    for index in range(args.aircraft):
+        aircraft_id = f"AC{index:03d}"
+        scheduler.register_aircraft(AircraftStatus(aircraft_id, f"N{index:03d}", "A320", 0.0, 0))
+        t = rng.uniform(0, 3600)
+        elevation = rng.uniform(0, 5000)
+        expected_hours[aircraft_id] = 0.0
+        for _ in range(args.flights):
+            samples, airborne, t, elevation = flight_profile(rng, t, args.interval, elevation)
+            expected_hours[aircraft_id] += airborne / 3600
+            t += rng.uniform(1800, 7200)  # Turnaround
+            for sample_t, altitude, airspeed, gear_down in samples:
+                timestamp_ns = int(sample_t * NS)
+                readings.append(SensorReading("alt", SensorType.ALTITUDE, aircraft_id, altitude, "feet", timestamp_ns))
+                readings.append(SensorReading("spd", SensorType.AIRSPEED, aircraft_id, airspeed, "knots", timestamp_ns))
+                readings.append(SensorReading("gear", SensorType.LANDING_GEAR, aircraft_id, float(gear_down), "state", timestamp_ns))
+    readings.sort(key=lambda reading: reading.timestamp_ns)
+
+    begin = time.perf_counter()
+    for reading in readings:
+        tracker.on_reading(reading)
+    elapsed = time.perf_counter() - begin
+    tracker.flush()
+
+    errors = [
+        abs(scheduler._aircraft_status[aircraft_id].total_flight_hours - hours)
+        for aircraft_id, hours in expected_hours.items()
+    ]
+    cycles = [status.cycles for status in scheduler._aircraft_status.values()]
+    results = {
+        "readings": len(readings),
+        "readings_per_s": len(readings) / elapsed,
+        "cycles_expected": args.flights,
+        "cycles_min": min(cycles),
+        "cycles_max": max(cycles),
+        "hours_error_max": max(errors),
+        "error_per_flight_s": sum(errors) / len(errors) / args.flights * 3600,
+        "tracker": tracker.get_stats(),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
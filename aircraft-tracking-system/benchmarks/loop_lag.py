@@ -0,0 +1,89 @@
+"""
+Event loop lag while notifying through a synchronous channel SDK.
+
+Sends alerts through AlertNotifier to a stand-in channel whose client
+blocks for ``--call-ms`` per send (like the Twilio SDK), once awaited
+inline on the loop (the previous SMS behaviour) and once flagged
+``blocking`` so the notifier runs it on the channel's thread pool.
+Reports loop lag percentiles from LoopLagMonitor for both runs.
+
+    python -m benchmarks.loop_lag [--alerts N] [--call-ms MS] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from config.settings import AlertConfig
+from src.alerts.notifier import AlertNotifier, NotificationChannel
+from src.monitoring.lag import LoopLagMonitor
+from src.sensors.models import Alert, AlertSeverity
+
+
+class SlowSDKChannel(NotificationChannel):
+    """Channel whose client call blocks the calling thread."""
+
+    name = "slow-sdk"
+
+    def __init__(self, call_seconds: float, blocking: bool):
+        self.call_seconds = call_seconds
+        self.blocking = blocking
+
+    def send_blocking(self, alert: Alert) -> bool:
+        time.sleep(self.call_seconds)
+        return True
+
+    async def send(self, alert: Alert) -> bool:
+        # Synchronous call inside a coroutine: stalls the loop
+        return self.send_blocking(alert)
+
+
+async def measure(alerts: int, call_seconds: float, blocking: bool, interval: float) -> dict:
+    notifier = AlertNotifier(AlertConfig(
+        telegram_bot_token=None,
+        twilio_account_sid=None,
+        outbox_path="",
+        digest_window=0,
+    ))
+    notifier.add_channel(SlowSDKChannel(call_seconds, blocking))
+    monitor = LoopLagMonitor(interval=interval, warn_threshold=float("inf"))
+    monitor.start()
+
+    begin = time.perf_counter()
+    tasks = []
+    for i in range(alerts):
+        alert = Alert(aircraft_id=f"AC{i:03d}", severity=AlertSeverity.CRITICAL, title="bench")
+        tasks.append(asyncio.create_task(notifier.notify(alert)))
+        await asyncio.sleep(interval)  # Alerts arrive over time
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - begin
+
+    await monitor.stop()
+    await notifier.close()
+    return {"elapsed_s": elapsed, **monitor.get_stats()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--alerts", type=int, default=100)
+    parser.add_argument("--call-ms", type=float, default=50.0, help="Blocking time per SDK call")
+    parser.add_argument("--interval-ms", type=float, default=5.0, help="Lag sampling interval")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    call_seconds = args.call_ms / 1000
+    interval = args.interval_ms / 1000
+    results = {
+        "alerts": args.alerts,
+        "call_ms": args.call_ms,
+        "inline": asyncio.run(measure(args.alerts, call_seconds, False, interval)),
+        "thread_pool": asyncio.run(measure(args.alerts, call_seconds, True, interval)),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Maintenance task lookups on a large fleet history.
+
+Builds a MaintenanceScheduler holding a multi-year task history (mostly
+completed tasks, a few scheduled per aircraft) and times pending-task
+lookup, upcoming and overdue queries through the task index against the
+linear scans they replaced (reimplemented here over the same tasks).
+
+    python -m benchmarks.maintenance_index [--aircraft N] [--years Y] [--output results.json]
+"""
+import argparse
+import json
+import logging
+import random
+import time
+from datetime import datetime, timedelta
+
+from config.settings import MaintenanceConfig
+from src.maintenance.models import MaintenanceStatus, MaintenanceTask, MaintenanceType
+from src.maintenance.scheduler import MaintenanceScheduler
+
+CHECK_TYPES = [MaintenanceType.A_CHECK, MaintenanceType.B_CHECK, MaintenanceType.C_CHECK, MaintenanceType.COMPONENT]
+PENDING = [MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS, MaintenanceStatus.OVERDUE]
+
+
+def build(aircraft: int, years: float, seed: int) -> MaintenanceScheduler:
+    """About one completed task per aircraft per week of history, plus the current schedule."""
+    rng = random.Random(seed)
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    now = datetime.utcnow()
+    weeks = int(years * 52)
+    for index in range(aircraft):
+        aircraft_id = f"AC{index:05d}"
+        for week in range(weeks):
+            task = MaintenanceTask(
+                aircraft_id=aircraft_id,
+                maintenance_type=rng.choice(CHECK_TYPES),
+                scheduled_date=now - timedelta(weeks=weeks - week),
+                status=MaintenanceStatus.COMPLETED,
+            )
+            scheduler.create_task(task)
+        for check_type in CHECK_TYPES:
+            scheduler.create_task(MaintenanceTask(
+                aircraft_id=aircraft_id,
+                maintenance_type=check_type,
+                scheduled_date=now + timedelta(days=rng.uniform(-1, 120)),
+            ))
+    return scheduler
+
+
+def scan_pending(tasks, aircraft_id, maintenance_type):
+    for task in tasks:
+        if (task.aircraft_id == aircraft_id and task.maintenance_type == maintenance_type
+                and task.status in PENDING):
+            return task
+    return None
+
+
+def scan_upcoming(tasks, cutoff):
+    found = [
+        t for t in tasks
+        if t.status == MaintenanceStatus.SCHEDULED and (t.scheduled_date is None or t.scheduled_date <= cutoff)
+    ]
+    return sorted(found, key=lambda t: t.scheduled_date or datetime.max)
+
+
+def scan_overdue(tasks, now):
+    return [t for t in tasks if t.status == MaintenanceStatus.SCHEDULED and t.scheduled_date and t.scheduled_date < now]
+
+
+def timed(fn, repeat: int) -> float:
+    """Mean milliseconds per call."""
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - begin) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=500)
+    parser.add_argument("--years", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    scheduler = build(args.aircraft, args.years, args.seed)
+    tasks = list(scheduler._tasks)
+    rng = random.Random(args.seed)
+    probes = [(f"AC{rng.randrange(args.aircraft):05d}", rng.choice(CHECK_TYPES)) for _ in range(200)]
+    cutoff = datetime.utcnow() + timedelta(days=7)
+
+    def indexed_pending():
+        for aircraft_id, check_type in probes:
+            scheduler._get_pending_task(aircraft_id, check_type)
+
+    def linear_pending():
+        for aircraft_id, check_type in probes:
+            scan_pending(tasks, aircraft_id, check_type)
+
+    results = {
+        "tasks": len(tasks),
+        "pending_lookup_us": {
+            "indexed": timed(indexed_pending, 5) / len(probes) * 1000,
+            "linear": timed(linear_pending, 1) / len(probes) * 1000,
+        },
+        "upcoming_7d_ms": {
+            "indexed": timed(lambda: scheduler.get_upcoming_maintenance(days_ahead=7), 20),
+            "linear": timed(lambda: scan_upcoming(tasks, cutoff), 3),
+        },
+        # Only the scan is repeatable: the indexed call marks tasks overdue
+        "overdue_ms": {
+            "linear": timed(lambda: scan_overdue(tasks, datetime.utcnow()), 3),
+            "indexed": timed(lambda: scheduler.get_overdue_maintenance(), 1),
+        },
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Maintenance persistence: bulk upserts and indexed loads.
+
+Registers a fleet with a task history in a MaintenanceScheduler, persists
+it through MaintenanceRepository, then times a round of flight-hour
+updates written as one bulk upsert against one UPDATE per aircraft, the
+open-task and per-aircraft history loads, and restoring a fresh scheduler. Runs against a
+temporary SQLite file unless --url points at a real database.
+
+    python -m benchmarks.maintenance_persistence [--aircraft N] [--tasks T] [--url URL] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import update
+
+from config.settings import DatabaseConfig, MaintenanceConfig
+from src.maintenance.models import AircraftStatus, MaintenanceStatus, MaintenanceTask, MaintenanceType
+from src.maintenance.repository import MaintenanceRepository, aircraft_status
+from src.maintenance.scheduler import MaintenanceScheduler
+
+CHECK_TYPES = [MaintenanceType.A_CHECK, MaintenanceType.B_CHECK, MaintenanceType.C_CHECK]
+
+
+def build(aircraft: int, tasks: int, seed: int) -> MaintenanceScheduler:
+    """Fleet with ``tasks`` completed tasks per aircraft and a few scheduled ones."""
+    rng = random.Random(seed)
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    now = datetime.utcnow()
+    for index in range(aircraft):
+        aircraft_id = f"AC{index:05d}"
+        scheduler.register_aircraft(AircraftStatus(aircraft_id, f"N{index:05d}", "A320", 10000.0, 4000))
+        for week in range(tasks):
+            scheduler.create_task(MaintenanceTask(
+                aircraft_id=aircraft_id,
+                maintenance_type=rng.choice(CHECK_TYPES),
+                scheduled_date=now - timedelta(weeks=tasks - week),
+                status=MaintenanceStatus.COMPLETED,
+            ))
+        for check_type in CHECK_TYPES:
+            scheduler.create_task(MaintenanceTask(
+                aircraft_id=aircraft_id,
+                maintenance_type=check_type,
+                scheduled_date=now + timedelta(days=rng.uniform(-2, 120)),
+            ))
+    return scheduler
+
+
+async def timed(coro) -> float:
+    """Milliseconds to await coro."""
+    begin = time.perf_counter()
+    await coro
+    return (time.perf_counter() - begin) * 1000
+
+
+async def per_row_updates(repository: MaintenanceRepository, statuses) -> None:
+    """The alternative to the bulk upsert: one UPDATE per aircraft."""
+    async with repository._engine.begin() as conn:
+        for status in statuses:
+            await conn.execute(
+                update(aircraft_status)
+                .where(aircraft_status.c.aircraft_id == status.aircraft_id)
+                .values(total_flight_hours=status.total_flight_hours)
+            )
+
+
+async def run(args, url: str) -> dict:
+    scheduler = build(args.aircraft, args.tasks, args.seed)
+    repository = MaintenanceRepository(DatabaseConfig(), url=url)
+    await repository.start()
+    await repository.create_schema()
+
+    results = {"aircraft": args.aircraft, "tasks": len(scheduler.get_tasks())}
+    results["initial_persist_ms"] = await timed(scheduler.persist(repository))
+
+    rng = random.Random(args.seed)
+    for status in scheduler._aircraft_status.values():
+        scheduler.update_flight_hours(status.aircraft_id, status.total_flight_hours + rng.uniform(1, 12))
+    statuses = list(scheduler._dirty_aircraft.values())
+    results["flight_hours_round_ms"] = {
+        "bulk_upsert": await timed(scheduler.persist(repository)),
+        "per_row_update": await timed(per_row_updates(repository, statuses)),
+    }
+
+    results["load_ms"] = {
+        "open_tasks": await timed(repository.load_tasks()),
+        "one_aircraft_history": await timed(repository.load_tasks(statuses=None, aircraft_id="AC00001")),
+    }
+
+    restored = MaintenanceScheduler(MaintenanceConfig())
+    begin = time.perf_counter()
+    restored.restore(await repository.load_aircraft(), await repository.load_tasks())
+    results["restore_ms"] = (time.perf_counter() - begin) * 1000
+    results["restored_open_tasks"] = len(restored.get_tasks())
+    await repository.close()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=50, help="Completed tasks per aircraft")
+    parser.add_argument("--url", help="Database URL (default: temporary SQLite file)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite+aiosqlite:///{os.path.join(tmp, 'maintenance.db')}"
+        results = asyncio.run(run(args, url))
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Fleet maintenance what-if: vectorized simulation versus a day-by-day loop.
+
+Runs FleetSimulation on a synthetic fleet for the baseline, +20%
+utilization and a hangar-capacity scenario, and times the same baseline
+replayed through the scheduler one day at a time (bulk flight-hour update,
+then completing every task whose due hours are reached) to compare check
+counts. The day-by-day loop covers --loop-years only.
+
+    python -m benchmarks.maintenance_simulation [--aircraft N] [--years Y] [--loop-years Y] [--output results.json]
+"""
+import argparse
+import json
+import logging
+import random
+import time
+
+import numpy as np
+
+from config.settings import MaintenanceConfig
+from src.maintenance.fleet_counters import CHECK_TYPES
+from src.maintenance.models import AircraftStatus, MaintenanceStatus, MaintenanceType
+from src.maintenance.scheduler import FLIGHT_HOURS_PER_DAY, MaintenanceScheduler
+from src.maintenance.simulation import FleetSimulation
+
+
+def build(aircraft: int, seed: int) -> MaintenanceScheduler:
+    rng = random.Random(seed)
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    for index in range(aircraft):
+        scheduler.register_aircraft(AircraftStatus(
+            aircraft_id=f"AC{index:05d}",
+            registration=f"N{index:05d}",
+            model="A320",
+            total_flight_hours=rng.uniform(0, 30000),
+            cycles=0,
+            hours_since_a_check=rng.uniform(0, 450),
+            hours_since_b_check=rng.uniform(0, 1900),
+            hours_since_c_check=rng.uniform(0, 5900),
+            hours_since_d_check=rng.uniform(0, 24900),
+        ))
+    return scheduler
+
+
+def day_by_day(scheduler: MaintenanceScheduler, days: int) -> dict:
+    """Baseline replayed through the scheduler; returns checks completed per type."""
+    completed = {check_type.value: 0 for check_type in CHECK_TYPES}
+    totals = {aircraft_id: status.total_flight_hours for aircraft_id, status in scheduler._aircraft_status.items()}
+    for _ in range(days):
+        for aircraft_id in totals:
+            totals[aircraft_id] += FLIGHT_HOURS_PER_DAY
+        scheduler.bulk_update_flight_hours(totals)
+        for task in scheduler.get_tasks(status=MaintenanceStatus.SCHEDULED):
+            if task.maintenance_type != MaintenanceType.COMPONENT and totals[task.aircraft_id] >= task.due_flight_hours:
+                scheduler.complete_task(task.id)
+                completed[task.maintenance_type.value] += 1
+    return completed
+
+
+def timed_run(simulation: FleetSimulation, **kwargs):
+    begin = time.perf_counter()
+    result = simulation.run(**kwargs)
+    return result, (time.perf_counter() - begin) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--aircraft", type=int, default=500)
+    parser.add_argument("--years", type=float, default=10.0)
+    parser.add_argument("--loop-years", type=float, default=1.0, help="Years replayed day by day")
+    parser.add_argument("--capacity", type=int, default=5, help="Weekly C/D-check slots in the capacity scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    scheduler = build(args.aircraft, args.seed)
+    simulation = FleetSimulation.from_scheduler(scheduler)
+
+    results = {"aircraft": args.aircraft, "years": args.years, "scenarios": {}}
+    scenarios = {
+        "baseline": {},
+        "utilization_+20%": {"utilization": 1.2},
+        "hangar_capacity": {"hangar_capacity": {
+            MaintenanceType.C_CHECK: args.capacity, MaintenanceType.D_CHECK: args.capacity,
+        }},
+    }
+    for name, kwargs in scenarios.items():
+        result, elapsed = timed_run(simulation, years=args.years, **kwargs)
+        summary = result.summary()
+        summary["run_ms"] = elapsed
+        results["scenarios"][name] = summary
+
+    # Same baseline over the loop's horizon, against the day-by-day replay
+    days = int(round(args.loop_years * 52)) * 7
+    short, simulation_ms = timed_run(simulation, years=args.loop_years)
+    begin = time.perf_counter()
+    completed = day_by_day(scheduler, days)
+    loop_ms = (time.perf_counter() - begin) * 1000
+    results["day_by_day"] = {
+        "years": args.loop_years,
+        "checks": {
+            "simulation": dict(zip((t.value for t in CHECK_TYPES), np.sum(short.performed, axis=0).tolist())),
+            "scheduler_loop": completed,
+        },
+        "run_ms": {"simulation": simulation_ms, "scheduler_loop": loop_ms},
+    }
+
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Webhook notification cost: pooled client vs a new session per alert.
+
+Runs a local aiohttp stand-in webhook server and sends the same alerts
+through WebhookNotifier twice: once with the long-lived pooled session
+(started once, as AlertNotifier does at startup) and once opening and
+closing a session per alert (the previous behaviour). Reports TCP
+connections seen by the server and per-notification latency. Plain HTTP
+on loopback, so TLS handshake savings in production are not included.
+
+    python -m benchmarks.notifier_pool [--alerts N] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import numpy as np
+from aiohttp import web
+
+from src.alerts.notifier import WebhookNotifier
+from src.sensors.models import Alert, AlertSeverity, SensorType
+
+
+async def start_server():
+    """Stand-in webhook endpoint; returns (runner, url, set of client ports seen)."""
+    peers = set()
+
+    async def handle(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername")[1])
+        await request.read()
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_post("/hook", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    return runner, f"http://127.0.0.1:{port}/hook", peers
+
+
+def make_alerts(count: int):
+    return [
+        Alert(
+            aircraft_id=f"AC{i % 20:03d}",
+            sensor_type=SensorType.ENGINE_TEMP,
+            severity=AlertSeverity.CRITICAL,
+            title="Critical engine_temperature Alert",
+            message=f"engine_temperature has reached critical level: {96 + i % 5:.2f} celsius",
+            value=96.0 + i % 5,
+            threshold=95.0,
+        )
+        for i in range(count)
+    ]
+
+
+async def run_pooled(url: str, alerts) -> list:
+    channel = WebhookNotifier(url)
+    await channel.start()
+    latencies = []
+    try:
+        for alert in alerts:
+            begin = time.perf_counter()
+            assert await channel.send(alert)
+            latencies.append(time.perf_counter() - begin)
+    finally:
+        await channel.close()
+    return latencies
+
+
+async def run_per_alert(url: str, alerts) -> list:
+    latencies = []
+    for alert in alerts:
+        begin = time.perf_counter()
+        channel = WebhookNotifier(url)
+        assert await channel.send(alert)
+        await channel.close()
+        latencies.append(time.perf_counter() - begin)
+    return latencies
+
+
+def summarize(latencies: list, connections: int) -> dict:
+    values = np.array(latencies) * 1e6
+    return {
+        "connections": connections,
+        "mean_us": float(values.mean()),
+        "p50_us": float(np.percentile(values, 50)),
+        "p99_us": float(np.percentile(values, 99)),
+    }
+
+
+async def run(count: int) -> dict:
+    alerts = make_alerts(count)
+    runner, url, peers = await start_server()
+    try:
+        await run_pooled(url, alerts[:10])  # Warm up imports and the server
+        peers.clear()
+        pooled = summarize(await run_pooled(url, alerts), len(peers))
+        peers.clear()
+        per_alert = summarize(await run_per_alert(url, alerts), len(peers))
+    finally:
+        await runner.cleanup()
+    return {
+        "alerts": count,
+        "pooled": pooled,
+        "per_alert_session": per_alert,
+        "mean_speedup": per_alert["mean_us"] / pooled["mean_us"],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--alerts", type=int, default=2000)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.alerts))
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
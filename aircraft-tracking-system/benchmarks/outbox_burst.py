@@ -0,0 +1,146 @@
+"""
+Alert burst through the durable notification outbox.
+
+Queues a burst of alerts through AlertNotifier with an outbox, to a stand-in
+channel that fails every send during an initial outage and enforces a rate
+limit. Partway through delivery the notifier is closed and a new one is
+started on the same outbox file, as after a process restart. Reports enqueue
+rate, peak concurrent sends, observed send rate, retries and whether every
+alert was delivered (duplicates are possible: delivery is at-least-once).
+
+    python -m benchmarks.outbox_burst [--alerts N] [--outage S] [--rate R] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import Counter
+
+from config.settings import AlertConfig
+from src.alerts.notifier import AlertNotifier, NotificationChannel
+from src.sensors.models import Alert, AlertSeverity
+
+
+class FlakyChannel(NotificationChannel):
+    """Channel that is down until ``outage_until`` and records deliveries."""
+
+    name = "flaky"
+
+    def __init__(self, outage_until: float, rate_limit: float, send_seconds: float = 0.002):
+        self.outage_until = outage_until
+        self.rate_limit = rate_limit
+        self.rate_burst = 10
+        self.send_seconds = send_seconds
+        self.delivered = Counter()
+        self.attempts = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.first_delivery = None
+        self.last_delivery = None
+
+    async def send(self, alert: Alert) -> bool:
+        self.attempts += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.send_seconds)
+            now = time.monotonic()
+            if now < self.outage_until:
+                return False
+            self.delivered[alert.id] += 1
+            self.first_delivery = self.first_delivery or now
+            self.last_delivery = now
+            return True
+        finally:
+            self.in_flight -= 1
+
+
+async def run(alerts: int, outage: float, rate: float, workers: int, restart_after: float, path: str) -> dict:
+    config = AlertConfig(
+        telegram_bot_token=None,
+        twilio_account_sid=None,
+        outbox_path=path,
+        outbox_workers=workers,
+        outbox_max_attempts=30,
+        outbox_backoff_base=0.05,
+        outbox_backoff_max=0.5,
+        digest_window=0,
+    )
+    channel = FlakyChannel(time.monotonic() + outage, rate)
+    burst = [
+        Alert(aircraft_id=f"AC{i % 50:03d}", severity=AlertSeverity.WARNING, title="bench")
+        for i in range(alerts)
+    ]
+
+    notifier = AlertNotifier(config)
+    notifier.add_channel(channel)
+    await notifier.start()
+    begin = time.perf_counter()
+    await asyncio.gather(*(notifier.notify(alert) for alert in burst))
+    enqueue_s = time.perf_counter() - begin
+
+    # Restart partway through delivery
+    await asyncio.sleep(restart_after)
+    await notifier.close()
+    delivered_before_restart = len(channel.delivered)
+
+    notifier = AlertNotifier(config)
+    notifier.add_channel(channel)
+    await notifier.start()
+    while True:
+        stats = await notifier.outbox.get_stats()
+        if not stats["pending"] and not stats["sending"]:
+            break
+        await asyncio.sleep(0.05)
+    total_s = time.perf_counter() - begin
+    await notifier.close()
+
+    delivery_span = (channel.last_delivery or 0) - (channel.first_delivery or 0)
+    return {
+        "alerts": alerts,
+        "enqueue_per_sec": alerts / enqueue_s,
+        "delivered_before_restart": delivered_before_restart,
+        "delivered_unique": len(channel.delivered),
+        "duplicates": sum(channel.delivered.values()) - len(channel.delivered),
+        "lost": alerts - len(set(a.id for a in burst) & set(channel.delivered)),
+        "send_attempts": channel.attempts,
+        "dead_letters": stats["dead"],
+        "max_in_flight": channel.max_in_flight,
+        "rate_limit": rate,
+        "observed_rate": len(channel.delivered) / delivery_span if delivery_span else None,
+        "total_s": total_s,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--alerts", type=int, default=2000)
+    parser.add_argument("--outage", type=float, default=1.0, help="Seconds the channel fails every send")
+    parser.add_argument("--rate", type=float, default=500.0, help="Channel rate limit (sends/second)")
+    parser.add_argument("--workers", type=int, default=2, help="Outbox workers per channel")
+    parser.add_argument("--restart-after", type=float, default=2.0, help="Seconds before the simulated restart")
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as directory:
+        results = asyncio.run(run(
+            args.alerts,
+            args.outage,
+            args.rate,
+            args.workers,
+            args.restart_after,
+            os.path.join(directory, "outbox.db"),
+        ))
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
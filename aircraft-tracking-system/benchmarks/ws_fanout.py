@@ -0,0 +1,132 @@
+"""
+WebSocket fan-out: MonitoringHub versus awaiting each connection in turn.
+
+Stand-in connections take --send-ms per message. Alerts are published at
+--rate per second, once through MonitoringHub (one sender task per
+viewer, plus one viewer whose sends never complete) and once through the
+old broadcast loop that awaits ``send_json`` on every connection in turn
+(without the stuck viewer, which would block it forever). Reports
+publish-to-delivery latency across all healthy viewers.
+
+    python -m benchmarks.ws_fanout [--viewers N] [--alerts A] [--rate R] [--send-ms MS] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+
+import numpy as np
+
+from src.api.hub import MonitoringHub
+
+
+class StandInSocket:
+    """Accepts messages after a fixed delay and records when each arrived."""
+
+    def __init__(self, send_delay: float, stuck: bool = False):
+        self.send_delay = send_delay
+        self.stuck = stuck
+        self.arrivals = {}
+        self.closed = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive(self) -> dict:
+        await self.closed.wait()
+        return {"type": "websocket.disconnect"}
+
+    async def send_text(self, text: str) -> None:
+        if self.stuck:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.send_delay)
+        message = json.loads(text)
+        if message["type"] == "alert":
+            self.arrivals[message["data"]["n"]] = time.perf_counter()
+
+    async def send_json(self, message: dict) -> None:
+        await self.send_text(json.dumps(message))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed.set()
+
+
+def latencies(viewers, published) -> np.ndarray:
+    """Delivery latency (ms) of every alert to every viewer; missing ones are skipped."""
+    return np.array([
+        (viewer.arrivals[n] - sent) * 1000
+        for viewer in viewers for n, sent in published.items() if n in viewer.arrivals
+    ])
+
+
+def summary(values: np.ndarray, expected: int) -> dict:
+    return {
+        "delivered": int(len(values)),
+        "expected": expected,
+        "p50_ms": float(np.percentile(values, 50)),
+        "p99_ms": float(np.percentile(values, 99)),
+        "max_ms": float(values.max()),
+    }
+
+
+async def run_hub(args) -> dict:
+    hub = MonitoringHub(queue_size=256, send_timeout=args.send_timeout)
+    hub.start()
+    viewers = [StandInSocket(args.send_ms / 1000) for _ in range(args.viewers)]
+    stuck = StandInSocket(0, stuck=True)
+    serving = [asyncio.create_task(hub.serve(viewer, "AC00001")) for viewer in viewers + [stuck]]
+    await asyncio.sleep(0.1)
+
+    published = {}
+    for n in range(args.alerts):
+        published[n] = time.perf_counter()
+        hub.publish("AC00001", {"type": "alert", "data": {"n": n}})
+        await asyncio.sleep(1 / args.rate)
+    await asyncio.sleep(args.send_timeout + 0.5)
+
+    stats = hub.get_stats()
+    await hub.stop()
+    await asyncio.gather(*serving)
+    result = summary(latencies(viewers, published), args.viewers * args.alerts)
+    result["evicted"] = stats["evicted"]
+    return result
+
+
+async def run_sequential(args) -> dict:
+    viewers = [StandInSocket(args.send_ms / 1000) for _ in range(args.viewers)]
+    published = {}
+    for n in range(args.alerts):
+        published[n] = time.perf_counter()
+        for viewer in viewers:
+            await viewer.send_json({"type": "alert", "data": {"n": n}})
+        await asyncio.sleep(1 / args.rate)
+    return summary(latencies(viewers, published), args.viewers * args.alerts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--viewers", type=int, default=2000)
+    parser.add_argument("--alerts", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=10.0, help="Alerts per second")
+    parser.add_argument("--send-ms", type=float, default=0.5, help="Time each send takes")
+    parser.add_argument("--send-timeout", type=float, default=1.0)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    results = {
+        "viewers": args.viewers,
+        "alerts": args.alerts,
+        "hub_with_stuck_viewer": asyncio.run(run_hub(args)),
+        "sequential_broadcast": asyncio.run(run_sequential(args)),
+    }
+    print(json.dumps(results, indent=2))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,10 +14,30 @@ class DatabaseConfig:
     name: str = os.getenv("DB_NAME", "aircraft_tracking")
     user: str = os.getenv("DB_USER", "postgres")
     password: str = os.getenv("DB_PASSWORD", "")
+    pool_size: int = int(os.getenv("DB_POOL_SIZE", "4"))
+    
+    # Telemetry batch persistence
+    telemetry_enabled: bool = os.getenv("TELEMETRY_ENABLED", "True").lower() == "true"
+    telemetry_table: str = "sensor_readings"
+    batch_size: int = int(os.getenv("TELEMETRY_BATCH_SIZE", "5000"))
+    flush_interval: float = float(os.getenv("TELEMETRY_FLUSH_INTERVAL", "1.0"))
+    max_pending_batches: int = int(os.getenv("TELEMETRY_MAX_PENDING_BATCHES", "8"))
+    write_retries: int = 3
+    
+    # Maintenance task persistence (schema managed by Alembic, see migrations/);
+    # the URL defaults to the main database, sqlite+aiosqlite works locally
+    maintenance_enabled: bool = os.getenv("MAINTENANCE_DB_ENABLED", "True").lower() == "true"
+    maintenance_url: Optional[str] = os.getenv("MAINTENANCE_DB_URL")
+    maintenance_flush_interval: float = float(os.getenv("MAINTENANCE_FLUSH_INTERVAL", "5.0"))
     
     @property
     def url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
+        
+    @property
+    def dsn(self) -> str:
+        """Plain libpq DSN for asyncpg (no SQLAlchemy driver suffix)."""
+        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.name}"
 
 
 @dataclass
@@ -33,6 +53,21 @@ class MQTTConfig:
     sensor_topic: str = "aircraft/+/sensors/#"
     alert_topic: str = "aircraft/+/alerts"
     maintenance_topic: str = "aircraft/+/maintenance"
+    
+    # Ingest queue between the MQTT network thread and the event loop (sizes in messages)
+    ingest_queue_size: int = int(os.getenv("INGEST_QUEUE_SIZE", "10000"))
+    ingest_batch_size: int = int(os.getenv("INGEST_BATCH_SIZE", "500"))
+    ingest_overflow_policy: str = os.getenv("INGEST_OVERFLOW_POLICY", "drop_oldest")
+    ingest_block_timeout: float = float(os.getenv("INGEST_BLOCK_TIMEOUT", "1.0"))
+    
+    # Readings held for batch storage before the oldest are dropped
+    reading_buffer_size: int = int(os.getenv("READING_BUFFER_SIZE", "100000"))
+    
+    # Sharded ingestion: worker processes keyed by aircraft_id (0 = in-process)
+    ingest_workers: int = int(os.getenv("INGEST_WORKERS", "0"))
+    shard_batch_size: int = int(os.getenv("SHARD_BATCH_SIZE", "256"))
+    shard_flush_interval: float = float(os.getenv("SHARD_FLUSH_INTERVAL", "0.01"))
+    shard_queue_batches: int = 64
 
 
 @dataclass
@@ -55,12 +90,53 @@ class AlertConfig:
     fuel_low: float = 20.0
     fuel_critical: float = 10.0
     
+    # Samples kept per (aircraft, sensor) series for anomaly detection
+    history_capacity: int = int(os.getenv("HISTORY_CAPACITY", "4096"))
+    
+    # Alert deduplication: repeat alerts at the same or lower severity are
+    # suppressed until the cooldown (seconds) for the open severity passes
+    alert_cooldown_info: float = float(os.getenv("ALERT_COOLDOWN_INFO", "3600"))
+    alert_cooldown_warning: float = float(os.getenv("ALERT_COOLDOWN_WARNING", "900"))
+    alert_cooldown_critical: float = float(os.getenv("ALERT_COOLDOWN_CRITICAL", "300"))
+    alert_cooldown_emergency: float = float(os.getenv("ALERT_COOLDOWN_EMERGENCY", "60"))
+    # Fraction of a threshold a value must clear before an alert de-escalates or clears
+    alert_hysteresis: float = float(os.getenv("ALERT_HYSTERESIS", "0.05"))
+    
+    # Resolved alerts stay queryable for this long (seconds) / up to this many,
+    # then move to a bounded in-memory archive
+    alert_resolved_ttl: float = float(os.getenv("ALERT_RESOLVED_TTL", "3600"))
+    alert_resolved_max: int = int(os.getenv("ALERT_RESOLVED_MAX", "10000"))
+    alert_archive_size: int = int(os.getenv("ALERT_ARCHIVE_SIZE", "100000"))
+    
     # Notification settings
     telegram_bot_token: Optional[str] = os.getenv("TELEGRAM_BOT_TOKEN")
     telegram_chat_id: Optional[str] = os.getenv("TELEGRAM_CHAT_ID")
     twilio_account_sid: Optional[str] = os.getenv("TWILIO_ACCOUNT_SID")
     twilio_auth_token: Optional[str] = os.getenv("TWILIO_AUTH_TOKEN")
     alert_phone_number: Optional[str] = os.getenv("ALERT_PHONE_NUMBER")
+    
+    # Per-channel client pool: keep-alive connections and timeouts (seconds)
+    channel_max_connections: int = int(os.getenv("NOTIFY_MAX_CONNECTIONS", "4"))
+    channel_connect_timeout: float = float(os.getenv("NOTIFY_CONNECT_TIMEOUT", "5.0"))
+    channel_timeout: float = float(os.getenv("NOTIFY_TIMEOUT", "10.0"))
+    # Threads per blocking (synchronous SDK) channel, e.g. Twilio SMS
+    blocking_channel_workers: int = int(os.getenv("NOTIFY_BLOCKING_WORKERS", "2"))
+    
+    # Durable outbound queue (SQLite file); empty sends directly, without retries
+    outbox_path: str = os.getenv("NOTIFY_OUTBOX_PATH", "notify_outbox.db")
+    outbox_workers: int = int(os.getenv("NOTIFY_OUTBOX_WORKERS", "2"))  # Per channel
+    outbox_max_attempts: int = int(os.getenv("NOTIFY_MAX_ATTEMPTS", "8"))
+    outbox_backoff_base: float = float(os.getenv("NOTIFY_BACKOFF_BASE", "2.0"))
+    outbox_backoff_max: float = float(os.getenv("NOTIFY_BACKOFF_MAX", "600"))
+    # Provider send quotas (messages/second)
+    telegram_rate_limit: float = float(os.getenv("TELEGRAM_RATE_LIMIT", "1.0"))
+    sms_rate_limit: float = float(os.getenv("SMS_RATE_LIMIT", "1.0"))
+    
+    # Digest mode: alerts below digest_severity are sent as one summary per
+    # window (seconds, 0 = off), grouped per aircraft
+    digest_severity: str = os.getenv("ALERT_DIGEST_SEVERITY", "critical")
+    digest_window: float = float(os.getenv("ALERT_DIGEST_WINDOW", "60"))
+    digest_max_lines: int = int(os.getenv("ALERT_DIGEST_MAX_LINES", "40"))
 
 
 @dataclass
@@ -79,6 +155,13 @@ class MaintenanceConfig:
     oil_filter_hours: int = 500
     fuel_filter_hours: int = 1000
     brake_pad_hours: int = 750
+    
+    # Flight hours and cycles derived from altitude/airspeed/landing gear telemetry
+    flight_tracking_enabled: bool = os.getenv("FLIGHT_TRACKING_ENABLED", "True").lower() == "true"
+    takeoff_airspeed: float = float(os.getenv("TAKEOFF_AIRSPEED", "100.0"))  # knots
+    landing_airspeed: float = float(os.getenv("LANDING_AIRSPEED", "60.0"))  # knots
+    airborne_altitude_gain: float = 500.0  # feet above the last ground altitude
+    flight_hours_flush_interval: float = float(os.getenv("FLIGHT_HOURS_FLUSH_INTERVAL", "60.0"))
 
 
 @dataclass
@@ -91,8 +174,20 @@ class Config:
     
     debug: bool = os.getenv("DEBUG", "False").lower() == "true"
     log_level: str = os.getenv("LOG_LEVEL", "INFO")
+    api_enabled: bool = os.getenv("API_ENABLED", "True").lower() == "true"  # Serve the API in-process
     api_host: str = os.getenv("API_HOST", "0.0.0.0")
     api_port: int = int(os.getenv("API_PORT", "8000"))
+    
+    # WebSocket fan-out: messages queued per client (oldest dropped beyond
+    # this), seconds before a stuck send evicts the client, seconds between
+    # sensor snapshots
+    ws_queue_size: int = int(os.getenv("WS_QUEUE_SIZE", "256"))
+    ws_send_timeout: float = float(os.getenv("WS_SEND_TIMEOUT", "5.0"))
+    ws_snapshot_interval: float = float(os.getenv("WS_SNAPSHOT_INTERVAL", "1.0"))
+    
+    # Event loop lag sampling (seconds)
+    loop_lag_interval: float = float(os.getenv("LOOP_LAG_INTERVAL", "0.1"))
+    loop_lag_warning: float = float(os.getenv("LOOP_LAG_WARNING", "0.25"))
 
 
 def get_config() -> Config:
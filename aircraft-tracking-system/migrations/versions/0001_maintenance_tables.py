@@ -0,0 +1,66 @@
+"""
+Maintenance tasks and aircraft status tables.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "maintenance_tasks",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("aircraft_id", sa.String(32), nullable=False),
+        sa.Column("maintenance_type", sa.String(16), nullable=False),
+        sa.Column("title", sa.String(200), nullable=False),
+        sa.Column("description", sa.Text, nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("scheduled_date", sa.DateTime),
+        sa.Column("due_flight_hours", sa.Float),
+        sa.Column("started_at", sa.DateTime),
+        sa.Column("completed_at", sa.DateTime),
+        sa.Column("technician", sa.String(100)),
+        sa.Column("notes", sa.Text, nullable=False),
+        sa.Column("component_id", sa.String(64)),
+        sa.Column("component_name", sa.String(100)),
+        sa.Column("created_at", sa.DateTime, nullable=False),
+    )
+    op.create_index("ix_maintenance_tasks_status_date", "maintenance_tasks", ["status", "scheduled_date"])
+    op.create_index(
+        "ix_maintenance_tasks_aircraft_status_date",
+        "maintenance_tasks",
+        ["aircraft_id", "status", "scheduled_date"],
+    )
+
+    op.create_table(
+        "aircraft_status",
+        sa.Column("aircraft_id", sa.String(32), primary_key=True),
+        sa.Column("registration", sa.String(16), nullable=False),
+        sa.Column("model", sa.String(64), nullable=False),
+        sa.Column("total_flight_hours", sa.Float, nullable=False),
+        sa.Column("cycles", sa.Integer, nullable=False),
+        sa.Column("last_a_check", sa.DateTime),
+        sa.Column("last_b_check", sa.DateTime),
+        sa.Column("last_c_check", sa.DateTime),
+        sa.Column("last_d_check", sa.DateTime),
+        sa.Column("hours_since_a_check", sa.Float, nullable=False),
+        sa.Column("hours_since_b_check", sa.Float, nullable=False),
+        sa.Column("hours_since_c_check", sa.Float, nullable=False),
+        sa.Column("hours_since_d_check", sa.Float, nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("aircraft_status")
+    op.drop_index("ix_maintenance_tasks_aircraft_status_date", table_name="maintenance_tasks")
+    op.drop_index("ix_maintenance_tasks_status_date", table_name="maintenance_tasks")
+    op.drop_table("maintenance_tasks")
@@ -0,0 +1,34 @@
+"""
+Component usage counters.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "component_usage",
+        sa.Column("component_id", sa.String(64), primary_key=True),
+        sa.Column("aircraft_id", sa.String(32), nullable=False),
+        sa.Column("component_name", sa.String(100), nullable=False),
+        sa.Column("interval_hours", sa.Float, nullable=False),
+        sa.Column("interval_cycles", sa.Integer, nullable=False),
+        sa.Column("hours", sa.Float, nullable=False),
+        sa.Column("cycles", sa.Integer, nullable=False),
+    )
+    op.create_index("ix_component_usage_aircraft_id", "component_usage", ["aircraft_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_component_usage_aircraft_id", table_name="component_usage")
+    op.drop_table("component_usage")
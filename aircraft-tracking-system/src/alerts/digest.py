@@ -0,0 +1,88 @@
+"""
+Alert digests for Aircraft Tracking System.
+Batches low-severity alerts into one summary notification per window.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.monitoring.alert_state import SEVERITY_RANK
+from src.sensors.models import Alert, AlertSeverity
+
+
+@dataclass
+class _DigestLine:
+    """Repeats of one alert (same sensor and title) for an aircraft."""
+    severity: AlertSeverity
+    count: int
+    last_value: Optional[float]
+
+
+class AlertDigest:
+    """
+    Accumulates alerts for one window, grouped per aircraft. Repeats of the
+    same alert on an aircraft are counted rather than stored, so memory
+    grows with distinct alerts, not alert volume.
+    """
+    
+    def __init__(self, max_lines: int = 40):
+        self.max_lines = max_lines
+        self._groups: Dict[str, Dict[Tuple[str, str], _DigestLine]] = {}
+        self._first: Optional[Alert] = None
+        self.count = 0
+        
+    def __len__(self) -> int:
+        return self.count
+        
+    def add(self, alert: Alert) -> None:
+        if self._first is None:
+            self._first = alert
+        self.count += 1
+        
+        sensor = alert.sensor_type.value if alert.sensor_type else ""
+        lines = self._groups.setdefault(alert.aircraft_id, {})
+        line = lines.get((sensor, alert.title))
+        if line is None:
+            lines[(sensor, alert.title)] = _DigestLine(alert.severity, 1, alert.value)
+            return
+        line.count += 1
+        line.last_value = alert.value
+        if SEVERITY_RANK[alert.severity] > SEVERITY_RANK[line.severity]:
+            line.severity = alert.severity
+            
+    def flush(self) -> Optional[Alert]:
+        """
+        Close the window: returns one summary alert (the alert itself if
+        only one arrived), or None if the window is empty.
+        """
+        if not self.count:
+            return None
+        groups, first, count = self._groups, self._first, self.count
+        self._groups, self._first, self.count = {}, None, 0
+        if count == 1:
+            return first
+            
+        severity = max(
+            (line.severity for lines in groups.values() for line in lines.values()),
+            key=SEVERITY_RANK.__getitem__,
+        )
+        aircraft = sorted(groups)
+        label = ", ".join(aircraft[:5]) + (f" +{len(aircraft) - 5}" if len(aircraft) > 5 else "")
+        return Alert(
+            aircraft_id=label,
+            severity=severity,
+            title=f"Alert digest: {count} alerts on {len(aircraft)} aircraft",
+            message="\n".join(self._format(groups, aircraft)),
+        )
+        
+    def _format(self, groups: Dict[str, Dict[Tuple[str, str], _DigestLine]], aircraft: List[str]) -> List[str]:
+        text: List[str] = []
+        for index, aircraft_id in enumerate(aircraft):
+            if len(text) >= self.max_lines:
+                text.append(f"... and {len(aircraft) - index} more aircraft")
+                break
+            text.append(f"{aircraft_id}:")
+            for (sensor, title), line in groups[aircraft_id].items():
+                repeats = f" x{line.count}" if line.count > 1 else ""
+                value = f" (last {line.last_value:.2f})" if line.last_value is not None else ""
+                text.append(f"  [{line.severity.value}] {title}{repeats}{value}")
+        return text
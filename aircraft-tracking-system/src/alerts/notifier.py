@@ -4,10 +4,15 @@ Sends alerts for preventive actions via multiple channels.
 """
 import asyncio
 import logging
-from typing import Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Dict, Optional, List, Set
 from abc import ABC, abstractmethod
 
 from src.sensors.models import Alert, AlertSeverity
+from src.alerts.digest import AlertDigest
+from src.alerts.outbox import NotificationOutbox
+from src.monitoring.alert_state import SEVERITY_RANK
 from config.settings import AlertConfig
 
 
@@ -15,27 +20,115 @@ logger = logging.getLogger(__name__)
 
 
 class NotificationChannel(ABC):
-    """Abstract base for notification channels."""
+    """
+    Abstract base for notification channels.
+    Channels hold long-lived clients: created by ``start`` at startup (or
+    lazily on first send) and released by ``close`` on shutdown.
+    """
+    
+    name = "channel"
+    
+    # Channels built on a synchronous SDK set ``blocking`` and define
+    # ``send_blocking(alert) -> bool``: AlertNotifier then runs it on a
+    # dedicated, bounded thread pool (``max_workers`` threads, default from
+    # config) instead of awaiting ``send`` on the event loop.
+    blocking = False
+    max_workers: Optional[int] = None
+    
+    # Provider quota enforced by the outbox: sends per second (None = unlimited)
+    rate_limit: Optional[float] = None
+    rate_burst: int = 1
     
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _check_blocking(cls, cls.blocking)
+        
+    @property
+    def key(self) -> str:
+        """
+        Identifies the channel's destination (its outbox lane and queued
+        entries), so it must stay the same across restarts.
+        """
+        return self.name
+        
+    async def start(self) -> None:
+        """Create the channel's pooled client."""
+        pass
+        
+    async def close(self) -> None:
+        """Close the channel's client and its connections."""
+        pass
+        
     @abstractmethod
     async def send(self, alert: Alert) -> bool:
         """Send notification. Returns True if successful."""
         pass
 
 
+def _check_blocking(channel_type: type, blocking: bool) -> None:
+    """Reject a blocking channel that does not define ``send_blocking``."""
+    if blocking and not callable(getattr(channel_type, "send_blocking", None)):
+        raise TypeError(f"{channel_type.__name__} sets blocking but does not define send_blocking")
+
+
 class TelegramNotifier(NotificationChannel):
-    """Telegram notification channel."""
+    """Telegram notification channel (one Bot with a keep-alive connection pool)."""
     
-    def __init__(self, bot_token: str, chat_id: str):
+    name = "telegram"
+    
+    def __init__(
+        self,
+        bot_token: str,
+        chat_id: str,
+        max_connections: int = 4,
+        connect_timeout: float = 5.0,
+        timeout: float = 10.0,
+        rate_limit: Optional[float] = None,
+    ):
         self.bot_token = bot_token
         self.chat_id = chat_id
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self._bot = None
+        self._start_lock = asyncio.Lock()
+        
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.chat_id}"
         
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._bot is None:
+                self._bot = await self._create_bot()
+                
+    async def _create_bot(self):
+        from telegram import Bot
+        from telegram.request import HTTPXRequest
+        
+        bot = Bot(
+            token=self.bot_token,
+            request=HTTPXRequest(
+                connection_pool_size=self.max_connections,
+                connect_timeout=self.connect_timeout,
+                read_timeout=self.timeout,
+                write_timeout=self.timeout,
+                pool_timeout=self.timeout,
+            ),
+        )
+        await bot.initialize()
+        return bot
+        
+    async def close(self) -> None:
+        if self._bot is not None:
+            bot, self._bot = self._bot, None
+            await bot.shutdown()
+            
     async def send(self, alert: Alert) -> bool:
         """Send alert via Telegram."""
         try:
-            from telegram import Bot
-            
-            bot = Bot(token=self.bot_token)
+            await self.start()
             
             # Format message
             severity_emoji = {
@@ -53,7 +146,7 @@ class TelegramNotifier(NotificationChannel):
                 f"\n_Time: {alert.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}_"
             )
             
-            await bot.send_message(
+            await self._bot.send_message(
                 chat_id=self.chat_id,
                 text=message,
                 parse_mode="Markdown"
@@ -68,20 +161,74 @@ class TelegramNotifier(NotificationChannel):
 
 
 class SMSNotifier(NotificationChannel):
-    """SMS notification channel using Twilio."""
+    """
+    SMS notification channel using Twilio (one Client over a pooled HTTP session).
+    The Twilio SDK is synchronous, so the channel is flagged ``blocking``.
+    """
     
-    def __init__(self, account_sid: str, auth_token: str, from_number: str, to_number: str):
+    name = "sms"
+    blocking = True
+    
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        from_number: str,
+        to_number: str,
+        max_connections: int = 4,
+        timeout: float = 10.0,
+        rate_limit: Optional[float] = None,
+    ):
         self.account_sid = account_sid
         self.auth_token = auth_token
         self.from_number = from_number
         self.to_number = to_number
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.rate_limit = rate_limit
+        self._client = None
+        self._http_client = None
+        self._client_lock = threading.Lock()
+        
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.to_number}"
+        
+    async def start(self) -> None:
+        self._ensure_client()
+        
+    def _ensure_client(self) -> None:
+        with self._client_lock:
+            if self._client is None:
+                self._create_client()
+                
+    def _create_client(self) -> None:
+        from requests.adapters import HTTPAdapter
+        from twilio.http.http_client import TwilioHttpClient
+        from twilio.rest import Client
+        
+        http_client = TwilioHttpClient(pool_connections=True, timeout=self.timeout)
+        http_client.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections, pool_block=True),
+        )
+        self._http_client = http_client
+        self._client = Client(self.account_sid, self.auth_token, http_client=http_client)
+        
+    async def close(self) -> None:
+        if self._http_client is not None:
+            self._http_client.session.close()
+        self._client = None
+        self._http_client = None
         
     async def send(self, alert: Alert) -> bool:
-        """Send alert via SMS."""
+        """Send alert via SMS without blocking the event loop."""
+        return await asyncio.to_thread(self.send_blocking, alert)
+        
+    def send_blocking(self, alert: Alert) -> bool:
+        """Send alert via SMS (blocks for the HTTP round trip)."""
         try:
-            from twilio.rest import Client
-            
-            client = Client(self.account_sid, self.auth_token)
+            self._ensure_client()
             
             message = (
                 f"[{alert.severity.value.upper()}] {alert.title}\n"
@@ -89,7 +236,7 @@ class SMSNotifier(NotificationChannel):
                 f"{alert.message[:100]}..."  # Truncate for SMS
             )
             
-            client.messages.create(
+            self._client.messages.create(
                 body=message,
                 from_=self.from_number,
                 to=self.to_number
@@ -104,29 +251,58 @@ class SMSNotifier(NotificationChannel):
 
 
 class WebhookNotifier(NotificationChannel):
-    """Webhook notification channel."""
+    """Webhook notification channel (one aiohttp session with keep-alive connections)."""
     
-    def __init__(self, webhook_url: str):
+    name = "webhook"
+    
+    def __init__(
+        self,
+        webhook_url: str,
+        max_connections: int = 4,
+        connect_timeout: float = 5.0,
+        timeout: float = 10.0,
+    ):
         self.webhook_url = webhook_url
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.timeout = timeout
+        self._session = None
+        
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{self.webhook_url}"
         
+    async def start(self) -> None:
+        if self._session is not None:
+            return
+        import aiohttp
+        
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.max_connections),
+            timeout=aiohttp.ClientTimeout(total=self.timeout, connect=self.connect_timeout),
+            headers={"Content-Type": "application/json"},
+        )
+        
+    async def close(self) -> None:
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+            
     async def send(self, alert: Alert) -> bool:
         """Send alert via webhook."""
         try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.webhook_url,
-                    json=alert.to_dict(),
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        logger.info(f"Sent webhook notification for alert {alert.id}")
-                        return True
-                    else:
-                        logger.error(f"Webhook returned status {response.status}")
-                        return False
-                        
+            await self.start()
+            
+            async with self._session.post(self.webhook_url, json=alert.to_dict()) as response:
+                # Read the body so the connection goes back to the pool
+                await response.read()
+                if response.status == 200:
+                    logger.info(f"Sent webhook notification for alert {alert.id}")
+                    return True
+                else:
+                    logger.error(f"Webhook returned status {response.status}")
+                    return False
+                    
         except Exception as e:
             logger.error(f"Failed to send webhook notification: {e}")
             return False
@@ -136,11 +312,38 @@ class AlertNotifier:
     """
     Alert notification service.
     Routes alerts to appropriate channels based on severity.
+    
+    With an outbox configured, ``notify`` only queues the alert durably;
+    per-channel outbox workers deliver it with retries and rate limits.
+    Without one, alerts are sent directly, once.
+    
+    In digest mode (``digest_window`` > 0), alerts below ``digest_severity``
+    are held and sent as one summary per window; more severe alerts are
+    always sent immediately.
     """
     
     def __init__(self, config: AlertConfig):
         self.config = config
         self.channels: List[NotificationChannel] = []
+        self._executors: Dict[NotificationChannel, ThreadPoolExecutor] = {}
+        # Outbox lane (and queued entries' channel column) per channel
+        self._lane_keys: Dict[NotificationChannel, str] = {}
+        self._started = False
+        self.outbox: Optional[NotificationOutbox] = None
+        if config.outbox_path:
+            self.outbox = NotificationOutbox(
+                config.outbox_path,
+                max_attempts=config.outbox_max_attempts,
+                backoff_base=config.outbox_backoff_base,
+                backoff_max=config.outbox_backoff_max,
+            )
+        self.digest: Optional[AlertDigest] = None
+        self._digest_below = AlertSeverity(config.digest_severity)
+        self._digest_timer: Optional[asyncio.TimerHandle] = None
+        self._digest_tasks: Set[asyncio.Task] = set()
+        self.digested = 0
+        if config.digest_window > 0:
+            self.digest = AlertDigest(config.digest_max_lines)
         self._setup_channels()
         
     def _setup_channels(self) -> None:
@@ -150,7 +353,11 @@ class AlertNotifier:
             self.channels.append(
                 TelegramNotifier(
                     self.config.telegram_bot_token,
-                    self.config.telegram_chat_id
+                    self.config.telegram_chat_id,
+                    max_connections=self.config.channel_max_connections,
+                    connect_timeout=self.config.channel_connect_timeout,
+                    timeout=self.config.channel_timeout,
+                    rate_limit=self.config.telegram_rate_limit,
                 )
             )
             
@@ -162,26 +369,148 @@ class AlertNotifier:
                 self.config.twilio_account_sid,
                 self.config.twilio_auth_token,
                 "+1234567890",  # From number
-                self.config.alert_phone_number
+                self.config.alert_phone_number,
+                max_connections=self.config.channel_max_connections,
+                timeout=self.config.channel_timeout,
+                rate_limit=self.config.sms_rate_limit,
             )
         else:
             self.sms_notifier = None
             
+    def _all_channels(self) -> List[NotificationChannel]:
+        channels = list(self.channels)
+        if self.sms_notifier:
+            channels.append(self.sms_notifier)
+        return channels
+        
+    async def start(self) -> None:
+        """
+        Create every channel's long-lived client (failures are retried on
+        first send) and start its outbox workers.
+        """
+        for channel in self._all_channels():
+            try:
+                await channel.start()
+            except Exception as e:
+                logger.error(f"Failed to start {channel.name} channel: {e}")
+                
+        if self.outbox:
+            await self.outbox.open()
+            for channel in self._all_channels():
+                self._add_lane(channel)
+        self._started = True
+        
+    def _lane_key(self, channel: NotificationChannel) -> str:
+        """Channel's unique outbox key: its ``key``, numbered if another channel has it."""
+        key = self._lane_keys.get(channel)
+        if key is None:
+            taken = set(self._lane_keys.values())
+            key = channel.key
+            number = 2
+            while key in taken:
+                key = f"{channel.key}#{number}"
+                number += 1
+            self._lane_keys[channel] = key
+        return key
+        
+    def _add_lane(self, channel: NotificationChannel) -> None:
+        self.outbox.add_lane(
+            self._lane_key(channel),
+            lambda alert: self._dispatch(channel, alert),
+            workers=self.config.outbox_workers,
+            rate_limit=channel.rate_limit,
+            rate_burst=channel.rate_burst,
+        )
+        
+    async def close(self) -> None:
+        """
+        Send any open digest, stop outbox workers, finish in-flight blocking
+        sends, then close every channel's client.
+        """
+        await self.flush_digest()
+        if self._digest_tasks:
+            await asyncio.gather(*self._digest_tasks, return_exceptions=True)
+        if self.digested:
+            logger.info(f"Alert digests: {self.digested} alerts batched")
+            
+        if self.outbox:
+            await self.outbox.close()
+            logger.info(f"Notification outbox: {self.outbox.sent} sent, "
+                        f"{self.outbox.retried} retried, {self.outbox.dead_lettered} dead-lettered")
+        self._started = False
+        
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            await asyncio.to_thread(executor.shutdown)
+            
+        for channel in self._all_channels():
+            try:
+                await channel.close()
+            except Exception as e:
+                logger.error(f"Failed to close {channel.name} channel: {e}")
+                
+    def _dispatch(self, channel: NotificationChannel, alert: Alert) -> Awaitable[bool]:
+        """Send through a channel; blocking channels run on their own thread pool."""
+        if not channel.blocking:
+            return channel.send(alert)
+            
+        executor = self._executors.get(channel)
+        if executor is None:
+            executor = self._executors[channel] = ThreadPoolExecutor(
+                max_workers=channel.max_workers or self.config.blocking_channel_workers,
+                thread_name_prefix=f"notify-{channel.name}",
+            )
+        return asyncio.get_running_loop().run_in_executor(executor, channel.send_blocking, alert)
+        
     async def notify(self, alert: Alert) -> None:
         """
-        Send alert notifications.
-        Routes to appropriate channels based on severity.
+        Send alert notifications, or add low-severity alerts to the digest.
         """
-        tasks = []
+        if self.digest is not None and SEVERITY_RANK[alert.severity] < SEVERITY_RANK[self._digest_below]:
+            self.digest.add(alert)
+            self.digested += 1
+            if self._digest_timer is None:
+                self._digest_timer = asyncio.get_running_loop().call_later(
+                    self.config.digest_window, self._digest_due
+                )
+            return
+            
+        await self._deliver(alert)
         
-        # All alerts go to regular channels
-        for channel in self.channels:
-            tasks.append(channel.send(alert))
+    def _digest_due(self) -> None:
+        self._digest_timer = None
+        task = asyncio.create_task(self.flush_digest())
+        self._digest_tasks.add(task)
+        task.add_done_callback(self._digest_tasks.discard)
+        
+    async def flush_digest(self) -> None:
+        """Send the current digest window now (no-op if it is empty)."""
+        if self._digest_timer is not None:
+            self._digest_timer.cancel()
+            self._digest_timer = None
+        summary = self.digest.flush() if self.digest is not None else None
+        if summary is not None:
+            await self._deliver(summary)
             
+    async def _deliver(self, alert: Alert) -> None:
+        """
+        Send (or queue) an alert on every channel it routes to.
+        Routes to appropriate channels based on severity.
+        """
+        # All alerts go to regular channels
+        channels = list(self.channels)
+        
         # Critical and emergency alerts also go via SMS
         if self.sms_notifier and alert.severity in [AlertSeverity.CRITICAL, AlertSeverity.EMERGENCY]:
-            tasks.append(self.sms_notifier.send(alert))
+            channels.append(self.sms_notifier)
             
+        # Queue durably; outbox workers send and retry
+        if self.outbox:
+            await self.outbox.enqueue([self._lane_key(channel) for channel in channels], alert)
+            return
+            
+        tasks = [self._dispatch(channel, alert) for channel in channels]
+        
         # Send all notifications concurrently
         if tasks:
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -193,4 +522,7 @@ class AlertNotifier:
             
     def add_channel(self, channel: NotificationChannel) -> None:
         """Add notification channel."""
+        _check_blocking(type(channel), channel.blocking)
         self.channels.append(channel)
+        if self.outbox and self._started:
+            self._add_lane(channel)
@@ -0,0 +1,353 @@
+"""
+Durable notification outbox for Aircraft Tracking System.
+Queues outbound notifications in SQLite and delivers them with retries.
+"""
+import asyncio
+import json
+import logging
+import random
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from src.monitoring.alert_state import SEVERITY_RANK
+from src.sensors.models import Alert
+
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    channel TEXT NOT NULL,
+    alert_id TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (channel, state, next_attempt);
+CREATE TABLE IF NOT EXISTS dead_letters (
+    id INTEGER PRIMARY KEY,
+    channel TEXT NOT NULL,
+    alert_id TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    failed_at REAL NOT NULL,
+    last_error TEXT
+);
+"""
+
+# (row id, alert payload, attempts so far)
+OutboxEntry = Tuple[int, str, int]
+
+
+class OutboxStore:
+    """
+    SQLite storage for the outbox. Not thread-safe: every call must come
+    from the single thread NotificationOutbox runs it on.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        
+    def recover(self) -> int:
+        """Return entries left mid-send by a previous run to the queue."""
+        cursor = self._conn.execute("UPDATE outbox SET state = 'pending' WHERE state = 'sending'")
+        return cursor.rowcount
+        
+    def add(self, channels: Sequence[str], alert_id: str, priority: int, payload: str, now: float) -> None:
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO outbox (channel, alert_id, priority, payload, next_attempt, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(channel, alert_id, priority, payload, now, now) for channel in channels],
+            )
+            
+    def claim(self, channel: str, now: float) -> Optional[OutboxEntry]:
+        """Mark the most urgent due entry for channel as sending and return it."""
+        row = self._conn.execute(
+            "SELECT id, payload, attempts FROM outbox "
+            "WHERE channel = ? AND state = 'pending' AND next_attempt <= ? "
+            "ORDER BY priority DESC, id LIMIT 1",
+            (channel, now),
+        ).fetchone()
+        if row is not None:
+            self._conn.execute("UPDATE outbox SET state = 'sending' WHERE id = ?", (row[0],))
+        return row
+        
+    def next_due(self, channel: str) -> Optional[float]:
+        """Earliest retry time among the channel's pending entries."""
+        row = self._conn.execute(
+            "SELECT MIN(next_attempt) FROM outbox WHERE channel = ? AND state = 'pending'",
+            (channel,),
+        ).fetchone()
+        return row[0]
+        
+    def complete(self, entry_id: int) -> None:
+        self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+        
+    def retry(self, entry_id: int, attempts: int, next_attempt: float, error: str) -> None:
+        self._conn.execute(
+            "UPDATE outbox SET state = 'pending', attempts = ?, next_attempt = ?, last_error = ? "
+            "WHERE id = ?",
+            (attempts, next_attempt, error, entry_id),
+        )
+        
+    def dead_letter(self, entry_id: int, attempts: int, error: str, now: float) -> None:
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO dead_letters "
+                "(id, channel, alert_id, priority, payload, attempts, created_at, failed_at, last_error) "
+                "SELECT id, channel, alert_id, priority, payload, ?, created_at, ?, ? "
+                "FROM outbox WHERE id = ?",
+                (attempts, now, error, entry_id),
+            )
+            self._conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+            
+    def requeue_dead_letters(self, channel: Optional[str], now: float) -> int:
+        """Move dead letters (optionally one channel's) back into the queue."""
+        where, params = ("WHERE channel = ?", (channel,)) if channel else ("", ())
+        with self._conn:
+            cursor = self._conn.execute(
+                "INSERT INTO outbox (channel, alert_id, priority, payload, next_attempt, created_at) "
+                f"SELECT channel, alert_id, priority, payload, ?, created_at FROM dead_letters {where}",
+                (now, *params),
+            )
+            self._conn.execute(f"DELETE FROM dead_letters {where}", params)
+        return cursor.rowcount
+        
+    def counts(self) -> Dict[str, int]:
+        counts = {"pending": 0, "sending": 0}
+        for state, count in self._conn.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state"):
+            counts[state] = count
+        counts["dead"] = self._conn.execute("SELECT COUNT(*) FROM dead_letters").fetchone()[0]
+        return counts
+        
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RateLimiter:
+    """Token bucket: at most ``rate`` acquisitions per second, bursts of ``burst``."""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+@dataclass
+class _Lane:
+    """Delivery state for one channel."""
+    name: str
+    send: Callable[[Alert], Awaitable[bool]]
+    limiter: Optional[RateLimiter]
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    tasks: List[asyncio.Task] = field(default_factory=list)
+
+
+class NotificationOutbox:
+    """
+    Disk-backed outbound notification queue.
+
+    ``enqueue`` commits one entry per target channel to SQLite before
+    returning, so queued notifications survive a crash or restart. Each
+    channel has a lane of ``workers`` tasks that claim due entries (most
+    severe first), wait for the channel's rate limiter and send. A failed
+    send is retried with exponential backoff and jitter; after
+    ``max_attempts`` the entry moves to the dead-letter table. Only entries
+    being sent are held in memory, however large the backlog.
+
+    Delivery is at-least-once: an entry interrupted mid-send is sent again
+    after a restart. SQLite runs on one dedicated thread, off the event loop.
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_attempts: int = 8,
+        backoff_base: float = 2.0,
+        backoff_max: float = 600.0,
+        drain_timeout: float = 5.0,
+    ):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.drain_timeout = drain_timeout
+        self._store: Optional[OutboxStore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._open_lock = asyncio.Lock()
+        self._lanes: Dict[str, _Lane] = {}
+        self._closing = False
+        
+        # Counters
+        self.sent = 0
+        self.retried = 0
+        self.dead_lettered = 0
+        
+    async def _db(self, method, *args):
+        """Run a store call on the outbox's database thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, method, *args)
+        
+    async def open(self) -> None:
+        """Open (or create) the queue database; idempotent."""
+        async with self._open_lock:
+            if self._store is not None:
+                return
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="notify-outbox")
+            self._store = await asyncio.get_running_loop().run_in_executor(
+                self._executor, OutboxStore, self.path
+            )
+            recovered = await self._db(self._store.recover)
+            counts = await self._db(self._store.counts)
+            logger.info(
+                f"Notification outbox {self.path}: {counts['pending']} pending "
+                f"({recovered} interrupted), {counts['dead']} dead letters"
+            )
+            
+    def add_lane(
+        self,
+        name: str,
+        send: Callable[[Alert], Awaitable[bool]],
+        workers: int = 1,
+        rate_limit: Optional[float] = None,
+        rate_burst: int = 1,
+    ) -> None:
+        """Start ``workers`` delivery tasks for the channel called name."""
+        if name in self._lanes:
+            raise ValueError(f"Outbox lane {name!r} already exists")
+        limiter = RateLimiter(rate_limit, rate_burst) if rate_limit else None
+        lane = self._lanes[name] = _Lane(name, send, limiter)
+        loop = asyncio.get_running_loop()
+        lane.tasks = [loop.create_task(self._worker(lane)) for _ in range(max(1, workers))]
+        
+    async def enqueue(self, channels: Sequence[str], alert: Alert) -> None:
+        """Durably queue alert for each channel."""
+        if not channels:
+            return
+        await self.open()
+        payload = json.dumps(alert.to_dict())
+        await self._db(
+            self._store.add, channels, alert.id, SEVERITY_RANK[alert.severity], payload, time.time()
+        )
+        for name in channels:
+            lane = self._lanes.get(name)
+            if lane is not None:
+                lane.wake.set()
+                
+    async def _worker(self, lane: _Lane) -> None:
+        await self.open()
+        store = self._store
+        while not self._closing:
+            lane.wake.clear()
+            entry = await self._db(store.claim, lane.name, time.time())
+            if entry is None:
+                next_due = await self._db(store.next_due, lane.name)
+                timeout = None if next_due is None else max(0.0, next_due - time.time())
+                try:
+                    await asyncio.wait_for(lane.wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+                
+            # More may be due: let idle workers in this lane look too
+            lane.wake.set()
+            entry_id, payload, attempts = entry
+            alert = Alert.from_dict(json.loads(payload))
+            if lane.limiter is not None:
+                await lane.limiter.acquire()
+                
+            try:
+                ok, error = await lane.send(alert), "send returned False"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                ok, error = False, repr(e)
+                
+            if ok:
+                self.sent += 1
+                await self._db(store.complete, entry_id)
+            else:
+                await self._failed(lane, entry_id, alert, attempts + 1, error)
+                
+    async def _failed(self, lane: _Lane, entry_id: int, alert: Alert, attempts: int, error: str) -> None:
+        now = time.time()
+        if attempts >= self.max_attempts:
+            self.dead_lettered += 1
+            logger.error(
+                f"Giving up on {lane.name} notification for alert {alert.id} "
+                f"after {attempts} attempts: {error}"
+            )
+            await self._db(self._store.dead_letter, entry_id, attempts, error, now)
+            return
+            
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempts - 1))
+        delay *= random.uniform(0.5, 1.0)  # Jitter so retries don't arrive in lockstep
+        self.retried += 1
+        logger.warning(
+            f"{lane.name} notification for alert {alert.id} failed "
+            f"(attempt {attempts}/{self.max_attempts}), retrying in {delay:.1f}s"
+        )
+        await self._db(self._store.retry, entry_id, attempts, now + delay, error)
+        
+    async def requeue_dead_letters(self, channel: Optional[str] = None) -> int:
+        """Give dead-lettered notifications (optionally one channel's) a fresh set of attempts."""
+        await self.open()
+        count = await self._db(self._store.requeue_dead_letters, channel, time.time())
+        for lane in self._lanes.values():
+            lane.wake.set()
+        return count
+        
+    async def get_stats(self) -> Dict[str, int]:
+        """Queue depth by state plus delivery counters."""
+        stats = {"sent": self.sent, "retried": self.retried, "dead_lettered": self.dead_lettered}
+        if self._store is not None:
+            stats.update(await self._db(self._store.counts))
+        return stats
+        
+    async def close(self) -> None:
+        """Let in-flight sends finish (up to ``drain_timeout``), then stop."""
+        self._closing = True
+        tasks = [task for lane in self._lanes.values() for task in lane.tasks]
+        for lane in self._lanes.values():
+            lane.wake.set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=self.drain_timeout)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._lanes.clear()
+        
+        if self._store is not None:
+            store, self._store = self._store, None
+            await asyncio.get_running_loop().run_in_executor(self._executor, store.close)
+            self._executor.shutdown()
+            self._executor = None
+        self._closing = False
@@ -0,0 +1,269 @@
+"""
+Monitoring hub for Aircraft Tracking System API.
+Push-based WebSocket fan-out of alerts and sensor snapshots.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set
+
+import numpy as np
+from fastapi import WebSocket, WebSocketDisconnect
+
+from src.monitoring.engine import MonitoringEngine
+from src.sensors.models import Alert, ReadingBatch, SENSOR_TYPE_TABLE
+
+
+logger = logging.getLogger(__name__)
+
+# Close code for clients evicted for not keeping up (RFC 6455 "try again later")
+CLOSE_TRY_AGAIN_LATER = 1013
+
+
+class _Subscriber:
+    """One WebSocket connection and its bounded outgoing queue."""
+    
+    __slots__ = ("websocket", "aircraft_id", "queue", "ready", "dropped", "sent", "task", "sending_since", "timed_out")
+    
+    def __init__(self, websocket: WebSocket, aircraft_id: Optional[str], queue_size: int):
+        self.websocket = websocket
+        self.aircraft_id = aircraft_id  # None = whole fleet
+        self.queue: Deque[str] = deque(maxlen=queue_size)
+        self.ready = asyncio.Event()
+        self.dropped = 0  # Messages dropped since the client was last told
+        self.sent = 0
+        self.task: Optional[asyncio.Task] = None  # Sender
+        self.sending_since: Optional[float] = None  # Loop time the current send began
+        self.timed_out = False
+
+
+class MonitoringHub:
+    """
+    Publish/subscribe fan-out from the monitoring engine to WebSocket clients.
+
+    Clients subscribe to one aircraft or to the whole fleet. Publishing
+    encodes a message once and appends it to each matching subscriber's
+    bounded queue without awaiting anything; a full queue drops its oldest
+    message, and the client is told how many it missed. Every connection
+    has its own sender task, so sends run concurrently, and a send that
+    fails evicts that client only. Rather than wrapping each send in a
+    timeout, a watchdog cancels senders stuck in one send for longer than
+    ``send_timeout``, which evicts them too.
+
+    Sensor readings are coalesced: the latest value per aircraft and sensor
+    is kept and sent as one snapshot per aircraft every
+    ``snapshot_interval`` seconds, and only for aircraft someone watches.
+    """
+    
+    def __init__(
+        self,
+        queue_size: int = 256,
+        send_timeout: float = 5.0,
+        snapshot_interval: float = 1.0,
+    ):
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.snapshot_interval = snapshot_interval
+        self._by_aircraft: Dict[str, Set[_Subscriber]] = {}
+        self._fleet: Set[_Subscriber] = set()
+        # Latest value per aircraft and sensor since the last snapshot
+        self._latest: Dict[str, Dict[str, float]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+        
+        # Counters
+        self.published = 0
+        self.dropped = 0
+        self.evicted = 0
+        
+    def attach(self, engine: MonitoringEngine) -> None:
+        """Publish the engine's new and cleared alerts."""
+        engine.register_alert_callback(self.on_alert)
+        engine.register_resolution_callback(self.on_resolution)
+        
+    def on_alert(self, alert: Alert) -> None:
+        self.publish(alert.aircraft_id, {"type": "alert", "data": alert.to_dict()})
+        
+    def on_resolution(self, alert: Alert) -> None:
+        self.publish(alert.aircraft_id, {"type": "alert_resolved", "data": alert.to_dict()})
+        
+    def on_batch(self, batch: ReadingBatch) -> None:
+        """Record the latest readings of watched aircraft for the next snapshot."""
+        if not self._fleet and not self._by_aircraft:
+            return
+        aircraft_ids = batch.aircraft_ids
+        watched = [
+            index for index, aircraft_id in enumerate(aircraft_ids)
+            if self._fleet or aircraft_id in self._by_aircraft
+        ]
+        if not watched:
+            return
+        if len(watched) < len(aircraft_ids):
+            batch = batch.take(np.isin(batch.aircraft_index, watched))
+        latest = self._latest
+        for index, code, value in zip(batch.aircraft_index.tolist(), batch.sensor_code.tolist(), batch.value.tolist()):
+            latest.setdefault(aircraft_ids[index], {})[SENSOR_TYPE_TABLE[code].value] = value
+            
+    def publish(self, aircraft_id: str, message: Dict[str, Any]) -> int:
+        """Queue a message for the aircraft's and the fleet's subscribers; returns how many."""
+        subscribers = self._by_aircraft.get(aircraft_id, ())
+        if not subscribers and not self._fleet:
+            return 0
+        text = json.dumps(message)
+        count = 0
+        for group in (subscribers, self._fleet):
+            for subscriber in group:
+                if len(subscriber.queue) == subscriber.queue.maxlen:
+                    subscriber.dropped += 1
+                    self.dropped += 1
+                subscriber.queue.append(text)
+                subscriber.ready.set()
+                count += 1
+        self.published += 1
+        return count
+        
+    # Connections
+    
+    async def serve(self, websocket: WebSocket, aircraft_id: Optional[str] = None) -> None:
+        """Accept a client and stream its subscription until it disconnects or is evicted."""
+        await websocket.accept()
+        subscriber = _Subscriber(websocket, aircraft_id, self.queue_size)
+        self._subscribe(subscriber)
+        sender = subscriber.task = asyncio.create_task(self._send(subscriber))
+        receiver = asyncio.create_task(self._receive(websocket))
+        try:
+            await asyncio.wait((sender, receiver), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            self._unsubscribe(subscriber)
+            for task in (sender, receiver):
+                task.cancel()
+            await asyncio.gather(sender, receiver, return_exceptions=True)
+            
+        failed = sender.done() and not sender.cancelled() and sender.exception() is not None
+        if subscriber.timed_out or failed:
+            self.evicted += 1
+            reason = f"send exceeded {self.send_timeout}s" if subscriber.timed_out else repr(sender.exception())
+            logger.info(f"Evicted WebSocket client ({aircraft_id or 'fleet'}): {reason}")
+            await self._close(websocket, CLOSE_TRY_AGAIN_LATER)
+            
+    def _subscribe(self, subscriber: _Subscriber) -> None:
+        if subscriber.aircraft_id is None:
+            self._fleet.add(subscriber)
+        else:
+            self._by_aircraft.setdefault(subscriber.aircraft_id, set()).add(subscriber)
+            
+    def _unsubscribe(self, subscriber: _Subscriber) -> None:
+        if subscriber.aircraft_id is None:
+            self._fleet.discard(subscriber)
+            return
+        subscribers = self._by_aircraft.get(subscriber.aircraft_id)
+        if subscribers is not None:
+            subscribers.discard(subscriber)
+            if not subscribers:
+                del self._by_aircraft[subscriber.aircraft_id]
+                if not self._fleet:
+                    self._latest.pop(subscriber.aircraft_id, None)
+                    
+    async def _send(self, subscriber: _Subscriber) -> None:
+        """Drain the subscriber's queue until the hub closes; raises on a failed send."""
+        websocket = subscriber.websocket
+        loop = asyncio.get_running_loop()
+        while not self._closing:
+            if not subscriber.queue:
+                subscriber.ready.clear()
+                await subscriber.ready.wait()
+                continue
+            if subscriber.dropped:
+                text = json.dumps({"type": "dropped", "count": subscriber.dropped})
+                subscriber.dropped = 0
+            else:
+                text = subscriber.queue.popleft()
+                subscriber.sent += 1
+            subscriber.sending_since = loop.time()
+            await websocket.send_text(text)
+            subscriber.sending_since = None
+            
+    @staticmethod
+    async def _receive(websocket: WebSocket) -> None:
+        """Read (and ignore) client messages until it disconnects."""
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+            
+    async def _close(self, websocket: WebSocket, code: int) -> None:
+        try:
+            await asyncio.wait_for(websocket.close(code=code), self.send_timeout)
+        except Exception:
+            pass
+            
+    def _subscribers(self) -> List[_Subscriber]:
+        return [s for group in self._by_aircraft.values() for s in group] + list(self._fleet)
+        
+    # Background tasks
+    
+    def start(self) -> None:
+        """Start sensor snapshots and the send watchdog on the running loop."""
+        if not self._tasks:
+            self._closing = False
+            loop = asyncio.get_running_loop()
+            self._tasks = [loop.create_task(self._run_snapshots()), loop.create_task(self._run_watchdog())]
+            
+    async def stop(self) -> None:
+        """Stop the background tasks and close every connection."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        
+        # Senders return once woken; connections end as their ``serve`` returns
+        self._closing = True
+        subscribers = self._subscribers()
+        for subscriber in subscribers:
+            subscriber.ready.set()
+        await asyncio.gather(*(self._close(s.websocket, 1001) for s in subscribers))
+        
+    async def _run_snapshots(self) -> None:
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            try:
+                self.publish_snapshots()
+            except Exception as e:
+                logger.error(f"Sensor snapshot error: {e}")
+                
+    async def _run_watchdog(self) -> None:
+        """Cancel senders stuck in one send for longer than ``send_timeout``."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.send_timeout / 2)
+            cutoff = loop.time() - self.send_timeout
+            for subscriber in self._subscribers():
+                since = subscriber.sending_since
+                if since is not None and since < cutoff and not subscriber.timed_out:
+                    subscriber.timed_out = True
+                    subscriber.task.cancel()
+                    
+    def publish_snapshots(self) -> int:
+        """Send each watched aircraft's latest sensor values; returns aircraft sent."""
+        latest, self._latest = self._latest, {}
+        timestamp = datetime.utcnow().isoformat()
+        for aircraft_id, sensors in latest.items():
+            self.publish(aircraft_id, {
+                "type": "sensor_data",
+                "aircraft_id": aircraft_id,
+                "timestamp": timestamp,
+                "sensors": sensors,
+            })
+        return len(latest)
+        
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "subscribers": sum(len(group) for group in self._by_aircraft.values()) + len(self._fleet),
+            "fleet_subscribers": len(self._fleet),
+            "published": self.published,
+            "dropped": self.dropped,
+            "evicted": self.evicted,
+        }
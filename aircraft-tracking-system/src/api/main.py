@@ -2,18 +2,21 @@
 FastAPI REST API for Aircraft Tracking and Maintenance System.
 Provides endpoints for monitoring, alerts, and maintenance management.
 """
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Query, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-import asyncio
-import json
+from enum import Enum
 
 from src.sensors.models import Alert, AlertSeverity
+from src.monitoring.engine import MonitoringEngine
 from src.maintenance.scheduler import (
-    MaintenanceTask, MaintenanceType, MaintenanceStatus, AircraftStatus
+    MaintenanceScheduler, MaintenanceTask, MaintenanceType, MaintenanceStatus, AircraftStatus,
+    TASK_TRANSITIONS,
 )
+from src.api.pagination import CursorError, decode_cursor, encode_cursor, parse_position_time
+from src.api.hub import MonitoringHub
 
 
 app = FastAPI(
@@ -31,8 +34,62 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# WebSocket connections for real-time updates
-websocket_connections: List[WebSocket] = []
+# Live monitoring engine and maintenance scheduler, attached when the API
+# runs alongside the tracking system (same event loop, no copies)
+app.state.monitoring_engine = None
+app.state.maintenance_scheduler = None
+app.state.monitoring_hub = None
+
+
+def attach_monitoring_engine(engine: MonitoringEngine) -> None:
+    """Serve alert endpoints from a running engine's alert store."""
+    app.state.monitoring_engine = engine
+
+
+def attach_maintenance_scheduler(scheduler: MaintenanceScheduler) -> None:
+    """Serve aircraft and maintenance endpoints from a running scheduler's indexes."""
+    app.state.maintenance_scheduler = scheduler
+
+
+def attach_monitoring_hub(hub: MonitoringHub) -> None:
+    """Serve WebSocket subscriptions from a hub fed by the running engine."""
+    app.state.monitoring_hub = hub
+
+
+def _monitoring_engine() -> MonitoringEngine:
+    engine = app.state.monitoring_engine
+    if engine is None:
+        raise HTTPException(status_code=503, detail="Monitoring engine not attached")
+    return engine
+
+
+def _maintenance_scheduler() -> MaintenanceScheduler:
+    scheduler = app.state.maintenance_scheduler
+    if scheduler is None:
+        raise HTTPException(status_code=503, detail="Maintenance scheduler not attached")
+    return scheduler
+
+
+def _parse_enum(enum_type: type, value: Optional[str], name: str) -> Optional[Enum]:
+    if value is None:
+        return None
+    try:
+        return enum_type(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Unknown {name}: {value}")
+
+
+def _cursor_position(cursor: Optional[str], kind: str, filters: Dict[str, Any], size: int) -> Optional[List[Any]]:
+    """Position a page resumes after, or None for the first page."""
+    if cursor is None:
+        return None
+    try:
+        position = decode_cursor(cursor, kind, filters)
+        if len(position) != size or not isinstance(position[-1], int):
+            raise CursorError("Malformed cursor")
+    except CursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return position
 
 
 # Pydantic models
@@ -73,21 +130,35 @@ async def health_check():
 # Aircraft endpoints
 @app.post("/api/v1/aircraft", response_model=dict)
 async def register_aircraft(aircraft: AircraftStatusCreate):
-    """Register new aircraft for tracking."""
-    # In production, this would save to database
-    return {"message": f"Aircraft {aircraft.registration} registered", "data": aircraft.dict()}
+    """Register new aircraft for tracking (persisted with the next maintenance flush)."""
+    _maintenance_scheduler().register_aircraft(AircraftStatus(**aircraft.model_dump()))
+    return {"message": f"Aircraft {aircraft.registration} registered", "data": aircraft.model_dump()}
 
 
 @app.get("/api/v1/aircraft/{aircraft_id}/status")
 async def get_aircraft_status(aircraft_id: str):
     """Get aircraft operational status."""
-    # Mock response - would fetch from database
+    scheduler = _maintenance_scheduler()
+    status = scheduler.get_aircraft_status(aircraft_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Aircraft {aircraft_id} not registered")
+        
+    remaining = {
+        check_type: interval - getattr(status, f"hours_since_{check_type.value}")
+        for check_type, interval in scheduler.check_intervals.items()
+    }
+    next_check = min(remaining, key=remaining.get)
     return {
         "aircraft_id": aircraft_id,
-        "total_flight_hours": 12500.5,
-        "cycles": 8420,
-        "hours_since_last_a_check": 245.5,
-        "next_maintenance": "A-Check in 254.5 hours"
+        "registration": status.registration,
+        "model": status.model,
+        "total_flight_hours": status.total_flight_hours,
+        "cycles": status.cycles,
+        "hours_since_last_a_check": status.hours_since_a_check,
+        "hours_since_last_b_check": status.hours_since_b_check,
+        "hours_since_last_c_check": status.hours_since_c_check,
+        "hours_since_last_d_check": status.hours_since_d_check,
+        "next_maintenance": f"{next_check.value.upper().replace('_', '-')} in {remaining[next_check]:.1f} hours",
     }
 
 
@@ -96,40 +167,57 @@ async def get_aircraft_status(aircraft_id: str):
 async def get_alerts(
     aircraft_id: Optional[str] = None,
     severity: Optional[str] = None,
-    resolved: bool = False
+    resolved: Optional[bool] = False,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
 ):
-    """Get system alerts."""
-    # Mock response
-    alerts = [
-        {
-            "id": "alert-001",
-            "aircraft_id": aircraft_id or "AC-001",
-            "severity": severity or "warning",
-            "title": "Engine Temperature Elevated",
-            "message": "Engine 1 temperature is above normal operating range",
-            "resolved": resolved,
-            "created_at": datetime.utcnow().isoformat()
-        }
-    ]
-    return {"alerts": alerts, "count": len(alerts)}
+    """Get system alerts, oldest first (served from the alert store's indexes)."""
+    severity_filter = _parse_enum(AlertSeverity, severity, "severity")
+    filters = {"aircraft_id": aircraft_id, "severity": severity, "resolved": resolved}
+    position = _cursor_position(cursor, "alerts", filters, 1)
+    
+    store = _monitoring_engine().alert_store
+    alerts = store.query(
+        aircraft_id=aircraft_id,
+        severity=severity_filter,
+        resolved=resolved,
+        after_seq=position[0] if position else 0,
+        limit=limit,
+    )
+    next_cursor = None
+    if len(alerts) == limit:
+        next_cursor = encode_cursor("alerts", [store.sequence(alerts[-1].id)], filters)
+    return {
+        "alerts": [alert.to_dict() for alert in alerts],
+        "count": len(alerts),
+        "next_cursor": next_cursor,
+    }
 
 
 @app.post("/api/v1/monitoring/alerts/{alert_id}/acknowledge")
 async def acknowledge_alert(alert_id: str, data: AlertAcknowledge):
     """Acknowledge an alert."""
+    engine = _monitoring_engine()
+    if not engine.acknowledge_alert(alert_id):
+        raise HTTPException(status_code=404, detail=f"Alert {alert_id} not found")
+    alert = engine.alert_store.get(alert_id)
     return {
         "message": f"Alert {alert_id} acknowledged",
         "acknowledged_by": data.acknowledged_by,
-        "acknowledged_at": datetime.utcnow().isoformat()
+        "acknowledged_at": alert.acknowledged_at.isoformat()
     }
 
 
 @app.post("/api/v1/monitoring/alerts/{alert_id}/resolve")
 async def resolve_alert(alert_id: str):
     """Resolve an alert."""
+    engine = _monitoring_engine()
+    if not engine.resolve_alert(alert_id):
+        raise HTTPException(status_code=404, detail=f"Alert {alert_id} not found")
+    alert = engine.alert_store.get(alert_id)
     return {
         "message": f"Alert {alert_id} resolved",
-        "resolved_at": datetime.utcnow().isoformat()
+        "resolved_at": alert.resolved_at.isoformat() if alert else datetime.utcnow().isoformat()
     }
 
 
@@ -138,100 +226,172 @@ async def resolve_alert(alert_id: str):
 async def get_maintenance_tasks(
     aircraft_id: Optional[str] = None,
     status: Optional[str] = None,
-    maintenance_type: Optional[str] = None
+    maintenance_type: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
 ):
-    """Get maintenance tasks."""
-    # Mock response
-    tasks = [
-        {
-            "id": "task-001",
-            "aircraft_id": aircraft_id or "AC-001",
-            "maintenance_type": maintenance_type or "a_check",
-            "title": "A-Check Due",
-            "status": status or "scheduled",
-            "scheduled_date": datetime.utcnow().isoformat(),
-            "due_flight_hours": 13000.0
-        }
-    ]
-    return {"tasks": tasks, "count": len(tasks)}
+    """Get maintenance tasks in creation order (served from the scheduler's task index)."""
+    status_filter = _parse_enum(MaintenanceStatus, status, "status")
+    type_filter = _parse_enum(MaintenanceType, maintenance_type, "maintenance type")
+    filters = {"aircraft_id": aircraft_id, "status": status, "maintenance_type": maintenance_type}
+    position = _cursor_position(cursor, "tasks", filters, 1)
+    
+    scheduler = _maintenance_scheduler()
+    tasks = scheduler.get_tasks(
+        aircraft_id=aircraft_id,
+        status=status_filter,
+        maintenance_type=type_filter,
+        after=position[0] if position else -1,
+        limit=limit,
+    )
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = encode_cursor("tasks", [scheduler.task_sequence(tasks[-1].id)], filters)
+    return {"tasks": [task.to_dict() for task in tasks], "count": len(tasks), "next_cursor": next_cursor}
 
 
 @app.post("/api/v1/maintenance/tasks", response_model=dict)
 async def create_maintenance_task(task: MaintenanceTaskCreate):
     """Create new maintenance task."""
-    task_id = f"task-{datetime.utcnow().timestamp()}"
+    created = _maintenance_scheduler().create_task(MaintenanceTask(
+        aircraft_id=task.aircraft_id,
+        maintenance_type=_parse_enum(MaintenanceType, task.maintenance_type, "maintenance type"),
+        title=task.title,
+        description=task.description,
+        scheduled_date=task.scheduled_date,
+        component_id=task.component_id,
+        component_name=task.component_name,
+    ))
     return {
         "message": "Maintenance task created",
-        "task_id": task_id,
-        "data": task.dict()
+        "task_id": created.id,
+        "data": created.to_dict()
     }
 
 
 @app.patch("/api/v1/maintenance/tasks/{task_id}")
 async def update_maintenance_task(task_id: str, update: MaintenanceTaskUpdate):
-    """Update maintenance task."""
+    """Update maintenance task (start, complete or cancel it, or change technician/notes)."""
+    scheduler = _maintenance_scheduler()
+    task = scheduler.get_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail=f"Task {task_id} not found")
+        
+    status = _parse_enum(MaintenanceStatus, update.status, "status")
+    if status is not None:
+        if status not in TASK_TRANSITIONS:
+            raise HTTPException(status_code=400, detail=f"Cannot set status {status.value} directly")
+        if not scheduler.can_transition(task, status):
+            raise HTTPException(
+                status_code=409,
+                detail=f"Cannot change task {task_id} from {task.status.value} to {status.value}",
+            )
+            
+    if status == MaintenanceStatus.IN_PROGRESS:
+        if not update.technician:
+            raise HTTPException(status_code=400, detail="Starting a task needs a technician")
+        scheduler.start_task(task_id, update.technician)
+    elif status == MaintenanceStatus.COMPLETED:
+        scheduler.complete_task(task_id, update.notes if update.notes is not None else task.notes)
+    elif status == MaintenanceStatus.CANCELLED:
+        scheduler.cancel_task(task_id)
+    scheduler.update_task(task_id, update.technician, update.notes)
     return {
         "message": f"Task {task_id} updated",
-        "updates": update.dict(exclude_none=True)
+        "updates": update.model_dump(exclude_none=True),
+        "task": task.to_dict(),
     }
 
 
 @app.get("/api/v1/maintenance/upcoming")
-async def get_upcoming_maintenance(days: int = 30, aircraft_id: Optional[str] = None):
-    """Get upcoming scheduled maintenance."""
+async def get_upcoming_maintenance(
+    days: int = Query(30, ge=0),
+    aircraft_id: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """Get upcoming scheduled maintenance, earliest first (walks the scheduler's due-date heap)."""
+    filters = {"aircraft_id": aircraft_id, "days": days}
+    position = _cursor_position(cursor, "upcoming", filters, 2)
+    after = None
+    if position:
+        try:
+            after = (parse_position_time(position[0]), position[1])
+        except CursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+            
+    scheduler = _maintenance_scheduler()
+    tasks = scheduler.get_upcoming_maintenance(aircraft_id, days, after=after, limit=limit)
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = encode_cursor("upcoming", scheduler.upcoming_position(tasks[-1].id), filters)
     return {
-        "upcoming": [],
+        "upcoming": [task.to_dict() for task in tasks],
+        "count": len(tasks),
         "period_days": days,
-        "aircraft_id": aircraft_id
+        "aircraft_id": aircraft_id,
+        "next_cursor": next_cursor,
     }
 
 
 @app.get("/api/v1/maintenance/overdue")
-async def get_overdue_maintenance(aircraft_id: Optional[str] = None):
-    """Get overdue maintenance tasks."""
+async def get_overdue_maintenance(
+    aircraft_id: Optional[str] = None,
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    """
+    Get overdue maintenance tasks in creation order. Read-only: tasks are
+    marked overdue by the scheduler's deadline loop, which also logs them.
+    """
+    filters = {"aircraft_id": aircraft_id}
+    position = _cursor_position(cursor, "overdue", filters, 1)
+    
+    scheduler = _maintenance_scheduler()
+    tasks = scheduler.get_tasks(
+        aircraft_id=aircraft_id,
+        status=MaintenanceStatus.OVERDUE,
+        after=position[0] if position else -1,
+        limit=limit,
+    )
+    next_cursor = None
+    if len(tasks) == limit:
+        next_cursor = encode_cursor("overdue", [scheduler.task_sequence(tasks[-1].id)], filters)
     return {
-        "overdue": [],
-        "aircraft_id": aircraft_id
+        "overdue": [task.to_dict() for task in tasks],
+        "count": len(tasks),
+        "aircraft_id": aircraft_id,
+        "next_cursor": next_cursor,
     }
 
 
-# Real-time WebSocket endpoint
+# Real-time WebSocket endpoints (push-based, see MonitoringHub)
+@app.websocket("/ws/monitoring")
+async def fleet_monitoring_websocket(websocket: WebSocket):
+    """WebSocket for real-time alerts and sensor snapshots of the whole fleet."""
+    await _serve_monitoring(websocket, None)
+
+
 @app.websocket("/ws/monitoring/{aircraft_id}")
 async def monitoring_websocket(websocket: WebSocket, aircraft_id: str):
-    """WebSocket for real-time sensor data and alerts."""
-    await websocket.accept()
-    websocket_connections.append(websocket)
-    
-    try:
-        while True:
-            # Send mock real-time data every second
-            data = {
-                "type": "sensor_data",
-                "aircraft_id": aircraft_id,
-                "timestamp": datetime.utcnow().isoformat(),
-                "sensors": {
-                    "engine_temp": 78.5,
-                    "oil_pressure": 45.2,
-                    "fuel_level": 65.0,
-                    "altitude": 35000,
-                    "airspeed": 480
-                }
-            }
-            await websocket.send_json(data)
-            await asyncio.sleep(1)
-            
-    except WebSocketDisconnect:
-        websocket_connections.remove(websocket)
+    """WebSocket for real-time sensor data and alerts of one aircraft."""
+    await _serve_monitoring(websocket, aircraft_id)
+
+
+async def _serve_monitoring(websocket: WebSocket, aircraft_id: Optional[str]) -> None:
+    hub = app.state.monitoring_hub
+    if hub is None:
+        await websocket.close(code=1013)
+        return
+    await hub.serve(websocket, aircraft_id)
 
 
 # Broadcast alert to all connected clients
 async def broadcast_alert(alert: dict):
-    """Broadcast alert to all WebSocket connections."""
-    for connection in websocket_connections:
-        try:
-            await connection.send_json({"type": "alert", "data": alert})
-        except:
-            pass
+    """Queue an alert for the aircraft's and the fleet's WebSocket subscribers."""
+    hub = app.state.monitoring_hub
+    if hub is not None:
+        hub.publish(alert["aircraft_id"], {"type": "alert", "data": alert})
 
 
 if __name__ == "__main__":
@@ -0,0 +1,50 @@
+"""
+Cursor pagination for Aircraft Tracking System API.
+Opaque page cursors over the alert store and maintenance task indexes.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+
+class CursorError(ValueError):
+    """Cursor that was not issued by this API, or for another listing."""
+
+
+def encode_cursor(kind: str, position: Sequence[Any], filters: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Opaque cursor for resuming a listing after ``position``. The listing
+    kind and its filters are embedded so the cursor is rejected elsewhere.
+    Datetimes in the position are stored as ISO strings.
+    """
+    payload = {
+        "k": kind,
+        "p": [value.isoformat() if isinstance(value, datetime) else value for value in position],
+        "f": filters or {},
+    }
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str, filters: Optional[Dict[str, Any]] = None) -> List[Any]:
+    """Position stored in a cursor from ``encode_cursor`` (datetimes left as ISO strings)."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        position = payload["p"]
+        matches = payload["k"] == kind and payload["f"] == (filters or {})
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise CursorError("Malformed cursor")
+    if not matches or not isinstance(position, list):
+        raise CursorError("Cursor does not belong to this listing")
+    return position
+
+
+def parse_position_time(value: Any) -> datetime:
+    """Datetime stored in a cursor position."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise CursorError("Malformed cursor")
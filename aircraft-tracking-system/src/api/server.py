@@ -0,0 +1,81 @@
+"""
+Embedded API server for Aircraft Tracking System.
+Runs the FastAPI app on the tracking system's own event loop.
+"""
+import asyncio
+import contextlib
+import logging
+from typing import Iterator, Optional
+
+import uvicorn
+
+from src.api.hub import MonitoringHub
+from src.api.main import app, attach_maintenance_scheduler, attach_monitoring_engine, attach_monitoring_hub
+from src.maintenance.scheduler import MaintenanceScheduler
+from src.monitoring.engine import MonitoringEngine
+
+
+logger = logging.getLogger(__name__)
+
+
+class _EmbeddedServer(uvicorn.Server):
+    """uvicorn server that leaves signal handling to the host application."""
+    
+    @contextlib.contextmanager
+    def capture_signals(self) -> Iterator[None]:
+        yield
+        
+    def install_signal_handlers(self) -> None:  # uvicorn < 0.29
+        pass
+
+
+class ApiServer:
+    """
+    Serves the REST/WebSocket API from the running system's loop, so
+    endpoints read the live monitoring engine and maintenance scheduler
+    directly instead of a separate process's copies.
+    """
+    
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        engine: MonitoringEngine,
+        scheduler: MaintenanceScheduler,
+        hub: MonitoringHub,
+        log_level: str = "info",
+    ):
+        self.hub = hub
+        attach_monitoring_engine(engine)
+        attach_maintenance_scheduler(scheduler)
+        attach_monitoring_hub(hub)
+        self._server = _EmbeddedServer(uvicorn.Config(
+            app, host=host, port=port, log_level=log_level.lower(), lifespan="off",
+        ))
+        self._task: Optional[asyncio.Task] = None
+        
+    def start(self) -> None:
+        """Start serving on the running loop."""
+        if self._task is None:
+            self.hub.start()
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            
+    async def _run(self) -> None:
+        try:
+            await self._server.serve()
+        except SystemExit:
+            # uvicorn exits when it cannot bind; keep the tracking system running
+            config = self._server.config
+            logger.error(f"API server could not start on {config.host}:{config.port}")
+            
+    async def stop(self) -> None:
+        """Stop accepting requests and wait for open ones to finish."""
+        if self._task is not None:
+            # Close WebSocket clients first; uvicorn waits for open connections
+            await self.hub.stop()
+            self._server.should_exit = True
+            try:
+                await self._task
+            except Exception as e:
+                logger.error(f"API server error: {e}")
+            self._task = None
@@ -17,9 +17,17 @@ from typing import Optional
 
 from config.settings import get_config, Config
 from src.sensors.collector import SensorDataCollector
+from src.sensors.sharding import ShardedIngestor
 from src.monitoring.engine import MonitoringEngine
+from src.monitoring.lag import LoopLagMonitor
 from src.maintenance.scheduler import MaintenanceScheduler
+from src.maintenance.models import MaintenanceEvent, MaintenanceEventType
+from src.maintenance.repository import MaintenanceRepository
+from src.maintenance.flight_tracker import FlightTracker
 from src.alerts.notifier import AlertNotifier
+from src.api.hub import MonitoringHub
+from src.api.server import ApiServer
+from src.storage.telemetry import TelemetryWriter
 
 
 # Configure logging
@@ -49,6 +57,16 @@ class AircraftTrackingSystem:
         self.monitoring_engine: Optional[MonitoringEngine] = None
         self.maintenance_scheduler: Optional[MaintenanceScheduler] = None
         self.alert_notifier: Optional[AlertNotifier] = None
+        self.telemetry_writer: Optional[TelemetryWriter] = None
+        self.maintenance_repository: Optional[MaintenanceRepository] = None
+        self.flight_tracker: Optional[FlightTracker] = None
+        self.sharded_ingestor: Optional[ShardedIngestor] = None
+        self.api_server: Optional[ApiServer] = None
+        self.monitoring_hub: Optional[MonitoringHub] = None
+        self.loop_lag_monitor = LoopLagMonitor(config.loop_lag_interval, config.loop_lag_warning)
+        self._maintenance_task: Optional[asyncio.Task] = None
+        self._persist_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
     def setup(self) -> None:
         """Initialize all system components."""
@@ -62,10 +80,40 @@ class AircraftTrackingSystem:
         
         # Maintenance scheduler
         self.maintenance_scheduler = MaintenanceScheduler(self.config.maintenance)
-        
+        if self.config.database.maintenance_enabled:
+            self.maintenance_repository = MaintenanceRepository(self.config.database)
+            
+        # Flight hours and cycles from telemetry
+        if self.config.maintenance.flight_tracking_enabled:
+            self.flight_tracker = FlightTracker(self.config.maintenance, self.maintenance_scheduler)
+            
         # Alert notifier
         self.alert_notifier = AlertNotifier(self.config.alerts)
         
+        # Telemetry persistence (drains the collector's reading buffer, which
+        # only fills with in-process ingestion)
+        if self.config.database.telemetry_enabled:
+            if self.config.mqtt.ingest_workers > 0:
+                logger.warning("Telemetry persistence needs in-process ingestion (INGEST_WORKERS=0); readings will not be stored")
+            else:
+                self.telemetry_writer = TelemetryWriter(self.config.database, self.sensor_collector)
+                
+        # REST/WebSocket API on this loop, reading the live engine and scheduler
+        if self.config.api_enabled:
+            self.monitoring_hub = MonitoringHub(
+                self.config.ws_queue_size,
+                self.config.ws_send_timeout,
+                self.config.ws_snapshot_interval,
+            )
+            self.api_server = ApiServer(
+                self.config.api_host,
+                self.config.api_port,
+                self.monitoring_engine,
+                self.maintenance_scheduler,
+                self.monitoring_hub,
+                self.config.log_level,
+            )
+            
         # Wire up components
         self._connect_components()
         
@@ -73,10 +121,9 @@ class AircraftTrackingSystem:
         
     def _connect_components(self) -> None:
         """Connect system components."""
-        # Sensor readings -> Monitoring engine
-        self.sensor_collector.register_callback(
-            "*",  # All sensors
-            self._on_sensor_reading
+        # Sensor readings -> Monitoring engine (one call per dispatched batch)
+        self.sensor_collector.register_batch_callback(
+            self._on_sensor_batch
         )
         
         # Monitoring alerts -> Notifier
@@ -84,23 +131,51 @@ class AircraftTrackingSystem:
             self._on_alert
         )
         
-    def _on_sensor_reading(self, reading) -> None:
-        """Handle incoming sensor reading."""
+        # Alerts and latest readings -> WebSocket subscribers
+        if self.monitoring_hub:
+            self.monitoring_hub.attach(self.monitoring_engine)
+            self.sensor_collector.register_batch_callback(self.monitoring_hub.on_batch)
+            if self.config.mqtt.ingest_workers > 0:
+                logger.warning("WebSocket sensor snapshots need in-process ingestion (INGEST_WORKERS=0); only alerts will be pushed")
+                
+        # Altitude/airspeed/landing gear readings -> Flight tracker -> Scheduler
+        if self.flight_tracker:
+            self.flight_tracker.attach(self.sensor_collector)
+            if self.config.mqtt.ingest_workers > 0:
+                logger.warning("Flight tracking needs in-process ingestion (INGEST_WORKERS=0); no hours will be derived")
+                
+        # Sharded mode: raw messages -> worker engines, alerts merged back here
+        if self.config.mqtt.ingest_workers > 0:
+            self.sharded_ingestor = ShardedIngestor(
+                self.config.mqtt,
+                self.config.alerts,
+                self._on_shard_alerts,
+            )
+            self.sensor_collector.enable_sharding(self.sharded_ingestor)
+            # Operator acknowledge/resolve -> the worker that owns the aircraft
+            self.monitoring_engine.register_operator_callback(self.sharded_ingestor.forward_command)
+            
+    def _on_sensor_batch(self, batch) -> None:
+        """Handle a batch of incoming sensor readings."""
         # Process through monitoring engine
-        alert = self.monitoring_engine.process_reading(reading)
-        
-        # Log reading (automated logging)
-        logger.debug(
-            f"Sensor: {reading.sensor_type.value} | "
-            f"Aircraft: {reading.aircraft_id} | "
-            f"Value: {reading.value} {reading.unit}"
-        )
+        alerts = self.monitoring_engine.process_batch(batch)
         
+        # Log batch (automated logging)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processed {len(batch)} readings, {len(alerts)} alerts")
+            
     def _on_alert(self, alert) -> None:
         """Handle alert from monitoring engine."""
         # Send notifications asynchronously
         asyncio.create_task(self.alert_notifier.notify(alert))
         
+    def _on_shard_alerts(self, alerts) -> None:
+        """Merge alerts from ingest workers (called on the shard alert thread)."""
+        engine = self.monitoring_engine
+        for alert in alerts:
+            handler = engine.apply_resolution if alert.resolved else engine.publish_alert
+            self._loop.call_soon_threadsafe(handler, alert)
+            
     async def start(self) -> None:
         """Start the tracking system."""
         self.setup()
@@ -108,28 +183,104 @@ class AircraftTrackingSystem:
         
         logger.info("Starting Aircraft Tracking System...")
         
-        # Start sensor collection
+        # Start sensor collection; readings are handed over to this loop
+        self._loop = asyncio.get_running_loop()
+        self.sensor_collector.attach_event_loop(self._loop)
+        if self.sharded_ingestor:
+            self.sharded_ingestor.start()
         self.sensor_collector.start()
         
-        # Start maintenance check loop
-        asyncio.create_task(self._maintenance_check_loop())
+        # Start telemetry persistence
+        if self.telemetry_writer:
+            try:
+                await self.telemetry_writer.start()
+            except Exception as e:
+                logger.error(f"Telemetry persistence disabled: {e}")
+                self.telemetry_writer = None
+                
+        # Restore maintenance state, then write changes back periodically
+        if self.maintenance_repository:
+            try:
+                await self.maintenance_repository.start()
+                self.maintenance_scheduler.restore(
+                    await self.maintenance_repository.load_aircraft(),
+                    await self.maintenance_repository.load_tasks(),
+                    await self.maintenance_repository.load_components(),
+                )
+                self._persist_task = asyncio.create_task(self._persist_maintenance_loop())
+            except Exception as e:
+                logger.error(f"Maintenance persistence disabled: {e}")
+                await self.maintenance_repository.close()
+                self.maintenance_repository = None
+                
+        # Open long-lived notification clients
+        await self.alert_notifier.start()
+        
+        # Measure event loop lag (blocking calls show up here)
+        self.loop_lag_monitor.start()
         
+        # Hand derived flight hours to the scheduler in batches
+        if self.flight_tracker:
+            self.flight_tracker.start()
+            
+        # Maintenance deadlines: wakes when a task reaches its warning point or due date
+        self._maintenance_task = asyncio.create_task(
+            self.maintenance_scheduler.run(self._on_maintenance_event)
+        )
+        
+        # Serve the API once maintenance state is restored
+        if self.api_server:
+            self.api_server.start()
+            
         logger.info("System is running")
         
         # Keep running until stopped
         while self._running:
             await asyncio.sleep(1)
             
-    async def _maintenance_check_loop(self) -> None:
-        """Periodic maintenance check."""
-        while self._running:
-            # Check for overdue maintenance
-            overdue = self.maintenance_scheduler.get_overdue_maintenance()
-            for task in overdue:
-                logger.warning(f"Overdue maintenance: {task.title} for {task.aircraft_id}")
+        if self.api_server:
+            await self.api_server.stop()
+            
+        # Flush remaining telemetry before exiting
+        if self.telemetry_writer:
+            await self.telemetry_writer.stop()
+            
+        if self.flight_tracker:
+            await self.flight_tracker.stop()
+            logger.info(f"Flight tracking: {self.flight_tracker.get_stats()}")
+        self._maintenance_task.cancel()
+        await asyncio.gather(self._maintenance_task, return_exceptions=True)
+        if self.maintenance_repository:
+            self._persist_task.cancel()
+            await asyncio.gather(self._persist_task, return_exceptions=True)
+            try:
+                await self.maintenance_scheduler.persist(self.maintenance_repository)
+            except Exception as e:
+                logger.error(f"Final maintenance persist failed: {e}")
+            await self.maintenance_repository.close()
+        await self.alert_notifier.close()
+        await self.loop_lag_monitor.stop()
+        logger.info(f"Event loop lag: {self.loop_lag_monitor.get_stats()}")
+        
+    async def _persist_maintenance_loop(self) -> None:
+        """Write changed maintenance tasks and aircraft status in batches."""
+        while True:
+            await asyncio.sleep(self.config.database.maintenance_flush_interval)
+            try:
+                await self.maintenance_scheduler.persist(self.maintenance_repository)
+            except Exception as e:
+                logger.error(f"Maintenance persist error: {e}")
                 
-            # Sleep for 1 hour
-            await asyncio.sleep(3600)
+    def _on_maintenance_event(self, event: MaintenanceEvent) -> None:
+        """Handle a maintenance task reaching its warning point or due date."""
+        task = event.task
+        if event.event_type == MaintenanceEventType.DUE:
+            logger.warning(f"Overdue maintenance: {task.title} for {task.aircraft_id}")
+        else:
+            logger.info(
+                f"Maintenance due soon: {task.title} for {task.aircraft_id} "
+                f"on {task.scheduled_date:%Y-%m-%d %H:%M}"
+            )
             
     def stop(self) -> None:
         """Stop the tracking system."""
@@ -139,6 +290,16 @@ class AircraftTrackingSystem:
         if self.sensor_collector:
             self.sensor_collector.stop()
             
+            if self.sharded_ingestor:
+                self.sharded_ingestor.stop()
+                
+            stats = self.sensor_collector.ingest_stats
+            if stats.get("dropped_oldest") or stats.get("dropped_newest"):
+                logger.warning(f"Ingest queue dropped readings: {stats}")
+                
+        if self.monitoring_engine:
+            logger.info(f"Alert state: {self.monitoring_engine.alert_stats}")
+            
         logger.info("System stopped")
 
 
@@ -0,0 +1,165 @@
+"""
+Component usage table for Aircraft Tracking System.
+Array-backed flight-hour and cycle counters per installed component.
+"""
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+class ComponentUsageTable:
+    """
+    Usage since installation or last replacement of every tracked component.
+
+    One row per ``component_id``; the columns are parallel NumPy arrays
+    (aircraft row, replacement interval in hours and cycles, hours and
+    cycles used). ``aircraft_row`` is the aircraft's row in the
+    scheduler's FleetCounters, so per-aircraft usage deltas are applied to
+    every component in one indexed add. Rows touched since the last
+    ``take_dirty`` are flagged for persistence.
+    """
+    
+    def __init__(self, capacity: int = 256):
+        self._rows: Dict[str, int] = {}
+        self.component_ids: List[str] = []
+        self.component_names: List[str] = []
+        self.aircraft_ids: List[str] = []
+        self.aircraft_row = np.zeros(capacity, dtype=np.intp)
+        self.interval_hours = np.zeros(capacity, dtype=np.float64)
+        self.interval_cycles = np.zeros(capacity, dtype=np.int64)  # 0 = no cycle limit
+        self.hours = np.zeros(capacity, dtype=np.float64)
+        self.cycles = np.zeros(capacity, dtype=np.int64)
+        self.dirty = np.zeros(capacity, dtype=bool)
+        
+    def __len__(self) -> int:
+        return len(self.component_ids)
+        
+    def __contains__(self, component_id: str) -> bool:
+        return component_id in self._rows
+        
+    def install(
+        self,
+        component_id: str,
+        component_name: str,
+        aircraft_id: str,
+        aircraft_row: int,
+        interval_hours: float,
+        interval_cycles: int = 0,
+        hours: float = 0.0,
+        cycles: int = 0,
+    ) -> int:
+        """Add a component (or overwrite its row) with the usage it already has."""
+        row = self._rows.get(component_id)
+        if row is None:
+            row = len(self.component_ids)
+            if row == len(self.hours):
+                self._grow()
+            self._rows[component_id] = row
+            self.component_ids.append(component_id)
+            self.component_names.append(component_name)
+            self.aircraft_ids.append(aircraft_id)
+        else:
+            self.component_names[row] = component_name
+            self.aircraft_ids[row] = aircraft_id
+        self.aircraft_row[row] = aircraft_row
+        self.interval_hours[row] = interval_hours
+        self.interval_cycles[row] = interval_cycles
+        self.hours[row] = hours
+        self.cycles[row] = cycles
+        self.dirty[row] = True
+        return row
+        
+    def _grow(self) -> None:
+        capacity = 2 * len(self.hours)
+        for name in ("aircraft_row", "interval_hours", "interval_cycles", "hours", "cycles", "dirty"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+            
+    def reset(self, component_id: str) -> bool:
+        """Zero a component's usage (on replacement); False if unknown."""
+        row = self._rows.get(component_id)
+        if row is None:
+            return False
+        self.hours[row] = 0.0
+        self.cycles[row] = 0
+        self.dirty[row] = True
+        return True
+        
+    def add_usage(
+        self,
+        aircraft_rows: np.ndarray,
+        hours: np.ndarray,
+        cycles: Optional[np.ndarray] = None,
+    ) -> None:
+        """Add per-aircraft hour (and cycle) deltas to every component of those aircraft."""
+        n = len(self.component_ids)
+        if not n or not len(aircraft_rows):
+            return
+        size = self._size(aircraft_rows, n)
+        per_aircraft = np.zeros(size, dtype=np.float64)
+        per_aircraft[aircraft_rows] = hours
+        self.hours[:n] += per_aircraft[self.aircraft_row[:n]]
+        if cycles is not None:
+            per_aircraft_cycles = np.zeros(size, dtype=np.int64)
+            per_aircraft_cycles[aircraft_rows] = cycles
+            self.cycles[:n] += per_aircraft_cycles[self.aircraft_row[:n]]
+        self.dirty[:n] |= self._on_aircraft(aircraft_rows, n)
+        
+    def due(
+        self,
+        horizon_hours: float,
+        horizon_cycles: int = 0,
+        aircraft_rows: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Rows with at most ``horizon_hours`` (or ``horizon_cycles``, for
+        components with a cycle limit) left, optionally only on the given
+        aircraft, ordered by hours remaining.
+        """
+        n = len(self.component_ids)
+        remaining = self.interval_hours[:n] - self.hours[:n]
+        hit = remaining <= horizon_hours
+        limited = self.interval_cycles[:n] > 0
+        hit |= limited & (self.interval_cycles[:n] - self.cycles[:n] <= horizon_cycles)
+        if aircraft_rows is not None:
+            hit &= self._on_aircraft(aircraft_rows, n)
+        rows = np.flatnonzero(hit)
+        return rows[np.argsort(remaining[rows], kind="stable")]
+        
+    def _size(self, aircraft_rows: np.ndarray, n: int) -> int:
+        """Length of a dense per-aircraft vector covering both row sets."""
+        return max(int(aircraft_rows.max(initial=0)), int(self.aircraft_row[:n].max(initial=0))) + 1
+        
+    def _on_aircraft(self, aircraft_rows: np.ndarray, n: int) -> np.ndarray:
+        """Mask of the first n components installed on one of aircraft_rows."""
+        touched = np.zeros(self._size(aircraft_rows, n), dtype=bool)
+        touched[aircraft_rows] = True
+        return touched[self.aircraft_row[:n]]
+        
+    def remaining_hours(self, row: int) -> float:
+        return float(self.interval_hours[row] - self.hours[row])
+        
+    def take_dirty(self) -> List[Dict]:
+        """Rows changed since the last call, as records; clears the flags."""
+        rows = np.flatnonzero(self.dirty[:len(self.component_ids)])
+        self.dirty[rows] = False
+        return [self.record(row) for row in rows.tolist()]
+        
+    def mark_dirty(self, component_ids: List[str]) -> None:
+        for component_id in component_ids:
+            row = self._rows.get(component_id)
+            if row is not None:
+                self.dirty[row] = True
+                
+    def record(self, row: int) -> Dict:
+        return {
+            "component_id": self.component_ids[row],
+            "aircraft_id": self.aircraft_ids[row],
+            "component_name": self.component_names[row],
+            "interval_hours": float(self.interval_hours[row]),
+            "interval_cycles": int(self.interval_cycles[row]),
+            "hours": float(self.hours[row]),
+            "cycles": int(self.cycles[row]),
+        }
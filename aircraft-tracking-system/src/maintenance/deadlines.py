@@ -0,0 +1,63 @@
+"""
+Deadline queue for the Maintenance Scheduler.
+Orders task deadlines so the scheduler can sleep until the next one.
+"""
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.maintenance.models import MaintenanceEventType
+
+
+# (deadline, entry number, task id, event type)
+_Entry = Tuple[datetime, int, str, MaintenanceEventType]
+
+
+class DeadlineQueue:
+    """
+    Min-heap of task deadlines. Setting or cancelling a task's deadlines is
+    O(log n): superseded entries are not searched for but skipped when they
+    reach the top (each task has a generation; only entries of its current
+    generation count).
+    """
+    
+    def __init__(self):
+        self._heap: List[_Entry] = []
+        self._generation: Dict[str, int] = {}
+        self._counter = itertools.count()
+        
+    def __len__(self) -> int:
+        return len(self._generation)
+        
+    def set(self, task_id: str, deadlines: Iterable[Tuple[datetime, MaintenanceEventType]]) -> None:
+        """Replace the task's pending deadlines."""
+        generation = next(self._counter)
+        self._generation[task_id] = generation
+        for deadline, event_type in deadlines:
+            heapq.heappush(self._heap, (deadline, generation, task_id, event_type))
+        if len(self._heap) > 4 * len(self._generation) + 64:
+            self._heap = [entry for entry in self._heap if self._valid(entry)]
+            heapq.heapify(self._heap)
+            
+    def cancel(self, task_id: str) -> None:
+        self._generation.pop(task_id, None)
+        
+    def _valid(self, entry: _Entry) -> bool:
+        return self._generation.get(entry[2]) == entry[1]
+        
+    def next_deadline(self) -> Optional[datetime]:
+        heap = self._heap
+        while heap and not self._valid(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+        
+    def pop_due(self, now: datetime) -> List[Tuple[str, MaintenanceEventType, datetime]]:
+        """Remove and return (task id, event type, deadline) for deadlines at or before now."""
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            deadline, _, task_id, event_type = entry = heapq.heappop(heap)
+            if self._valid(entry):
+                due.append((task_id, event_type, deadline))
+        return due
@@ -0,0 +1,102 @@
+"""
+Fleet flight-hour counters for Aircraft Tracking System.
+Per-aircraft hour counters in NumPy arrays for vectorized due checks.
+"""
+from typing import Dict, Iterable, List
+
+import numpy as np
+
+from src.maintenance.models import AircraftStatus, MaintenanceType
+
+
+# Column order of ``hours_since``
+CHECK_TYPES = (
+    MaintenanceType.A_CHECK,
+    MaintenanceType.B_CHECK,
+    MaintenanceType.C_CHECK,
+    MaintenanceType.D_CHECK,
+)
+CHECK_COLUMNS = {check_type: column for column, check_type in enumerate(CHECK_TYPES)}
+HOURS_SINCE_FIELDS = tuple(f"hours_since_{check_type.value}" for check_type in CHECK_TYPES)
+
+
+class FleetCounters:
+    """
+    Total flight hours and hours since each check, one row per aircraft.
+
+    Rows are assigned on registration and never move; the arrays double in
+    capacity as the fleet grows. The scheduler's AircraftStatus objects
+    mirror these counters and are written back after each update.
+    """
+    
+    def __init__(self, capacity: int = 64):
+        self._rows: Dict[str, int] = {}
+        self.aircraft_ids: List[str] = []
+        self.total_hours = np.zeros(capacity, dtype=np.float64)
+        self.hours_since = np.zeros((capacity, len(CHECK_TYPES)), dtype=np.float64)
+        
+    def __len__(self) -> int:
+        return len(self.aircraft_ids)
+        
+    def __contains__(self, aircraft_id: str) -> bool:
+        return aircraft_id in self._rows
+        
+    def add(self, status: AircraftStatus) -> int:
+        """Load an aircraft's counters (re-registering overwrites its row)."""
+        row = self._rows.get(status.aircraft_id)
+        if row is None:
+            row = len(self.aircraft_ids)
+            if row == len(self.total_hours):
+                self._grow()
+            self._rows[status.aircraft_id] = row
+            self.aircraft_ids.append(status.aircraft_id)
+        self.total_hours[row] = status.total_flight_hours
+        self.hours_since[row] = [getattr(status, name) for name in HOURS_SINCE_FIELDS]
+        return row
+        
+    def _grow(self) -> None:
+        capacity = 2 * len(self.total_hours)
+        total_hours = np.zeros(capacity, dtype=np.float64)
+        total_hours[:len(self.total_hours)] = self.total_hours
+        self.total_hours = total_hours
+        hours_since = np.zeros((capacity, len(CHECK_TYPES)), dtype=np.float64)
+        hours_since[:len(self.hours_since)] = self.hours_since
+        self.hours_since = hours_since
+        
+    def rows(self, aircraft_ids: Iterable[str]) -> np.ndarray:
+        """Row per aircraft id, -1 where it is not registered."""
+        get = self._rows.get
+        return np.fromiter((get(aircraft_id, -1) for aircraft_id in aircraft_ids), dtype=np.intp)
+        
+    def reset(self, aircraft_id: str, check_type: MaintenanceType) -> None:
+        """Zero the hours since a check (on completing it)."""
+        row = self._rows.get(aircraft_id)
+        if row is not None and check_type in CHECK_COLUMNS:
+            self.hours_since[row, CHECK_COLUMNS[check_type]] = 0.0
+            
+    def advance(self, rows: np.ndarray, hours: np.ndarray) -> np.ndarray:
+        """
+        Set new total flight hours for rows (unique) and add the increase to
+        every hours-since counter; returns the increases. Totals that go
+        backwards are ignored.
+        """
+        delta = np.maximum(hours - self.total_hours[rows], 0.0)
+        self.total_hours[rows] += delta
+        self.hours_since[rows] += delta[:, None]
+        return delta
+        
+    def remaining(self, rows: np.ndarray, intervals: np.ndarray) -> np.ndarray:
+        """Flight hours left until each check, shape (len(rows), checks)."""
+        return intervals - self.hours_since[rows]
+        
+    def write_back(self, rows: np.ndarray, statuses: Dict[str, AircraftStatus]) -> List[AircraftStatus]:
+        """Copy counters of rows onto their AircraftStatus objects; returns them."""
+        updated = []
+        ids = self.aircraft_ids
+        for row, total, since in zip(rows.tolist(), self.total_hours[rows].tolist(), self.hours_since[rows].tolist()):
+            status = statuses[ids[row]]
+            status.total_flight_hours = total
+            (status.hours_since_a_check, status.hours_since_b_check,
+             status.hours_since_c_check, status.hours_since_d_check) = since
+            updated.append(status)
+        return updated
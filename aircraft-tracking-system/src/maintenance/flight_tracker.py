@@ -0,0 +1,169 @@
+"""
+Flight tracker for Aircraft Tracking System.
+Derives flight hours and cycles from altitude, airspeed and landing gear telemetry.
+"""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from config.settings import MaintenanceConfig
+from src.maintenance.models import MaintenanceTask
+from src.maintenance.scheduler import MaintenanceScheduler
+from src.sensors.collector import SensorDataCollector
+from src.sensors.models import SensorReading, SensorType
+
+
+logger = logging.getLogger(__name__)
+
+NS_PER_HOUR = 3600 * 10**9
+
+TRACKED_SENSORS = (SensorType.ALTITUDE, SensorType.AIRSPEED, SensorType.LANDING_GEAR)
+
+
+class _FlightState:
+    """Latest flight parameters of one aircraft."""
+    
+    __slots__ = ("airborne", "altitude", "airspeed", "gear_down", "ground_altitude", "last_ns")
+    
+    def __init__(self):
+        self.airborne = False
+        self.altitude: Optional[float] = None
+        self.airspeed: Optional[float] = None
+        self.gear_down: Optional[bool] = None  # None until a gear reading arrives
+        self.ground_altitude: Optional[float] = None  # Altitude last seen at taxi speed
+        self.last_ns: Optional[int] = None
+
+
+class FlightTracker:
+    """
+    Airborne state per aircraft, updated in O(1) per reading.
+
+    Takeoff is detected when the gear comes up, airspeed reaches
+    ``takeoff_airspeed`` or altitude rises ``airborne_altitude_gain`` above
+    the last ground altitude. Landing is detected when airspeed drops below
+    ``landing_airspeed`` with the gear not reported up. Time between
+    readings while airborne is added to the aircraft's flight hours, and
+    each landing counts one cycle.
+
+    Hours and cycles accumulate here and are handed to the scheduler every
+    ``flight_hours_flush_interval`` seconds in one bulk update, so due
+    checks stay current without a scheduler call per reading.
+    """
+    
+    def __init__(self, config: MaintenanceConfig, scheduler: MaintenanceScheduler):
+        self.config = config
+        self.scheduler = scheduler
+        self._states: Dict[str, _FlightState] = {}
+        
+        # Hours and cycles not yet handed to the scheduler
+        self._hours: Dict[str, float] = {}
+        self._cycles: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        
+        # Counters
+        self.takeoffs = 0
+        self.landings = 0
+        
+    def attach(self, collector: SensorDataCollector) -> None:
+        """Subscribe to the collector's altitude, airspeed and landing gear readings."""
+        for sensor_type in TRACKED_SENSORS:
+            collector.register_callback(sensor_type.value, self.on_reading)
+            
+    def on_reading(self, reading: SensorReading) -> None:
+        """Update airborne state from one reading."""
+        aircraft_id = reading.aircraft_id
+        state = self._states.get(aircraft_id)
+        if state is None:
+            state = self._states[aircraft_id] = _FlightState()
+            
+        timestamp_ns = reading.timestamp_ns
+        if state.last_ns is None or timestamp_ns > state.last_ns:
+            if state.airborne and state.last_ns is not None:
+                self._hours[aircraft_id] = (
+                    self._hours.get(aircraft_id, 0.0) + (timestamp_ns - state.last_ns) / NS_PER_HOUR
+                )
+            state.last_ns = timestamp_ns
+            
+        config = self.config
+        sensor_type = reading.sensor_type
+        value = reading.value
+        if sensor_type == SensorType.ALTITUDE:
+            state.altitude = value
+            if state.ground_altitude is None:
+                state.ground_altitude = value
+            elif not state.airborne and value >= state.ground_altitude + config.airborne_altitude_gain:
+                self._takeoff(aircraft_id, state)
+                
+        elif sensor_type == SensorType.AIRSPEED:
+            state.airspeed = value
+            if state.airborne:
+                if value < config.landing_airspeed and state.gear_down is not False:
+                    self._land(aircraft_id, state)
+            elif value >= config.takeoff_airspeed:
+                self._takeoff(aircraft_id, state)
+            elif value < config.landing_airspeed and state.altitude is not None:
+                state.ground_altitude = state.altitude
+                
+        elif sensor_type == SensorType.LANDING_GEAR:
+            state.gear_down = value >= 0.5
+            if not state.airborne and not state.gear_down:
+                self._takeoff(aircraft_id, state)
+            elif (state.airborne and state.gear_down
+                  and state.airspeed is not None and state.airspeed < config.landing_airspeed):
+                self._land(aircraft_id, state)
+                
+    def _takeoff(self, aircraft_id: str, state: _FlightState) -> None:
+        state.airborne = True
+        self.takeoffs += 1
+        logger.debug(f"Takeoff: {aircraft_id}")
+        
+    def _land(self, aircraft_id: str, state: _FlightState) -> None:
+        state.airborne = False
+        state.ground_altitude = state.altitude
+        self._cycles[aircraft_id] = self._cycles.get(aircraft_id, 0) + 1
+        self.landings += 1
+        logger.debug(f"Landing: {aircraft_id}")
+        
+    def is_airborne(self, aircraft_id: str) -> bool:
+        state = self._states.get(aircraft_id)
+        return state is not None and state.airborne
+        
+    def flush(self) -> List[MaintenanceTask]:
+        """Hand accumulated hours and cycles to the scheduler; returns tasks it scheduled."""
+        if not self._hours and not self._cycles:
+            return []
+        hours, cycles = self._hours, self._cycles
+        self._hours, self._cycles = {}, {}
+        return self.scheduler.add_flight_time(hours, cycles)
+        
+    def start(self) -> None:
+        """Start the periodic flush on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            
+    async def stop(self) -> None:
+        """Stop the periodic flush and hand over what is pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.flush()
+        
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.flight_hours_flush_interval)
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Flight hours flush error: {e}")
+                
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "tracked": len(self._states),
+            "airborne": sum(1 for state in self._states.values() if state.airborne),
+            "takeoffs": self.takeoffs,
+            "landings": self.landings,
+        }
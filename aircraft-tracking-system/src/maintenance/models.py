@@ -0,0 +1,106 @@
+"""
+Maintenance data models for Aircraft Tracking System.
+Task, status and aircraft records shared by the scheduler and its index.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+from dataclasses import dataclass, field
+from enum import Enum
+import uuid
+
+
+class MaintenanceType(Enum):
+    """Types of aircraft maintenance checks."""
+    A_CHECK = "a_check"  # Every 500 flight hours
+    B_CHECK = "b_check"  # Every 2000 flight hours
+    C_CHECK = "c_check"  # Every 6000 flight hours
+    D_CHECK = "d_check"  # Every 25000 flight hours
+    COMPONENT = "component"  # Component-specific maintenance
+    UNSCHEDULED = "unscheduled"  # Unscheduled repairs
+
+
+class MaintenanceStatus(Enum):
+    """Status of maintenance tasks."""
+    SCHEDULED = "scheduled"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    OVERDUE = "overdue"
+    CANCELLED = "cancelled"
+
+
+class MaintenanceEventType(Enum):
+    """Deadlines the scheduler emits events for."""
+    WARNING = "warning"  # Advance-warning point reached
+    DUE = "due"  # Scheduled date passed; the task is now overdue
+
+
+@dataclass
+class MaintenanceTask:
+    """Individual maintenance task."""
+    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    aircraft_id: str = ""
+    maintenance_type: MaintenanceType = MaintenanceType.A_CHECK
+    title: str = ""
+    description: str = ""
+    status: MaintenanceStatus = MaintenanceStatus.SCHEDULED
+    
+    # Scheduling
+    scheduled_date: Optional[datetime] = None
+    due_flight_hours: Optional[float] = None
+    
+    # Execution
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    technician: Optional[str] = None
+    notes: str = ""
+    
+    # Component info (for component maintenance)
+    component_id: Optional[str] = None
+    component_name: Optional[str] = None
+    
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "aircraft_id": self.aircraft_id,
+            "maintenance_type": self.maintenance_type.value,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status.value,
+            "scheduled_date": self.scheduled_date.isoformat() if self.scheduled_date else None,
+            "due_flight_hours": self.due_flight_hours,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "technician": self.technician,
+            "notes": self.notes,
+            "component_id": self.component_id,
+            "component_name": self.component_name,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+@dataclass
+class AircraftStatus:
+    """Aircraft operational status."""
+    aircraft_id: str
+    registration: str
+    model: str
+    total_flight_hours: float
+    cycles: int  # Number of takeoff/landing cycles
+    last_a_check: Optional[datetime] = None
+    last_b_check: Optional[datetime] = None
+    last_c_check: Optional[datetime] = None
+    last_d_check: Optional[datetime] = None
+    hours_since_a_check: float = 0
+    hours_since_b_check: float = 0
+    hours_since_c_check: float = 0
+    hours_since_d_check: float = 0
+
+
+@dataclass
+class MaintenanceEvent:
+    """A task reaching one of its deadlines."""
+    event_type: MaintenanceEventType
+    task: MaintenanceTask
+    deadline: datetime
@@ -0,0 +1,206 @@
+"""
+Maintenance repository for Aircraft Tracking System.
+Async SQLAlchemy persistence for maintenance tasks and aircraft status.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import (
+    Column, DateTime, Float, Index, Integer, MetaData, String, Table, Text, select,
+)
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from config.settings import DatabaseConfig
+from src.maintenance.models import (
+    AircraftStatus, MaintenanceStatus, MaintenanceTask, MaintenanceType,
+)
+
+
+logger = logging.getLogger(__name__)
+
+# Schema changes go through Alembic (migrations/); keep both in step
+metadata = MetaData()
+
+maintenance_tasks = Table(
+    "maintenance_tasks",
+    metadata,
+    Column("id", String(36), primary_key=True),
+    Column("aircraft_id", String(32), nullable=False),
+    Column("maintenance_type", String(16), nullable=False),
+    Column("title", String(200), nullable=False, default=""),
+    Column("description", Text, nullable=False, default=""),
+    Column("status", String(16), nullable=False),
+    Column("scheduled_date", DateTime),
+    Column("due_flight_hours", Float),
+    Column("started_at", DateTime),
+    Column("completed_at", DateTime),
+    Column("technician", String(100)),
+    Column("notes", Text, nullable=False, default=""),
+    Column("component_id", String(64)),
+    Column("component_name", String(100)),
+    Column("created_at", DateTime, nullable=False),
+    # Open tasks on restore, fleet-wide and per aircraft
+    Index("ix_maintenance_tasks_status_date", "status", "scheduled_date"),
+    Index("ix_maintenance_tasks_aircraft_status_date", "aircraft_id", "status", "scheduled_date"),
+)
+
+aircraft_status = Table(
+    "aircraft_status",
+    metadata,
+    Column("aircraft_id", String(32), primary_key=True),
+    Column("registration", String(16), nullable=False),
+    Column("model", String(64), nullable=False),
+    Column("total_flight_hours", Float, nullable=False),
+    Column("cycles", Integer, nullable=False),
+    Column("last_a_check", DateTime),
+    Column("last_b_check", DateTime),
+    Column("last_c_check", DateTime),
+    Column("last_d_check", DateTime),
+    Column("hours_since_a_check", Float, nullable=False),
+    Column("hours_since_b_check", Float, nullable=False),
+    Column("hours_since_c_check", Float, nullable=False),
+    Column("hours_since_d_check", Float, nullable=False),
+)
+
+component_usage = Table(
+    "component_usage",
+    metadata,
+    Column("component_id", String(64), primary_key=True),
+    Column("aircraft_id", String(32), nullable=False, index=True),
+    Column("component_name", String(100), nullable=False),
+    Column("interval_hours", Float, nullable=False),
+    Column("interval_cycles", Integer, nullable=False),
+    Column("hours", Float, nullable=False),
+    Column("cycles", Integer, nullable=False),
+)
+
+OPEN_STATUSES = (MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS, MaintenanceStatus.OVERDUE)
+
+
+class MaintenanceRepository:
+    """
+    Stores maintenance tasks and aircraft status.
+
+    Writes are bulk upserts (INSERT ... ON CONFLICT DO UPDATE) sent as one
+    executemany per table, so persisting a round of flight-hour updates is
+    a single statement rather than a query per aircraft. PostgreSQL (asyncpg)
+    is the target; a ``sqlite+aiosqlite`` URL works as a local stand-in.
+    """
+    
+    def __init__(self, config: DatabaseConfig, url: Optional[str] = None):
+        self.config = config
+        self.url = url or config.maintenance_url or config.url
+        self._engine: Optional[AsyncEngine] = None
+        
+    async def start(self) -> None:
+        """Create the engine and check the connection."""
+        options = {} if self.url.startswith("sqlite") else {"pool_size": self.config.pool_size}
+        self._engine = create_async_engine(self.url, pool_pre_ping=True, **options)
+        async with self._engine.connect() as conn:
+            await conn.execute(select(1))
+        logger.info(f"Maintenance repository connected ({self._engine.dialect.name})")
+        
+    async def create_schema(self) -> None:
+        """Create missing tables and indexes (for stand-ins; deployments run ``alembic upgrade head``)."""
+        async with self._engine.begin() as conn:
+            await conn.run_sync(metadata.create_all)
+            
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            
+    # Writes
+    
+    async def save(
+        self,
+        aircraft: Sequence[AircraftStatus] = (),
+        tasks: Sequence[MaintenanceTask] = (),
+        components: Sequence[Dict] = (),
+    ) -> None:
+        """Upsert aircraft status, tasks and component usage records in one transaction."""
+        aircraft_rows = [_aircraft_row(status) for status in aircraft]
+        task_rows = [_task_row(task) for task in tasks]
+        async with self._engine.begin() as conn:
+            if aircraft_rows:
+                await conn.execute(self._upsert(aircraft_status), aircraft_rows)
+            if task_rows:
+                await conn.execute(self._upsert(maintenance_tasks), task_rows)
+            if components:
+                await conn.execute(self._upsert(component_usage), list(components))
+                
+    def _upsert(self, table: Table):
+        """INSERT ... ON CONFLICT (primary key) DO UPDATE for the engine's dialect."""
+        if self._engine.dialect.name == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+            
+        stmt = insert(table)
+        keys = [column.name for column in table.primary_key.columns]
+        return stmt.on_conflict_do_update(
+            index_elements=keys,
+            set_={column.name: stmt.excluded[column.name] for column in table.columns if column.name not in keys},
+        )
+        
+    # Reads
+    
+    async def load_aircraft(self) -> List[AircraftStatus]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(aircraft_status))
+            return [AircraftStatus(**row) for row in result.mappings()]
+            
+    async def load_components(self) -> List[Dict]:
+        """Component usage records (see ComponentUsageTable.record)."""
+        async with self._engine.connect() as conn:
+            result = await conn.execute(select(component_usage))
+            return [dict(row) for row in result.mappings()]
+            
+    async def load_tasks(
+        self,
+        statuses: Optional[Iterable[MaintenanceStatus]] = OPEN_STATUSES,
+        aircraft_id: Optional[str] = None,
+    ) -> List[MaintenanceTask]:
+        """Tasks in creation order; by default only open ones (history stays in the database)."""
+        query = select(maintenance_tasks).order_by(maintenance_tasks.c.created_at, maintenance_tasks.c.id)
+        if statuses is not None:
+            query = query.where(maintenance_tasks.c.status.in_([s.value for s in statuses]))
+        if aircraft_id is not None:
+            query = query.where(maintenance_tasks.c.aircraft_id == aircraft_id)
+        return await self._fetch_tasks(query)
+        
+    async def _fetch_tasks(self, query) -> List[MaintenanceTask]:
+        async with self._engine.connect() as conn:
+            result = await conn.execute(query)
+            return [_task_from_row(row) for row in result.mappings()]
+
+
+def _task_row(task: MaintenanceTask) -> Dict:
+    return {
+        "id": task.id,
+        "aircraft_id": task.aircraft_id,
+        "maintenance_type": task.maintenance_type.value,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "scheduled_date": task.scheduled_date,
+        "due_flight_hours": task.due_flight_hours,
+        "started_at": task.started_at,
+        "completed_at": task.completed_at,
+        "technician": task.technician,
+        "notes": task.notes,
+        "component_id": task.component_id,
+        "component_name": task.component_name,
+        "created_at": task.created_at,
+    }
+
+
+def _task_from_row(row) -> MaintenanceTask:
+    values = dict(row)
+    values["maintenance_type"] = MaintenanceType(values["maintenance_type"])
+    values["status"] = MaintenanceStatus(values["status"])
+    return MaintenanceTask(**values)
+
+
+def _aircraft_row(status: AircraftStatus) -> Dict:
+    return {column.name: getattr(status, column.name) for column in aircraft_status.columns}
@@ -2,100 +2,43 @@
 Maintenance Scheduler for Aircraft Tracking System.
 Automated logging of maintenance schedules and alerts for preventive actions.
 """
+import asyncio
+import itertools
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
-from dataclasses import dataclass, field
-from enum import Enum
-import uuid
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 
-from config.settings import MaintenanceConfig
-
-
-logger = logging.getLogger(__name__)
-
-
-class MaintenanceType(Enum):
-    """Types of aircraft maintenance checks."""
-    A_CHECK = "a_check"  # Every 500 flight hours
-    B_CHECK = "b_check"  # Every 2000 flight hours
-    C_CHECK = "c_check"  # Every 6000 flight hours
-    D_CHECK = "d_check"  # Every 25000 flight hours
-    COMPONENT = "component"  # Component-specific maintenance
-    UNSCHEDULED = "unscheduled"  # Unscheduled repairs
+import numpy as np
 
+from config.settings import MaintenanceConfig
+from src.maintenance.models import (
+    MaintenanceType, MaintenanceStatus, MaintenanceTask, AircraftStatus,
+    MaintenanceEvent, MaintenanceEventType,
+)
+from src.maintenance.task_index import ScheduledPosition, TaskIndex
+from src.maintenance.deadlines import DeadlineQueue
+from src.maintenance.fleet_counters import CHECK_TYPES, FleetCounters
+from src.maintenance.component_usage import ComponentUsageTable
 
-class MaintenanceStatus(Enum):
-    """Status of maintenance tasks."""
-    SCHEDULED = "scheduled"
-    IN_PROGRESS = "in_progress"
-    COMPLETED = "completed"
-    OVERDUE = "overdue"
-    CANCELLED = "cancelled"
+if TYPE_CHECKING:
+    from src.maintenance.repository import MaintenanceRepository
 
 
-@dataclass
-class MaintenanceTask:
-    """Individual maintenance task."""
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    aircraft_id: str = ""
-    maintenance_type: MaintenanceType = MaintenanceType.A_CHECK
-    title: str = ""
-    description: str = ""
-    status: MaintenanceStatus = MaintenanceStatus.SCHEDULED
-    
-    # Scheduling
-    scheduled_date: Optional[datetime] = None
-    due_flight_hours: Optional[float] = None
-    
-    # Execution
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-    technician: Optional[str] = None
-    notes: str = ""
-    
-    # Component info (for component maintenance)
-    component_id: Optional[str] = None
-    component_name: Optional[str] = None
-    
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    
-    def to_dict(self) -> Dict:
-        return {
-            "id": self.id,
-            "aircraft_id": self.aircraft_id,
-            "maintenance_type": self.maintenance_type.value,
-            "title": self.title,
-            "description": self.description,
-            "status": self.status.value,
-            "scheduled_date": self.scheduled_date.isoformat() if self.scheduled_date else None,
-            "due_flight_hours": self.due_flight_hours,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
-            "technician": self.technician,
-            "notes": self.notes,
-            "component_id": self.component_id,
-            "component_name": self.component_name,
-            "created_at": self.created_at.isoformat(),
-        }
+logger = logging.getLogger(__name__)
 
+# Utilisation assumed when projecting remaining flight hours onto dates
+FLIGHT_HOURS_PER_DAY = 8
 
-@dataclass
-class AircraftStatus:
-    """Aircraft operational status."""
-    aircraft_id: str
-    registration: str
-    model: str
-    total_flight_hours: float
-    cycles: int  # Number of takeoff/landing cycles
-    last_a_check: Optional[datetime] = None
-    last_b_check: Optional[datetime] = None
-    last_c_check: Optional[datetime] = None
-    last_d_check: Optional[datetime] = None
-    hours_since_a_check: float = 0
-    hours_since_b_check: float = 0
-    hours_since_c_check: float = 0
-    hours_since_d_check: float = 0
+# Statuses a task may be started, completed or cancelled from
+TASK_TRANSITIONS = {
+    MaintenanceStatus.IN_PROGRESS: (MaintenanceStatus.SCHEDULED, MaintenanceStatus.OVERDUE),
+    MaintenanceStatus.COMPLETED: (
+        MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS, MaintenanceStatus.OVERDUE,
+    ),
+    MaintenanceStatus.CANCELLED: (
+        MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS, MaintenanceStatus.OVERDUE,
+    ),
+}
 
 
 class MaintenanceScheduler:
@@ -107,10 +50,21 @@ class MaintenanceScheduler:
     def __init__(self, config: MaintenanceConfig):
         self.config = config
         
-        # In-memory storage (would use database in production)
-        self._tasks: Dict[str, MaintenanceTask] = {}
+        # Working set, indexed by aircraft/type/status with a due-date heap;
+        # ``restore`` loads it from the repository and ``persist`` writes back
+        self._tasks = TaskIndex()
         self._aircraft_status: Dict[str, AircraftStatus] = {}
         
+        # Tasks and aircraft changed since the last ``persist``
+        self._dirty_tasks: Dict[str, MaintenanceTask] = {}
+        self._dirty_aircraft: Dict[str, AircraftStatus] = {}
+        
+        # Advance-warning and due deadlines of scheduled tasks; ``run``
+        # sleeps until the next one and is woken when an earlier one appears
+        self._deadlines = DeadlineQueue()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wake_at: Optional[datetime] = None
+        
         # Maintenance intervals (flight hours)
         self.check_intervals = {
             MaintenanceType.A_CHECK: config.a_check_hours,
@@ -118,6 +72,10 @@ class MaintenanceScheduler:
             MaintenanceType.C_CHECK: config.c_check_hours,
             MaintenanceType.D_CHECK: config.d_check_hours,
         }
+        self._check_hours = np.array([self.check_intervals[t] for t in CHECK_TYPES], dtype=np.float64)
+        
+        # Hour counters of registered aircraft, as arrays (mirrored on AircraftStatus)
+        self._counters = FleetCounters()
         
         # Component replacement intervals
         self.component_intervals = {
@@ -125,10 +83,16 @@ class MaintenanceScheduler:
             "fuel_filter": config.fuel_filter_hours,
             "brake_pad": config.brake_pad_hours,
         }
+        # Usage of each installed component (keyed by component_id), driving
+        # COMPONENT tasks; every aircraft gets the components above by default
+        self.components = ComponentUsageTable()
         
     def register_aircraft(self, status: AircraftStatus) -> None:
         """Register aircraft for maintenance tracking."""
         self._aircraft_status[status.aircraft_id] = status
+        self._counters.add(status)
+        self._install_default_components(status.aircraft_id)
+        self._dirty_aircraft[status.aircraft_id] = status
         logger.info(f"Registered aircraft {status.registration} for maintenance tracking")
         
     def update_flight_hours(self, aircraft_id: str, hours: float) -> List[MaintenanceTask]:
@@ -136,98 +100,321 @@ class MaintenanceScheduler:
         Update flight hours and check for due maintenance.
         Returns list of newly scheduled tasks.
         """
-        status = self._aircraft_status.get(aircraft_id)
-        if not status:
+        if aircraft_id not in self._counters:
             logger.warning(f"Aircraft {aircraft_id} not registered")
             return []
-            
-        status.total_flight_hours = hours
-        status.hours_since_a_check += hours - status.total_flight_hours
-        status.hours_since_b_check += hours - status.total_flight_hours
-        status.hours_since_c_check += hours - status.total_flight_hours
-        status.hours_since_d_check += hours - status.total_flight_hours
+        return self.bulk_update_flight_hours({aircraft_id: hours})
         
-        # Check for due maintenance
-        new_tasks = self._check_scheduled_maintenance(status)
+    def bulk_update_flight_hours(self, hours: Mapping[str, float]) -> List[MaintenanceTask]:
+        """
+        Set total flight hours for many aircraft (aircraft_id -> hours) and
+        check every aircraft and check type for due maintenance in one
+        vectorized pass. Tasks are created only where a check comes within
+        the advance-warning window and none is pending; returns them.
+        """
+        rows = self._counters.rows(hours)
+        known = rows >= 0
+        if not known.all():
+            unknown = [aircraft_id for aircraft_id, row in zip(hours, rows.tolist()) if row < 0]
+            logger.warning(f"{len(unknown)} aircraft not registered: {', '.join(unknown[:5])}")
+        rows = rows[known]
+        if not len(rows):
+            return []
+            
+        values = np.fromiter(hours.values(), dtype=np.float64, count=len(hours))[known]
+        delta = self._counters.advance(rows, values)
+        self.components.add_usage(rows, delta)
+        for status in self._counters.write_back(rows, self._aircraft_status):
+            self._dirty_aircraft[status.aircraft_id] = status
+            
+        remaining = self._counters.remaining(rows, self._check_hours)
+        hits, columns = np.nonzero(remaining <= self.config.advance_warning_days * FLIGHT_HOURS_PER_DAY)
         
+        new_tasks = []
+        for row, column, left in zip(rows[hits].tolist(), columns.tolist(), remaining[hits, columns].tolist()):
+            task = self._schedule_check(self._counters.aircraft_ids[row], CHECK_TYPES[column], left)
+            if task:
+                new_tasks.append(task)
+        new_tasks.extend(self._schedule_components(rows))
         return new_tasks
         
-    def _check_scheduled_maintenance(self, status: AircraftStatus) -> List[MaintenanceTask]:
-        """Check if any scheduled maintenance is due."""
-        new_tasks = []
+    def add_flight_time(
+        self,
+        hours: Mapping[str, float],
+        cycles: Optional[Mapping[str, int]] = None,
+    ) -> List[MaintenanceTask]:
+        """
+        Add flown hours and takeoff/landing cycles per aircraft (e.g. from
+        the flight tracker), then check for due maintenance in bulk.
+        """
+        for aircraft_id, count in (cycles or {}).items():
+            status = self._aircraft_status.get(aircraft_id)
+            if status:
+                status.cycles += count
+                self._dirty_aircraft[aircraft_id] = status
+        if cycles:
+            rows = self._counters.rows(cycles)
+            counts = np.fromiter(cycles.values(), dtype=np.int64, count=len(cycles))
+            known = rows >= 0
+            self.components.add_usage(rows[known], np.zeros(int(known.sum())), counts[known])
+            
+        totals = {}
+        for aircraft_id, flown in hours.items():
+            status = self._aircraft_status.get(aircraft_id)
+            totals[aircraft_id] = (status.total_flight_hours if status else 0.0) + flown
+        return self.bulk_update_flight_hours(totals)
         
-        checks = [
-            (MaintenanceType.A_CHECK, status.hours_since_a_check),
-            (MaintenanceType.B_CHECK, status.hours_since_b_check),
-            (MaintenanceType.C_CHECK, status.hours_since_c_check),
-            (MaintenanceType.D_CHECK, status.hours_since_d_check),
+    def get_due_checks(self, days_ahead: Optional[float] = None) -> List[Dict]:
+        """
+        Checks projected to fall due within ``days_ahead`` (default: the
+        advance-warning window) across the fleet, soonest first.
+        """
+        if days_ahead is None:
+            days_ahead = self.config.advance_warning_days
+        counters = self._counters
+        rows = np.arange(len(counters))
+        remaining = counters.remaining(rows, self._check_hours)
+        hits, columns = np.nonzero(remaining <= days_ahead * FLIGHT_HOURS_PER_DAY)
+        left = remaining[hits, columns]
+        order = np.argsort(left, kind="stable")
+        return [
+            {
+                "aircraft_id": counters.aircraft_ids[row],
+                "maintenance_type": CHECK_TYPES[column].value,
+                "remaining_hours": hours_left,
+                "estimated_days": hours_left / FLIGHT_HOURS_PER_DAY,
+            }
+            for row, column, hours_left in zip(
+                hits[order].tolist(), columns[order].tolist(), left[order].tolist()
+            )
         ]
         
-        for check_type, hours_since in checks:
-            interval = self.check_intervals[check_type]
-            
-            # Check if approaching maintenance (within advance warning)
-            remaining_hours = interval - hours_since
-            estimated_days = remaining_hours / 8  # Assume 8 flight hours per day
+    def get_hours_since_checks(self) -> Tuple[List[str], np.ndarray]:
+        """
+        Registered aircraft ids and a copy of their hours since each check,
+        one row per aircraft, columns in ``CHECK_TYPES`` order.
+        """
+        counters = self._counters
+        return list(counters.aircraft_ids), counters.hours_since[:len(counters)].copy()
+        
+    def _schedule_check(
+        self,
+        aircraft_id: str,
+        check_type: MaintenanceType,
+        remaining_hours: float,
+    ) -> Optional[MaintenanceTask]:
+        """Create a task for a check coming due unless one is still open (overdue included)."""
+        if self._get_pending_task(aircraft_id, check_type):
+            return None
             
-            if estimated_days <= self.config.advance_warning_days:
-                # Check if task already exists
-                existing = self._get_pending_task(status.aircraft_id, check_type)
+        status = self._aircraft_status[aircraft_id]
+        task = MaintenanceTask(
+            aircraft_id=aircraft_id,
+            maintenance_type=check_type,
+            title=f"{check_type.value.upper().replace('_', ' ')} Due",
+            description=f"Scheduled {check_type.value} maintenance approaching. "
+                        f"Remaining: {remaining_hours:.1f} flight hours",
+            due_flight_hours=status.total_flight_hours + remaining_hours,
+            scheduled_date=datetime.utcnow() + timedelta(days=remaining_hours / FLIGHT_HOURS_PER_DAY),
+        )
+        self._add_task(task)
+        
+        logger.info(
+            f"Scheduled {check_type.value} for aircraft {aircraft_id} "
+            f"at {task.due_flight_hours} hours"
+        )
+        return task
+        
+    # Components
+    
+    def install_component(
+        self,
+        aircraft_id: str,
+        component_id: str,
+        component_name: str,
+        interval_hours: Optional[float] = None,
+        interval_cycles: int = 0,
+        hours: float = 0.0,
+        cycles: int = 0,
+    ) -> bool:
+        """
+        Track a component on a registered aircraft, with the usage it already
+        has. The interval defaults to ``component_intervals[component_name]``.
+        """
+        row = self._counters.rows([aircraft_id])[0]
+        if row < 0:
+            logger.warning(f"Aircraft {aircraft_id} not registered")
+            return False
+        if interval_hours is None:
+            interval_hours = self.component_intervals[component_name]
+        self.components.install(
+            component_id, component_name, aircraft_id, int(row),
+            interval_hours, interval_cycles, hours, cycles,
+        )
+        return True
+        
+    def _install_default_components(self, aircraft_id: str) -> None:
+        for name in self.component_intervals:
+            component_id = f"{aircraft_id}:{name}"
+            if component_id not in self.components:
+                self.install_component(aircraft_id, component_id, name)
                 
-                if not existing:
-                    task = MaintenanceTask(
-                        aircraft_id=status.aircraft_id,
-                        maintenance_type=check_type,
-                        title=f"{check_type.value.upper().replace('_', ' ')} Due",
-                        description=f"Scheduled {check_type.value} maintenance approaching. "
-                                    f"Remaining: {remaining_hours:.1f} flight hours",
-                        due_flight_hours=status.total_flight_hours + remaining_hours,
-                        scheduled_date=datetime.utcnow() + timedelta(days=estimated_days),
-                    )
-                    self._tasks[task.id] = task
-                    new_tasks.append(task)
-                    
-                    logger.info(
-                        f"Scheduled {check_type.value} for aircraft {status.aircraft_id} "
-                        f"at {task.due_flight_hours} hours"
-                    )
-                    
+    def get_due_components(self, horizon_hours: Optional[float] = None) -> List[Dict]:
+        """
+        Components with at most ``horizon_hours`` (default: the advance-warning
+        window) left, or at their cycle limit, across the fleet, soonest first.
+        """
+        if horizon_hours is None:
+            horizon_hours = self.config.advance_warning_days * FLIGHT_HOURS_PER_DAY
+        return [self.components.record(row) for row in self.components.due(horizon_hours).tolist()]
+        
+    def _schedule_components(self, aircraft_rows: np.ndarray) -> List[MaintenanceTask]:
+        """COMPONENT tasks for components of these aircraft coming due, one open task per component."""
+        components = self.components
+        horizon = self.config.advance_warning_days * FLIGHT_HOURS_PER_DAY
+        new_tasks = []
+        for row in components.due(horizon, aircraft_rows=aircraft_rows).tolist():
+            aircraft_id = components.aircraft_ids[row]
+            component_id = components.component_ids[row]
+            if self._get_pending_task(aircraft_id, MaintenanceType.COMPONENT, component_id):
+                continue
+                
+            name = components.component_names[row]
+            remaining_hours = components.remaining_hours(row)
+            task = MaintenanceTask(
+                aircraft_id=aircraft_id,
+                maintenance_type=MaintenanceType.COMPONENT,
+                title=f"{name.replace('_', ' ').title()} Replacement Due",
+                description=f"Component {component_id} replacement approaching. "
+                            f"Remaining: {remaining_hours:.1f} flight hours",
+                due_flight_hours=self._aircraft_status[aircraft_id].total_flight_hours + remaining_hours,
+                scheduled_date=datetime.utcnow() + timedelta(days=remaining_hours / FLIGHT_HOURS_PER_DAY),
+                component_id=component_id,
+                component_name=name,
+            )
+            self._add_task(task)
+            new_tasks.append(task)
+            logger.info(f"Scheduled replacement of {component_id} at {task.due_flight_hours:.1f} hours")
         return new_tasks
         
     def _get_pending_task(
         self, 
         aircraft_id: str, 
-        maintenance_type: MaintenanceType
+        maintenance_type: MaintenanceType,
+        component_id: Optional[str] = None,
     ) -> Optional[MaintenanceTask]:
-        """Get pending task of specific type for aircraft."""
-        for task in self._tasks.values():
-            if (task.aircraft_id == aircraft_id and 
-                task.maintenance_type == maintenance_type and
-                task.status in [MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS]):
-                return task
-        return None
+        """Get pending task of specific type (and component) for aircraft."""
+        return self._tasks.pending(aircraft_id, maintenance_type, component_id)
+        
+    def _add_task(self, task: MaintenanceTask) -> None:
+        self._tasks.add(task)
+        self._schedule_deadlines(task)
+        self._dirty_tasks[task.id] = task
+        
+    def _set_status(self, task: MaintenanceTask, status: MaintenanceStatus) -> None:
+        task.status = status
+        self._tasks.reindex(task)
+        self._schedule_deadlines(task)
+        self._dirty_tasks[task.id] = task
         
+    def _schedule_deadlines(self, task: MaintenanceTask) -> None:
+        """(Re)arm the task's warning and due deadlines, or drop them if it is no longer scheduled."""
+        if task.status != MaintenanceStatus.SCHEDULED or task.scheduled_date is None:
+            self._deadlines.cancel(task.id)
+            return
+            
+        deadlines = [(task.scheduled_date, MaintenanceEventType.DUE)]
+        warn_at = task.scheduled_date - timedelta(days=self.config.advance_warning_days)
+        if warn_at > datetime.utcnow():
+            deadlines.append((warn_at, MaintenanceEventType.WARNING))
+        self._deadlines.set(task.id, deadlines)
+        
+        earliest = min(deadline for deadline, _ in deadlines)
+        if self._wakeup is not None and (self._wake_at is None or earliest < self._wake_at):
+            self._wakeup.set()
+            
     def create_task(self, task: MaintenanceTask) -> MaintenanceTask:
         """Create new maintenance task."""
-        self._tasks[task.id] = task
+        self._add_task(task)
         logger.info(f"Created maintenance task: {task.title}")
         return task
         
-    def start_task(self, task_id: str, technician: str) -> Optional[MaintenanceTask]:
-        """Start maintenance task."""
+    def reschedule_task(self, task_id: str, scheduled_date: datetime) -> Optional[MaintenanceTask]:
+        """Move a scheduled or overdue task to a new date."""
+        task = self._tasks.get(task_id)
+        if task and task.status in (MaintenanceStatus.SCHEDULED, MaintenanceStatus.OVERDUE):
+            task.scheduled_date = scheduled_date
+            self._set_status(task, MaintenanceStatus.SCHEDULED)
+            logger.info(f"Rescheduled task {task_id} to {scheduled_date.isoformat()}")
+        return task
+        
+    def can_transition(self, task: MaintenanceTask, status: MaintenanceStatus) -> bool:
+        """Whether the task may be started, completed or cancelled (``status``) now."""
+        return task.status in TASK_TRANSITIONS.get(status, ())
+        
+    def cancel_task(self, task_id: str) -> Optional[MaintenanceTask]:
+        """Cancel a task that is not completed yet."""
+        task = self._tasks.get(task_id)
+        if task and self.can_transition(task, MaintenanceStatus.CANCELLED):
+            self._set_status(task, MaintenanceStatus.CANCELLED)
+            logger.info(f"Cancelled task {task_id}")
+        return task
+        
+    def update_task(
+        self,
+        task_id: str,
+        technician: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> Optional[MaintenanceTask]:
+        """Change a task's technician or notes."""
         task = self._tasks.get(task_id)
         if task:
-            task.status = MaintenanceStatus.IN_PROGRESS
+            if technician is not None:
+                task.technician = technician
+            if notes is not None:
+                task.notes = notes
+            self._dirty_tasks[task.id] = task
+        return task
+        
+    def get_task(self, task_id: str) -> Optional[MaintenanceTask]:
+        return self._tasks.get(task_id)
+        
+    def get_tasks(
+        self,
+        aircraft_id: Optional[str] = None,
+        status: Optional[MaintenanceStatus] = None,
+        maintenance_type: Optional[MaintenanceType] = None,
+        after: int = -1,
+        limit: Optional[int] = None,
+    ) -> List[MaintenanceTask]:
+        """
+        Tasks matching the given filters, in creation order, created after
+        the task whose ``task_sequence`` is ``after``; at most ``limit``.
+        """
+        return self._tasks.page(aircraft_id, maintenance_type, status, after, limit)
+        
+    def task_sequence(self, task_id: str) -> int:
+        """Position of a task in ``get_tasks`` order (to resume after it)."""
+        return self._tasks.sequence(task_id)
+        
+    def get_aircraft_status(self, aircraft_id: str) -> Optional[AircraftStatus]:
+        return self._aircraft_status.get(aircraft_id)
+        
+    def start_task(self, task_id: str, technician: str) -> Optional[MaintenanceTask]:
+        """Start a scheduled or overdue maintenance task."""
+        task = self._tasks.get(task_id)
+        if task and self.can_transition(task, MaintenanceStatus.IN_PROGRESS):
+            self._set_status(task, MaintenanceStatus.IN_PROGRESS)
             task.started_at = datetime.utcnow()
             task.technician = technician
             logger.info(f"Started task {task_id} by {technician}")
         return task
         
     def complete_task(self, task_id: str, notes: str = "") -> Optional[MaintenanceTask]:
-        """Complete maintenance task."""
+        """Complete a maintenance task that is not completed or cancelled yet."""
         task = self._tasks.get(task_id)
-        if task:
-            task.status = MaintenanceStatus.COMPLETED
+        if task and self.can_transition(task, MaintenanceStatus.COMPLETED):
+            self._set_status(task, MaintenanceStatus.COMPLETED)
             task.completed_at = datetime.utcnow()
             task.notes = notes
             
@@ -246,43 +433,171 @@ class MaintenanceScheduler:
                 elif task.maintenance_type == MaintenanceType.D_CHECK:
                     status.last_d_check = task.completed_at
                     status.hours_since_d_check = 0
-                    
+                self._counters.reset(status.aircraft_id, task.maintenance_type)
+                self._dirty_aircraft[status.aircraft_id] = status
+            elif task.maintenance_type == MaintenanceType.COMPONENT and task.component_id:
+                self.components.reset(task.component_id)
+                
             logger.info(f"Completed task {task_id}")
         return task
         
+    # Persistence
+    
+    def restore(
+        self,
+        aircraft: Iterable[AircraftStatus],
+        tasks: Iterable[MaintenanceTask],
+        components: Iterable[Dict] = (),
+    ) -> None:
+        """
+        Load persisted state (tasks in creation order, component usage
+        records); nothing is marked for writing except default components
+        an aircraft did not have yet.
+        """
+        for status in aircraft:
+            self._aircraft_status[status.aircraft_id] = status
+            self._counters.add(status)
+        for record in components:
+            self.install_component(
+                record["aircraft_id"], record["component_id"], record["component_name"],
+                record["interval_hours"], record["interval_cycles"], record["hours"], record["cycles"],
+            )
+        self.components.take_dirty()
+        for aircraft_id in self._aircraft_status:
+            self._install_default_components(aircraft_id)
+        for task in tasks:
+            self._tasks.add(task)
+            self._schedule_deadlines(task)
+        logger.info(f"Restored {len(self._aircraft_status)} aircraft and {len(self._tasks)} maintenance tasks")
+        
+    async def persist(self, repository: "MaintenanceRepository") -> int:
+        """
+        Write tasks and aircraft changed since the last call as bulk upserts.
+        Returns the rows written; on failure the changes stay pending.
+        """
+        tasks, aircraft = self._dirty_tasks, self._dirty_aircraft
+        components = self.components.take_dirty()
+        if not tasks and not aircraft and not components:
+            return 0
+        self._dirty_tasks, self._dirty_aircraft = {}, {}
+        try:
+            await repository.save(list(aircraft.values()), list(tasks.values()), components)
+        except Exception:
+            # Changes made meanwhile are already pending again; restore the rest
+            for task_id, task in tasks.items():
+                self._dirty_tasks.setdefault(task_id, task)
+            for aircraft_id, status in aircraft.items():
+                self._dirty_aircraft.setdefault(aircraft_id, status)
+            self.components.mark_dirty([record["component_id"] for record in components])
+            raise
+        return len(tasks) + len(aircraft) + len(components)
+        
     def get_upcoming_maintenance(
         self, 
         aircraft_id: Optional[str] = None,
-        days_ahead: int = 30
+        days_ahead: int = 30,
+        after: Optional[ScheduledPosition] = None,
+        limit: Optional[int] = None,
     ) -> List[MaintenanceTask]:
-        """Get upcoming maintenance tasks."""
+        """
+        Get upcoming maintenance tasks (date order, undated last), after the
+        ``upcoming_position`` ``after``; at most ``limit``.
+        """
         cutoff = datetime.utcnow() + timedelta(days=days_ahead)
         
-        tasks = [
-            t for t in self._tasks.values()
-            if t.status == MaintenanceStatus.SCHEDULED
-            and (aircraft_id is None or t.aircraft_id == aircraft_id)
-            and (t.scheduled_date is None or t.scheduled_date <= cutoff)
-        ]
+        if aircraft_id is None:
+            # Walk the due-date heap up to the cutoff
+            return list(itertools.islice(self._tasks.scheduled(until=cutoff, after=after), limit))
+            
+        position = self._tasks.scheduled_position
+        tasks = sorted(
+            (
+                t for t in self._tasks.find(aircraft_id, status=MaintenanceStatus.SCHEDULED)
+                if (t.scheduled_date is None or t.scheduled_date <= cutoff)
+                and (after is None or position(t.id) > after)
+            ),
+            key=lambda t: position(t.id),
+        )
+        return tasks[:limit]
         
-        return sorted(tasks, key=lambda t: t.scheduled_date or datetime.max)
+    def upcoming_position(self, task_id: str) -> ScheduledPosition:
+        """Position of a scheduled task in ``get_upcoming_maintenance`` order."""
+        return self._tasks.scheduled_position(task_id)
         
     def get_overdue_maintenance(
         self, 
         aircraft_id: Optional[str] = None
     ) -> List[MaintenanceTask]:
-        """Get overdue maintenance tasks."""
+        """
+        Get newly overdue maintenance tasks (marked OVERDUE), earliest first.
+        Fleet-wide, only the due entries are popped from the date heap.
+        """
         now = datetime.utcnow()
         
-        overdue = []
-        for task in self._tasks.values():
-            if task.status != MaintenanceStatus.SCHEDULED:
+        if aircraft_id is None:
+            overdue = self._tasks.pop_due(now)
+        else:
+            overdue = sorted(
+                (
+                    t for t in self._tasks.find(aircraft_id, status=MaintenanceStatus.SCHEDULED)
+                    if t.scheduled_date and t.scheduled_date < now
+                ),
+                key=lambda t: t.scheduled_date,
+            )
+            
+        for task in overdue:
+            self._set_status(task, MaintenanceStatus.OVERDUE)
+            
+        return overdue
+        
+    def pop_due_events(self, now: Optional[datetime] = None) -> List[MaintenanceEvent]:
+        """
+        Events for deadlines passed by now. Tasks reaching their due date
+        are marked OVERDUE; a warning that is already past due is skipped.
+        """
+        now = now or datetime.utcnow()
+        events = []
+        for task_id, event_type, deadline in self._deadlines.pop_due(now):
+            task = self._tasks.get(task_id)
+            if task is None:
                 continue
-            if aircraft_id and task.aircraft_id != aircraft_id:
+            if event_type == MaintenanceEventType.DUE:
+                self._set_status(task, MaintenanceStatus.OVERDUE)
+            elif task.scheduled_date <= now:
                 continue
-                
-            if task.scheduled_date and task.scheduled_date < now:
-                task.status = MaintenanceStatus.OVERDUE
-                overdue.append(task)
-                
-        return overdue
+            events.append(MaintenanceEvent(event_type, task, deadline))
+        return events
+        
+    async def run(
+        self,
+        on_event: Callable[[MaintenanceEvent], None],
+        max_sleep: float = 3600.0,
+    ) -> None:
+        """
+        Emit events as task deadlines pass. Sleeps until the next deadline,
+        waking early when a new task or reschedule brings one forward.
+        ``max_sleep`` bounds each sleep so wall-clock changes are picked up.
+        """
+        self._wakeup = asyncio.Event()
+        try:
+            while True:
+                for event in self.pop_due_events():
+                    try:
+                        on_event(event)
+                    except Exception as e:
+                        logger.error(f"Maintenance event callback error: {e}")
+                        
+                self._wake_at = self._deadlines.next_deadline()
+                timeout = max_sleep
+                if self._wake_at is not None:
+                    remaining = (self._wake_at - datetime.utcnow()).total_seconds()
+                    timeout = min(max_sleep, max(0.0, remaining))
+                    
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._wakeup = None
+            self._wake_at = None
@@ -0,0 +1,252 @@
+"""
+Fleet maintenance simulation for Aircraft Tracking System.
+Vectorized what-if projection of check workload over years of operation.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+from config.settings import MaintenanceConfig
+from src.maintenance.fleet_counters import CHECK_COLUMNS, CHECK_TYPES
+from src.maintenance.models import MaintenanceType
+from src.maintenance.scheduler import FLIGHT_HOURS_PER_DAY
+
+if TYPE_CHECKING:
+    from src.maintenance.scheduler import MaintenanceScheduler
+
+
+DAYS_PER_WEEK = 7
+WEEKS_PER_YEAR = 52
+
+# Checks per week: one shared limit, or per check type (missing types unlimited)
+HangarCapacity = Union[int, Mapping[MaintenanceType, int]]
+
+
+@dataclass
+class SimulationResult:
+    """Per-week check workload of one simulation run; arrays are (weeks, checks)."""
+    start: datetime
+    aircraft: int
+    due: np.ndarray  # Checks falling due
+    performed: np.ndarray  # Checks given a hangar slot
+    backlog: np.ndarray  # Checks waiting for a slot at the end of the week
+    delay_weeks: np.ndarray  # Weeks waited by the checks performed
+    grounded: np.ndarray  # (weeks,) aircraft waiting for a check at the end of the week
+    flight_hours: np.ndarray  # (weeks,) fleet hours flown
+    
+    @property
+    def weeks(self) -> int:
+        return len(self.due)
+        
+    def week_start(self, week: int) -> datetime:
+        return self.start + timedelta(weeks=week)
+        
+    def workload(self, check_type: Optional[MaintenanceType] = None) -> np.ndarray:
+        """Checks performed per week, of one type or all."""
+        if check_type is None:
+            return self.performed.sum(axis=1)
+        return self.performed[:, CHECK_COLUMNS[check_type]]
+        
+    def to_rows(self) -> List[Dict]:
+        """The weekly workload table, one dict per week."""
+        rows = []
+        for week in range(self.weeks):
+            row = {"week_start": self.week_start(week).date().isoformat()}
+            for column, check_type in enumerate(CHECK_TYPES):
+                name = check_type.value
+                row[f"{name}_due"] = int(self.due[week, column])
+                row[f"{name}_performed"] = int(self.performed[week, column])
+                row[f"{name}_backlog"] = int(self.backlog[week, column])
+            row["grounded"] = int(self.grounded[week])
+            row["flight_hours"] = float(self.flight_hours[week])
+            rows.append(row)
+        return rows
+        
+    def summary(self) -> Dict:
+        """Totals, peak weekly load and waiting time per check type."""
+        performed = self.performed.sum(axis=0)
+        delay = np.divide(self.delay_weeks, performed, out=np.zeros(len(CHECK_TYPES)), where=performed > 0)
+        return {
+            "weeks": self.weeks,
+            "aircraft": self.aircraft,
+            "flight_hours": float(self.flight_hours.sum()),
+            "peak_weekly_checks": int(self.workload().max(initial=0)),
+            "max_grounded": int(self.grounded.max(initial=0)),
+            "checks": {
+                check_type.value: {
+                    "due": int(self.due[:, column].sum()),
+                    "performed": int(performed[column]),
+                    "peak_weekly": int(self.performed[:, column].max(initial=0)),
+                    "max_backlog": int(self.backlog[:, column].max(initial=0)),
+                    "mean_delay_weeks": float(delay[column]),
+                }
+                for column, check_type in enumerate(CHECK_TYPES)
+            },
+        }
+
+
+class FleetSimulation:
+    """
+    Projects A/B/C/D-check due dates for a whole fleet over years.
+
+    The state is the scheduler's hours-since-check matrix (one row per
+    aircraft, one column per check type) and the fleet is advanced a week
+    at a time in NumPy, so a run costs one array pass per week rather than
+    an ``update_flight_hours`` call per aircraft per day.
+
+    The scheduler's rules apply: a check falls due when the hours since it
+    reach its interval in ``MaintenanceConfig``, and performing it resets
+    only that check's counter. An aircraft with a check due stops flying
+    until the check gets a hangar slot. Without a capacity limit every
+    check is performed in the week it falls due and the aircraft flies the
+    rest of that week. Otherwise waiting checks get the week's slots
+    oldest first, heavier check first within a week. An aircraft released
+    mid-week flies on, and a check it reaches then is due that same week
+    (and gets any slot still free).
+    """
+    
+    def __init__(
+        self,
+        config: MaintenanceConfig,
+        aircraft_ids: Sequence[str],
+        hours_since: np.ndarray,
+        hours_per_day: Union[float, np.ndarray] = FLIGHT_HOURS_PER_DAY,
+    ):
+        self.config = config
+        self.aircraft_ids = list(aircraft_ids)
+        self.hours_since = np.array(hours_since, dtype=np.float64).reshape(len(self.aircraft_ids), len(CHECK_TYPES))
+        self.hours_per_day = np.broadcast_to(
+            np.asarray(hours_per_day, dtype=np.float64), (len(self.aircraft_ids),)
+        ).copy()
+        self.intervals = np.array([
+            config.a_check_hours, config.b_check_hours, config.c_check_hours, config.d_check_hours,
+        ], dtype=np.float64)
+        
+    @classmethod
+    def from_scheduler(
+        cls,
+        scheduler: "MaintenanceScheduler",
+        hours_per_day: Union[float, np.ndarray] = FLIGHT_HOURS_PER_DAY,
+    ) -> "FleetSimulation":
+        """Start from the registered fleet's current hours since each check."""
+        aircraft_ids, hours_since = scheduler.get_hours_since_checks()
+        return cls(scheduler.config, aircraft_ids, hours_since, hours_per_day)
+        
+    def run(
+        self,
+        years: float = 10.0,
+        utilization: float = 1.0,
+        hangar_capacity: Optional[HangarCapacity] = None,
+        start: Optional[datetime] = None,
+    ) -> SimulationResult:
+        """
+        Simulate ``years`` of operation with daily flight hours scaled by
+        ``utilization`` (1.2 = +20%) and at most ``hangar_capacity`` checks
+        started per week. The simulation's own state is not modified.
+        """
+        weeks = int(round(years * WEEKS_PER_YEAR))
+        n, checks = self.hours_since.shape
+        intervals = self.intervals
+        weekly_hours = self.hours_per_day * utilization * DAYS_PER_WEEK
+        slots = self._slots(hangar_capacity)
+        
+        hours_since = np.minimum(self.hours_since, intervals)
+        # Week each check fell due, -1 while it is not waiting; checks
+        # already at their interval wait from week 0
+        waiting_since = np.where(hours_since >= intervals, 0, -1)
+        priority = np.arange(checks)[::-1]  # Heavier checks first within a week
+        
+        due = np.zeros((weeks, checks), dtype=np.int64)
+        performed = np.zeros((weeks, checks), dtype=np.int64)
+        backlog = np.zeros((weeks, checks), dtype=np.int64)
+        delay_weeks = np.zeros(checks, dtype=np.float64)
+        grounded = np.zeros(weeks, dtype=np.int64)
+        flight_hours = np.zeros(weeks, dtype=np.float64)
+        
+        for week in range(weeks):
+            left = weekly_hours.copy()  # Hours each aircraft may still fly this week
+            free = slots.copy() if isinstance(slots, np.ndarray) else slots
+            if week == 0:
+                due[week] += (self.hours_since >= intervals).sum(axis=0)
+                
+            # Fly until the week ends or the next check falls due, give
+            # waiting checks hangar slots, and let released aircraft fly on
+            while True:
+                flying = (waiting_since < 0).all(axis=1)
+                room = (intervals - hours_since).min(axis=1)
+                flown = np.where(flying, np.minimum(left, room), 0.0)
+                hours_since += flown[:, None]
+                left -= flown
+                flight_hours[week] += float(flown.sum())
+                
+                new_due = (hours_since >= intervals) & (waiting_since < 0)
+                waiting_since[new_due] = week
+                due[week] += new_due.sum(axis=0)
+                
+                rows, columns = self._allocate(waiting_since, free, priority)
+                if not len(rows):
+                    break
+                used = np.bincount(columns, minlength=checks)
+                performed[week] += used
+                delay_weeks += np.bincount(
+                    columns, weights=week - waiting_since[rows, columns], minlength=checks
+                )
+                hours_since[rows, columns] = 0.0
+                waiting_since[rows, columns] = -1
+                if free is not None:
+                    free = free - (used if np.ndim(free) else len(rows))
+                    
+            waiting = waiting_since >= 0
+            backlog[week] = waiting.sum(axis=0)
+            grounded[week] = int(waiting.any(axis=1).sum())
+            
+        return SimulationResult(
+            start=start or datetime.utcnow(),
+            aircraft=n,
+            due=due,
+            performed=performed,
+            backlog=backlog,
+            delay_weeks=delay_weeks,
+            grounded=grounded,
+            flight_hours=flight_hours,
+        )
+        
+    @staticmethod
+    def _allocate(
+        waiting_since: np.ndarray,
+        free: Optional[Union[int, np.ndarray]],
+        priority: np.ndarray,
+    ):
+        """
+        Waiting checks that get one of the ``free`` slots (all of them if
+        None), oldest first, heavier check first within a week; returns
+        their (rows, columns).
+        """
+        rows, columns = np.nonzero(waiting_since >= 0)
+        if free is None or not len(rows):
+            return rows, columns
+        order = np.lexsort((priority[columns], waiting_since[rows, columns]))
+        rows, columns = rows[order], columns[order]
+        if np.ndim(free) == 0:
+            keep = np.arange(len(rows)) < free
+        else:
+            # Rank of each check among the waiting checks of its type
+            ranks = np.zeros(len(rows), dtype=np.int64)
+            for column in range(waiting_since.shape[1]):
+                of_type = columns == column
+                ranks[of_type] = np.arange(int(of_type.sum()))
+            keep = ranks < free[columns]
+        return rows[keep], columns[keep]
+        
+    def _slots(self, hangar_capacity: Optional[HangarCapacity]) -> Optional[Union[int, np.ndarray]]:
+        """Weekly slots as one int, per check column, or None (unlimited)."""
+        if hangar_capacity is None:
+            return None
+        if isinstance(hangar_capacity, Mapping):
+            slots = np.full(len(CHECK_TYPES), np.iinfo(np.int64).max, dtype=np.int64)
+            for check_type, capacity in hangar_capacity.items():
+                slots[CHECK_COLUMNS[check_type]] = capacity
+            return slots
+        return int(hangar_capacity)
@@ -0,0 +1,356 @@
+"""
+Maintenance task index for Aircraft Tracking System.
+Secondary indexes and a due-date heap over the scheduler's tasks.
+"""
+import bisect
+import heapq
+import itertools
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.maintenance.models import MaintenanceStatus, MaintenanceTask, MaintenanceType
+
+
+# (aircraft_id, maintenance_type, status)
+TaskKey = Tuple[str, MaintenanceType, MaintenanceStatus]
+# (aircraft_id, maintenance_type, component_id)
+PendingKey = Tuple[str, MaintenanceType, Optional[str]]
+# (scheduled_date, heap entry number); undated tasks: (datetime.max, creation number)
+ScheduledPosition = Tuple[datetime, int]
+
+# Tasks still open: a check or component with one of these is not scheduled again
+PENDING_STATUSES = (MaintenanceStatus.SCHEDULED, MaintenanceStatus.IN_PROGRESS, MaintenanceStatus.OVERDUE)
+
+
+class TaskIndex:
+    """
+    Task store indexed by id, by (aircraft, type, status), by aircraft and by
+    status, with a min-heap of scheduled tasks ordered by ``scheduled_date``.
+
+    Tasks are mutable, so the index keeps the key each task is filed under;
+    after changing a task's status or date, call ``reindex`` to move it.
+    Heap entries are invalidated lazily: an entry counts only while it is
+    the task's current one and the task is still scheduled.
+
+    For paging, the aircraft, status and type indexes also keep their tasks'
+    creation numbers in ascending lists, so ``page`` resumes with a bisect
+    and costs O(limit) rather than a sort of every match. Entries of tasks
+    that moved to another status are skipped and dropped the same lazy way.
+    Heap entries are mirrored in a date-sorted list, so ``scheduled`` pages
+    resume with a bisect too.
+    """
+    
+    def __init__(self):
+        self._tasks: Dict[str, MaintenanceTask] = {}
+        self._created: Dict[str, int] = {}  # Insertion order
+        self._created_counter = itertools.count()
+        self._keys: Dict[str, TaskKey] = {}
+        # Insertion-ordered id sets (dicts with None values)
+        self._by_key: Dict[TaskKey, Dict[str, None]] = {}
+        self._by_aircraft: Dict[str, Dict[str, None]] = {}
+        self._by_status: Dict[MaintenanceStatus, Dict[str, None]] = {
+            status: {} for status in MaintenanceStatus
+        }
+        self._by_type: Dict[MaintenanceType, Dict[str, None]] = {
+            maintenance_type: {} for maintenance_type in MaintenanceType
+        }
+        
+        # Ascending creation numbers per index, for ``page``
+        self._ids: Dict[int, str] = {}
+        self._order: List[int] = []
+        self._order_by_aircraft: Dict[str, List[int]] = {}
+        self._order_by_status: Dict[MaintenanceStatus, List[int]] = {status: [] for status in MaintenanceStatus}
+        self._order_by_type: Dict[MaintenanceType, List[int]] = {
+            maintenance_type: [] for maintenance_type in MaintenanceType
+        }
+        # Scheduled, in-progress or overdue tasks per (aircraft_id, maintenance_type, component_id)
+        self._pending: Dict[PendingKey, Dict[str, None]] = {}
+        
+        # (scheduled_date, entry number, task id) for scheduled, dated tasks
+        self._heap: List[Tuple[datetime, int, str]] = []
+        # Task id -> (entry number, date) of its current heap entry
+        self._heap_entry: Dict[str, Tuple[int, datetime]] = {}
+        # The same entries sorted by (scheduled_date, entry number), for paging
+        self._by_date: List[Tuple[datetime, int, str]] = []
+        self._entry_counter = itertools.count()
+        # Scheduled tasks without a date
+        self._undated: Dict[str, None] = {}
+        
+    def __len__(self) -> int:
+        return len(self._tasks)
+        
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._tasks
+        
+    def __iter__(self) -> Iterator[MaintenanceTask]:
+        return iter(self._tasks.values())
+        
+    def get(self, task_id: str) -> Optional[MaintenanceTask]:
+        return self._tasks.get(task_id)
+        
+    def add(self, task: MaintenanceTask) -> None:
+        created = next(self._created_counter)
+        self._tasks[task.id] = task
+        self._created[task.id] = created
+        self._ids[created] = task.id
+        self._order.append(created)
+        self._order_by_aircraft.setdefault(task.aircraft_id, []).append(created)
+        self._order_by_type[task.maintenance_type].append(created)
+        self._by_type[task.maintenance_type][task.id] = None
+        self.reindex(task)
+        
+    def sequence(self, task_id: str) -> int:
+        """Creation number of the task (the position ``page`` resumes after)."""
+        return self._created[task_id]
+        
+    def reindex(self, task: MaintenanceTask) -> None:
+        """File task under its current status and scheduled date."""
+        key = (task.aircraft_id, task.maintenance_type, task.status)
+        previous = self._keys.get(task.id)
+        if previous != key:
+            if previous is not None:
+                self._unfile(task, previous)
+            self._keys[task.id] = key
+            self._by_key.setdefault(key, {})[task.id] = None
+            self._by_aircraft.setdefault(task.aircraft_id, {})[task.id] = None
+            self._by_status[task.status][task.id] = None
+            if previous is None or previous[2] != task.status:
+                order = self._order_by_status[task.status]
+                created = self._created[task.id]
+                if order and order[-1] > created:
+                    bisect.insort(order, created)
+                else:
+                    order.append(created)
+            if task.status in PENDING_STATUSES:
+                self._pending.setdefault(_pending_key(task), {})[task.id] = None
+                
+        self._undated.pop(task.id, None)
+        if task.status != MaintenanceStatus.SCHEDULED:
+            if self._heap_entry.pop(task.id, None) is not None:
+                self._compact_dates()
+        elif task.scheduled_date is None:
+            self._heap_entry.pop(task.id, None)
+            self._undated[task.id] = None
+        else:
+            entry = self._heap_entry.get(task.id)
+            if entry is None or entry[1] != task.scheduled_date:
+                self._push(task)
+                
+    def remove(self, task_id: str) -> Optional[MaintenanceTask]:
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+        self._unfile(task, self._keys.pop(task_id))
+        del self._ids[self._created.pop(task_id)]
+        del self._by_type[task.maintenance_type][task_id]
+        self._compact(self._order, self._tasks)
+        self._compact(self._order_by_type[task.maintenance_type], self._by_type[task.maintenance_type])
+        if task.aircraft_id in self._by_aircraft:
+            self._compact(self._order_by_aircraft[task.aircraft_id], self._by_aircraft[task.aircraft_id])
+        else:
+            del self._order_by_aircraft[task.aircraft_id]
+        self._heap_entry.pop(task_id, None)
+        self._compact_dates()
+        self._undated.pop(task_id, None)
+        return task
+        
+    def _unfile(self, task: MaintenanceTask, key: TaskKey) -> None:
+        """Remove task from the indexes it is filed under as key."""
+        task_id = task.id
+        self._discard(self._by_key, key, task_id)
+        self._discard(self._by_aircraft, key[0], task_id)
+        del self._by_status[key[2]][task_id]
+        self._compact(self._order_by_status[key[2]], self._by_status[key[2]])
+        if key[2] in PENDING_STATUSES:
+            self._discard(self._pending, _pending_key(task), task_id)
+            
+    def _compact(self, order: List[int], members: Dict[str, object]) -> None:
+        """Drop entries of tasks no longer in an index (and repeats) once they are half of it."""
+        if len(order) > 2 * len(members) + 64:
+            ids = self._ids
+            kept = []
+            for created in order:
+                if ids.get(created) in members and (not kept or kept[-1] != created):
+                    kept.append(created)
+            order[:] = kept
+            
+    @staticmethod
+    def _discard(index: Dict, key, task_id: str) -> None:
+        ids = index[key]
+        del ids[task_id]
+        if not ids:
+            del index[key]
+            
+    def _push(self, task: MaintenanceTask) -> None:
+        entry = next(self._entry_counter)
+        self._heap_entry[task.id] = (entry, task.scheduled_date)
+        item = (task.scheduled_date, entry, task.id)
+        heapq.heappush(self._heap, item)
+        if self._by_date and self._by_date[-1] > item:
+            bisect.insort(self._by_date, item)
+        else:
+            self._by_date.append(item)
+        # Drop invalidated entries once they dominate the heap
+        if len(self._heap) > 2 * len(self._heap_entry) + 64:
+            self._heap = [item for item in self._heap if self._valid(item)]
+            heapq.heapify(self._heap)
+        self._compact_dates()
+        
+    def _compact_dates(self) -> None:
+        """Drop invalidated date-sorted entries once they are half of the list."""
+        if len(self._by_date) > 2 * len(self._heap_entry) + 64:
+            self._by_date = [item for item in self._by_date if self._valid(item)]
+            
+    def _valid(self, item: Tuple[datetime, int, str]) -> bool:
+        entry = self._heap_entry.get(item[2])
+        return entry is not None and entry[0] == item[1]
+        
+    # Lookups
+    
+    def find(
+        self,
+        aircraft_id: Optional[str] = None,
+        maintenance_type: Optional[MaintenanceType] = None,
+        status: Optional[MaintenanceStatus] = None,
+    ) -> List[MaintenanceTask]:
+        """Tasks matching every given filter, in creation order."""
+        if aircraft_id is not None and maintenance_type is not None and status is not None:
+            ids = self._by_key.get((aircraft_id, maintenance_type, status), {})
+        elif aircraft_id is not None:
+            ids = self._by_aircraft.get(aircraft_id, {})
+        elif status is not None:
+            ids = self._by_status[status]
+        else:
+            ids = self._tasks
+        tasks = self._tasks
+        matches = [
+            task_id for task_id in ids
+            if (aircraft_id is None or tasks[task_id].aircraft_id == aircraft_id)
+            and (maintenance_type is None or tasks[task_id].maintenance_type == maintenance_type)
+            and (status is None or tasks[task_id].status == status)
+        ]
+        matches.sort(key=self._created.__getitem__)
+        return [tasks[task_id] for task_id in matches]
+        
+    def page(
+        self,
+        aircraft_id: Optional[str] = None,
+        maintenance_type: Optional[MaintenanceType] = None,
+        status: Optional[MaintenanceStatus] = None,
+        after: int = -1,
+        limit: Optional[int] = None,
+    ) -> List[MaintenanceTask]:
+        """
+        Tasks matching every given filter, in creation order, created after
+        ``after`` (a ``sequence`` value). Walks the smallest matching index
+        from that point and stops after ``limit`` matches.
+        """
+        candidates = [(len(self._tasks), self._order)]
+        if aircraft_id is not None:
+            if aircraft_id not in self._by_aircraft:
+                return []
+            candidates.append((len(self._by_aircraft[aircraft_id]), self._order_by_aircraft[aircraft_id]))
+        if status is not None:
+            candidates.append((len(self._by_status[status]), self._order_by_status[status]))
+        if maintenance_type is not None:
+            candidates.append((len(self._by_type[maintenance_type]), self._order_by_type[maintenance_type]))
+        _, order = min(candidates, key=lambda candidate: candidate[0])
+        
+        ids = self._ids
+        tasks = self._tasks
+        matches = []
+        last = after
+        for index in range(bisect.bisect_right(order, after), len(order)):
+            created = order[index]
+            # A task that left a status and came back is listed twice
+            if created == last:
+                continue
+            last = created
+            task = tasks.get(ids.get(created))
+            if (task is None
+                    or (aircraft_id is not None and task.aircraft_id != aircraft_id)
+                    or (maintenance_type is not None and task.maintenance_type != maintenance_type)
+                    or (status is not None and task.status != status)):
+                continue
+            matches.append(task)
+            if limit is not None and len(matches) == limit:
+                break
+        return matches
+        
+    def pending(
+        self,
+        aircraft_id: str,
+        maintenance_type: MaintenanceType,
+        component_id: Optional[str] = None,
+    ) -> Optional[MaintenanceTask]:
+        """Oldest scheduled, in-progress or overdue task of this type (and component) for the aircraft."""
+        ids = self._pending.get((aircraft_id, maintenance_type, component_id))
+        if not ids:
+            return None
+        return self._tasks[min(ids, key=self._created.__getitem__)]
+        
+    def next_scheduled(self) -> Optional[MaintenanceTask]:
+        """Scheduled task with the earliest date (None if there is none)."""
+        heap = self._heap
+        while heap and not self._valid(heap[0]):
+            heapq.heappop(heap)
+        return self._tasks[heap[0][2]] if heap else None
+        
+    def pop_due(self, now: datetime) -> List[MaintenanceTask]:
+        """
+        Remove and return scheduled tasks dated before now, earliest first.
+        Only due entries are popped; the caller changes their status.
+        """
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] < now:
+            item = heapq.heappop(heap)
+            if self._valid(item):
+                del self._heap_entry[item[2]]
+                due.append(self._tasks[item[2]])
+        # Every date-sorted entry before now was just popped or already stale
+        del self._by_date[:bisect.bisect_left(self._by_date, (now,))]
+        return due
+        
+    def scheduled(
+        self,
+        until: Optional[datetime] = None,
+        after: Optional[ScheduledPosition] = None,
+    ) -> Iterator[MaintenanceTask]:
+        """
+        Scheduled tasks in date order (undated last), up to ``until`` and
+        past the ``scheduled_position`` ``after``. Resumes with a bisect into
+        the date-sorted entries, so each task yielded costs O(1) however
+        deep the page.
+        """
+        by_date = self._by_date
+        if after is None:
+            start = 0
+        elif after[0] == datetime.max:
+            start = len(by_date)
+        else:
+            # Entry numbers are unique: the first entry past ``after``
+            start = bisect.bisect_left(by_date, (after[0], after[1] + 1))
+        for index in range(start, len(by_date)):
+            item = by_date[index]
+            if until is not None and item[0] > until:
+                break
+            if self._valid(item):
+                yield self._tasks[item[2]]
+        created = self._created
+        undated = self._undated
+        if after is not None and after[0] == datetime.max:
+            undated = [task_id for task_id in undated if created[task_id] > after[1]]
+        for task_id in sorted(undated, key=created.__getitem__):
+            yield self._tasks[task_id]
+            
+    def scheduled_position(self, task_id: str) -> ScheduledPosition:
+        """Sort key of a scheduled task in ``scheduled`` order."""
+        entry = self._heap_entry.get(task_id)
+        if entry is None:
+            return (datetime.max, self._created[task_id])
+        return (entry[1], entry[0])
+
+
+def _pending_key(task: MaintenanceTask) -> PendingKey:
+    return (task.aircraft_id, task.maintenance_type, task.component_id)
@@ -0,0 +1,164 @@
+"""
+Alert state tracking for the Monitoring Engine.
+Deduplicates alerts per (aircraft, sensor) with hysteresis and cooldowns.
+"""
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from src.sensors.models import Alert, AlertSeverity, SensorType
+
+
+# (aircraft_id, sensor_type)
+AlertKey = Tuple[str, SensorType]
+
+SEVERITY_RANK: Dict[AlertSeverity, int] = {
+    severity: rank for rank, severity in enumerate(AlertSeverity)
+}
+
+
+@dataclass
+class AlertState:
+    """Open alert episode for one (aircraft, sensor)."""
+    alert: Alert
+    severity: AlertSeverity
+    threshold: Optional[float]  # None for statistical (anomaly/trend) alerts
+    low: bool  # Threshold is a lower limit
+    last_notified: float
+    suppressed: int = 0
+    
+    @property
+    def statistical(self) -> bool:
+        return self.threshold is None
+
+
+class AlertStateTracker:
+    """
+    Per-(aircraft, sensor) alert state machine.
+
+    The first alert for a key opens an episode and is notified. While the
+    episode is open:
+
+    - a higher severity (escalation) is always notified;
+    - the same or a lower severity is suppressed until the cooldown for the
+      episode's severity has passed since the last notification, then
+      notified once as a reminder;
+    - a lower threshold severity de-escalates the episode (silently) only
+      once the value has cleared the current threshold by the hysteresis
+      band, so a value hovering at a limit cannot flap;
+    - a normal reading beyond the hysteresis band clears the episode and
+      its alert is returned for resolution.
+
+    Statistical alerts have no threshold to clear; their episodes are
+    replaced after the cooldown and never suppress a threshold alert.
+    """
+    
+    def __init__(
+        self,
+        cooldowns: Dict[AlertSeverity, float],
+        hysteresis: float = 0.05,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.cooldowns = cooldowns
+        self.hysteresis = hysteresis
+        self._clock = clock
+        self._states: Dict[AlertKey, AlertState] = {}
+        
+        # Counters
+        self.notified = 0
+        self.suppressed = 0
+        self.cleared = 0
+        
+    def on_alert(
+        self,
+        key: AlertKey,
+        severity: AlertSeverity,
+        value: float,
+        make_alert: Callable[[], Alert],
+        threshold: Optional[float] = None,
+        low: bool = False,
+    ) -> Optional[Alert]:
+        """
+        Record an alert condition. Returns the alert to notify (built with
+        ``make_alert``), or None if it is suppressed.
+        """
+        now = self._clock()
+        state = self._states.get(key)
+        
+        if state is not None and not self._should_notify(state, severity, value, threshold, now):
+            state.suppressed += 1
+            self.suppressed += 1
+            return None
+            
+        alert = make_alert()
+        self._states[key] = AlertState(alert, severity, threshold, low, now)
+        self.notified += 1
+        return alert
+        
+    def _should_notify(
+        self,
+        state: AlertState,
+        severity: AlertSeverity,
+        value: float,
+        threshold: Optional[float],
+        now: float,
+    ) -> bool:
+        cooled_down = now - state.last_notified >= self.cooldowns[state.severity]
+        if state.statistical:
+            # Threshold alerts supersede statistical episodes
+            return threshold is not None or cooled_down or self._escalates(state, severity)
+        if threshold is None:
+            # Statistical alerts never interrupt a threshold episode
+            return False
+        if self._escalates(state, severity):
+            return True
+        if severity != state.severity and self._beyond_band(state, value):
+            # De-escalate without notifying
+            state.severity = severity
+            state.threshold = threshold
+        return cooled_down
+        
+    @staticmethod
+    def _escalates(state: AlertState, severity: AlertSeverity) -> bool:
+        return SEVERITY_RANK[severity] > SEVERITY_RANK[state.severity]
+        
+    def _beyond_band(self, state: AlertState, value: float) -> bool:
+        """True once value has cleared the episode's threshold by the hysteresis band."""
+        band = abs(state.threshold) * self.hysteresis
+        if state.low:
+            return value > state.threshold + band
+        return value < state.threshold - band
+        
+    def on_normal(self, key: AlertKey, value: float) -> Optional[Alert]:
+        """
+        Record a reading that raised no alert.
+        Returns the episode's alert if this reading clears it.
+        """
+        state = self._states.get(key)
+        if state is None or state.statistical or not self._beyond_band(state, value):
+            return None
+        del self._states[key]
+        self.cleared += 1
+        return state.alert
+        
+    def clear(self, key: AlertKey) -> None:
+        """Forget the episode for key (e.g. resolved by an operator)."""
+        self._states.pop(key, None)
+        
+    def __contains__(self, key: AlertKey) -> bool:
+        return key in self._states
+        
+    def __len__(self) -> int:
+        return len(self._states)
+        
+    def keys(self) -> Iterable[AlertKey]:
+        return self._states.keys()
+        
+    def get_stats(self) -> Dict[str, int]:
+        """Counters for monitoring."""
+        return {
+            "open": len(self._states),
+            "notified": self.notified,
+            "suppressed": self.suppressed,
+            "cleared": self.cleared,
+        }
@@ -0,0 +1,228 @@
+"""
+Alert store for the Monitoring Engine.
+Indexes alerts by id, aircraft and severity/state, and archives old resolved alerts.
+"""
+import bisect
+import heapq
+import itertools
+import time
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.sensors.models import Alert, AlertSeverity, SensorType
+
+
+# (severity, resolved)
+StateKey = Tuple[AlertSeverity, bool]
+
+
+class AlertStore:
+    """
+    Current and recently resolved alerts.
+
+    Every alert is indexed by id, by aircraft and by (severity, resolved),
+    so acknowledge and resolve are O(1) and queries touch only the alerts
+    in the narrowest matching index. Alerts are numbered in the order they
+    were added; queries return them in that order and can resume after a
+    given sequence number. Each index keeps its sequence numbers sorted, so
+    resuming is a bisect and a page costs O(limit), however many alerts
+    are stored.
+
+    Resolved alerts stay queryable for ``resolved_ttl`` seconds, and at most
+    ``max_resolved`` of them are kept; older ones move to the bounded
+    ``archive``. A new alert for the same (aircraft, sensor) supersedes an
+    open one, which is archived.
+    """
+    
+    def __init__(
+        self,
+        resolved_ttl: float = 3600.0,
+        max_resolved: int = 10000,
+        archive_size: int = 100000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.resolved_ttl = resolved_ttl
+        self.max_resolved = max_resolved
+        self._clock = clock
+        self._alerts: Dict[str, Alert] = {}
+        self._seq: Dict[str, int] = {}
+        self._counter = itertools.count(1)
+        self._by_aircraft: Dict[str, Set[str]] = {}
+        self._by_state: Dict[StateKey, Set[str]] = {
+            (severity, resolved): set() for severity in AlertSeverity for resolved in (False, True)
+        }
+        # Ascending sequence numbers per index (all alerts, per aircraft, per
+        # state); entries of alerts that left an index are skipped when read
+        # and dropped once they make up half of it
+        self._ids: Dict[int, str] = {}
+        self._order: List[int] = []
+        self._order_by_aircraft: Dict[str, List[int]] = {}
+        self._order_by_state: Dict[StateKey, List[int]] = {key: [] for key in self._by_state}
+        # Latest alert id per (aircraft, sensor)
+        self._latest: Dict[Tuple[str, Optional[SensorType]], str] = {}
+        # (resolve time, alert id), oldest first
+        self._resolved: Deque[Tuple[float, str]] = deque()
+        self.archive: Deque[Alert] = deque(maxlen=archive_size)
+        
+    def __len__(self) -> int:
+        return len(self._alerts)
+        
+    def __contains__(self, alert_id: str) -> bool:
+        return alert_id in self._alerts
+        
+    def get(self, alert_id: str) -> Optional[Alert]:
+        return self._alerts.get(alert_id)
+        
+    def sequence(self, alert_id: str) -> int:
+        """Sequence number the alert was stored under."""
+        return self._seq[alert_id]
+        
+    def add(self, alert: Alert) -> None:
+        """Store a new alert, superseding the open alert for its aircraft and sensor."""
+        if alert.id in self._alerts:
+            return
+        key = (alert.aircraft_id, alert.sensor_type)
+        previous = self._alerts.get(self._latest.get(key, ""))
+        if previous is not None and not previous.resolved:
+            self._remove(previous)
+            self.archive.append(previous)
+        self._latest[key] = alert.id
+        
+        seq = next(self._counter)
+        state = (alert.severity, alert.resolved)
+        self._alerts[alert.id] = alert
+        self._seq[alert.id] = seq
+        self._ids[seq] = alert.id
+        self._by_aircraft.setdefault(alert.aircraft_id, set()).add(alert.id)
+        self._by_state[state].add(alert.id)
+        self._order.append(seq)
+        self._order_by_aircraft.setdefault(alert.aircraft_id, []).append(seq)
+        self._order_by_state[state].append(seq)
+        if alert.resolved:
+            self._resolved.append((self._clock(), alert.id))
+        self.evict()
+        
+    def acknowledge(self, alert_id: str, acknowledged_at: Optional[datetime] = None) -> Optional[Alert]:
+        """Mark an alert acknowledged; returns it, or None if unknown."""
+        alert = self._alerts.get(alert_id)
+        if alert is not None and not alert.acknowledged:
+            alert.acknowledged = True
+            alert.acknowledged_at = acknowledged_at or datetime.utcnow()
+        return alert
+        
+    def resolve(self, alert_id: str, resolved_at: Optional[datetime] = None) -> Optional[Alert]:
+        """Mark an alert resolved; returns it, or None if unknown."""
+        alert = self._alerts.get(alert_id)
+        if alert is None or alert.resolved:
+            return alert
+        self._by_state[(alert.severity, False)].discard(alert_id)
+        alert.resolved = True
+        alert.resolved_at = resolved_at or datetime.utcnow()
+        state = (alert.severity, True)
+        self._by_state[state].add(alert_id)
+        bisect.insort(self._order_by_state[state], self._seq[alert_id])
+        self._compact(self._order_by_state[(alert.severity, False)], self._by_state[(alert.severity, False)])
+        self._resolved.append((self._clock(), alert_id))
+        self.evict()
+        return alert
+        
+    def evict(self) -> int:
+        """Archive resolved alerts past the TTL or beyond the count limit."""
+        cutoff = self._clock() - self.resolved_ttl
+        evicted = 0
+        while self._resolved and (
+            len(self._resolved) > self.max_resolved or self._resolved[0][0] <= cutoff
+        ):
+            _, alert_id = self._resolved.popleft()
+            alert = self._alerts.get(alert_id)
+            if alert is None:
+                continue
+            self._remove(alert)
+            self.archive.append(alert)
+            evicted += 1
+        return evicted
+        
+    def _remove(self, alert: Alert) -> None:
+        del self._alerts[alert.id]
+        del self._ids[self._seq.pop(alert.id)]
+        ids = self._by_aircraft[alert.aircraft_id]
+        ids.discard(alert.id)
+        if not ids:
+            del self._by_aircraft[alert.aircraft_id]
+            del self._order_by_aircraft[alert.aircraft_id]
+        else:
+            self._compact(self._order_by_aircraft[alert.aircraft_id], ids)
+        state = (alert.severity, alert.resolved)
+        self._by_state[state].discard(alert.id)
+        self._compact(self._order_by_state[state], self._by_state[state])
+        self._compact(self._order, self._alerts)
+        key = (alert.aircraft_id, alert.sensor_type)
+        if self._latest.get(key) == alert.id:
+            del self._latest[key]
+            
+    def _compact(self, order: List[int], members) -> None:
+        """Drop entries of alerts no longer in an index once they are half of it."""
+        if len(order) > 2 * len(members) + 64:
+            ids = self._ids
+            order[:] = [seq for seq in order if ids.get(seq) in members]
+            
+    def query(
+        self,
+        aircraft_id: Optional[str] = None,
+        severity: Optional[AlertSeverity] = None,
+        resolved: Optional[bool] = None,
+        after_seq: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Alert]:
+        """
+        Alerts matching every given filter, in sequence order, starting
+        after ``after_seq``. Only the smallest matching index is walked,
+        from ``after_seq`` on, and the walk stops after ``limit`` matches.
+        """
+        orders = [self._order]
+        size = len(self._alerts)
+        if severity is not None or resolved is not None:
+            severities = [severity] if severity is not None else list(AlertSeverity)
+            states = [resolved] if resolved is not None else [False, True]
+            keys = [(s, r) for s in severities for r in states]
+            orders = [self._order_by_state[key] for key in keys]
+            size = sum(len(self._by_state[key]) for key in keys)
+        if aircraft_id is not None:
+            if len(self._by_aircraft.get(aircraft_id, ())) <= size:
+                orders = [self._order_by_aircraft.get(aircraft_id, [])]
+                
+        ids = self._ids
+        alerts = self._alerts
+        matches = []
+        last = after_seq
+        for seq in heapq.merge(*(_after(order, after_seq) for order in orders)):
+            # An alert resolved after it was indexed is listed under both states
+            if seq == last:
+                continue
+            last = seq
+            alert = alerts.get(ids.get(seq))
+            if (alert is None
+                    or (aircraft_id is not None and alert.aircraft_id != aircraft_id)
+                    or (severity is not None and alert.severity != severity)
+                    or (resolved is not None and alert.resolved != resolved)):
+                continue
+            matches.append(alert)
+            if limit is not None and len(matches) == limit:
+                break
+        return matches
+        
+    def get_stats(self) -> Dict[str, int]:
+        active = sum(len(self._by_state[(s, False)]) for s in AlertSeverity)
+        return {
+            "stored": len(self._alerts),
+            "active": active,
+            "resolved": len(self._alerts) - active,
+            "archived": len(self.archive),
+        }
+
+
+def _after(order: List[int], seq: int) -> Iterator[int]:
+    """Entries of an ascending list greater than seq."""
+    for index in range(bisect.bisect_right(order, seq), len(order)):
+        yield order[index]
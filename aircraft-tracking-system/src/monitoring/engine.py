@@ -3,19 +3,68 @@ Real-time Monitoring Engine for Aircraft Tracking System.
 Monitors sensor data and detects anomalies for early fault detection.
 """
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from typing import Dict, Iterable, List, Optional, Callable, Tuple
 from collections import defaultdict
 import numpy as np
 
 from src.sensors.models import (
-    SensorReading, SensorType, Alert, AlertSeverity
+    SensorReading, SensorType, Alert, AlertSeverity, ReadingBatch,
+    SENSOR_CODES, SENSOR_TYPE_TABLE,
 )
 from config.settings import AlertConfig
+from src.monitoring.history import SeriesRingBuffer
+from src.monitoring.alert_state import AlertKey, AlertStateTracker
+from src.monitoring.alert_store import AlertStore
 
 
 logger = logging.getLogger(__name__)
 
+# Threshold kinds in evaluation order (columns of the compiled table)
+THRESHOLD_KINDS = ("critical", "warning", "low_critical", "low_warning")
+
+# Severity, title and message per threshold kind
+_THRESHOLD_ALERTS = {
+    "critical": (
+        AlertSeverity.CRITICAL,
+        "Critical {sensor} Alert",
+        "{sensor} has reached critical level: {value:.2f} {unit}",
+    ),
+    "warning": (
+        AlertSeverity.WARNING,
+        "{sensor} Warning",
+        "{sensor} is elevated: {value:.2f} {unit}",
+    ),
+    "low_critical": (
+        AlertSeverity.CRITICAL,
+        "Critical Low {sensor}",
+        "{sensor} critically low: {value:.2f} {unit}",
+    ),
+    "low_warning": (
+        AlertSeverity.WARNING,
+        "Low {sensor} Warning",
+        "{sensor} is low: {value:.2f} {unit}",
+    ),
+}
+
+# Severity of statistical findings by kind
+_FINDING_SEVERITY = {
+    "anomaly": AlertSeverity.WARNING,
+    "trend": AlertSeverity.INFO,
+}
+
+# Anomaly detection parameters
+MIN_ANOMALY_HISTORY = 30
+ANOMALY_Z_SCORE = 3.5
+TREND_SPAN = 10
+
+# Series with fewer rows in a batch go through the scalar path
+_VECTOR_MIN_ROWS = 16
+
+# (kind, mean, std, trend) for a statistical finding; kind is "anomaly" or "trend"
+AnomalyFinding = Tuple[str, float, float, float]
+
 
 class MonitoringEngine:
     """
@@ -26,16 +75,39 @@ class MonitoringEngine:
     def __init__(self, alert_config: AlertConfig):
         self.config = alert_config
         self.alert_callbacks: List[Callable[[Alert], None]] = []
+        self.resolution_callbacks: List[Callable[[Alert], None]] = []
+        self.operator_callbacks: List[Callable[[str, Alert], None]] = []
         
-        # Historical data for trend analysis
-        self._sensor_history: Dict[str, List[SensorReading]] = defaultdict(list)
+        # Historical data for trend analysis (one ring buffer per series,
+        # with rolling statistics over the last 100 readings)
+        self._stats_window = 100
+        self._sensor_history: Dict[str, SeriesRingBuffer] = defaultdict(
+            lambda: SeriesRingBuffer(self.config.history_capacity, self._stats_window)
+        )
         self._history_window = timedelta(hours=24)
+        self._history_window_ns = int(self._history_window.total_seconds() * 1_000_000_000)
         
-        # Active alerts
-        self._active_alerts: Dict[str, Alert] = {}
+        # Active and recently resolved alerts, indexed for queries
+        self.alert_store = AlertStore(
+            alert_config.alert_resolved_ttl,
+            alert_config.alert_resolved_max,
+            alert_config.alert_archive_size,
+        )
+        
+        # Alert episodes per (aircraft, sensor): dedup, hysteresis, cooldowns
+        self._alert_state = AlertStateTracker(
+            {
+                AlertSeverity.INFO: alert_config.alert_cooldown_info,
+                AlertSeverity.WARNING: alert_config.alert_cooldown_warning,
+                AlertSeverity.CRITICAL: alert_config.alert_cooldown_critical,
+                AlertSeverity.EMERGENCY: alert_config.alert_cooldown_emergency,
+            },
+            alert_config.alert_hysteresis,
+        )
         
         # Threshold configuration
         self._thresholds = self._setup_thresholds()
+        self._threshold_table = self._compile_thresholds()
         
     def _setup_thresholds(self) -> Dict[SensorType, Dict[str, float]]:
         """Configure monitoring thresholds."""
@@ -61,32 +133,245 @@ class MonitoringEngine:
             },
         }
         
+    def _compile_thresholds(self) -> np.ndarray:
+        """
+        Threshold table indexed by sensor code, one column per THRESHOLD_KINDS
+        entry; NaN where a sensor has no such threshold (never breached).
+        """
+        table = np.full((len(SENSOR_TYPE_TABLE), len(THRESHOLD_KINDS)), np.nan)
+        for sensor_type, thresholds in self._thresholds.items():
+            for column, kind in enumerate(THRESHOLD_KINDS):
+                if kind in thresholds:
+                    table[SENSOR_CODES[sensor_type], column] = thresholds[kind]
+        return table
+        
     def process_reading(self, reading: SensorReading) -> Optional[Alert]:
         """
         Process sensor reading and check for anomalies.
-        Returns Alert if threshold exceeded.
+        Returns Alert if one was raised (not suppressed as a duplicate).
         """
         # Store in history
         key = f"{reading.aircraft_id}_{reading.sensor_type.value}"
-        self._sensor_history[key].append(reading)
+        history = self._sensor_history[key]
+        history.append(reading.timestamp_ns, reading.value)
         self._cleanup_history(key)
         
         # Check thresholds
-        alert = self._check_thresholds(reading)
-        if alert:
-            self._handle_alert(alert)
-            return alert
+        kind = self._check_thresholds(reading)
+        if kind:
+            return self._raise_alert(reading, kind=kind)
             
+        # Within thresholds: may clear an open alert episode
+        self._check_recovery(reading)
+        
         # Check for anomalies using statistical analysis
-        anomaly_alert = self._detect_anomaly(reading)
-        if anomaly_alert:
-            self._handle_alert(anomaly_alert)
-            return anomaly_alert
+        finding = self._detect_anomaly(history, reading.value)
+        if finding:
+            return self._raise_alert(reading, finding=finding)
             
         return None
         
-    def _check_thresholds(self, reading: SensorReading) -> Optional[Alert]:
-        """Check if reading exceeds defined thresholds."""
+    def process_readings(self, readings: Iterable[SensorReading]) -> List[Alert]:
+        """Process a batch of readings in order. Returns alerts raised."""
+        alerts = []
+        for reading in readings:
+            alert = self.process_reading(reading)
+            if alert:
+                alerts.append(alert)
+        return alerts
+        
+    def process_batch(self, batch: ReadingBatch) -> List[Alert]:
+        """
+        Process a ReadingBatch; same alerts as process_reading row by row.
+        
+        Thresholds are checked for all rows in one pass over the compiled
+        table. History is updated per series, with rolling statistics
+        computed over the ring buffer for long runs. Only rows that raise
+        an alert, or may clear an open alert episode, are visited in
+        Python, in row order.
+        """
+        if not len(batch):
+            return []
+            
+        breached = self._threshold_breaches(batch.sensor_code, batch.value)
+        findings = self._update_histories(batch, breached < 0)
+        
+        flagged = breached >= 0
+        if findings:
+            flagged[list(findings)] = True
+        rows = np.flatnonzero(flagged)
+        watched = self._watched_rows(batch, flagged)
+        if len(watched):
+            rows = np.union1d(rows, watched)
+            
+        alerts = []
+        for row in rows.tolist():
+            reading = batch.reading_at(row)
+            kind = int(breached[row])
+            if kind >= 0:
+                alert = self._raise_alert(reading, kind=THRESHOLD_KINDS[kind])
+            else:
+                self._check_recovery(reading)
+                if row not in findings:
+                    continue
+                alert = self._raise_alert(reading, finding=findings[row])
+            if alert:
+                alerts.append(alert)
+        return alerts
+        
+    def _watched_rows(self, batch: ReadingBatch, flagged: np.ndarray) -> np.ndarray:
+        """
+        Unflagged rows of series with an open alert episode (or one that
+        this batch may open); these may clear the episode.
+        """
+        if not len(self._alert_state) and not flagged.any():
+            return np.empty(0, dtype=np.int64)
+            
+        keys = batch.aircraft_index.astype(np.int64) * 256 + batch.sensor_code
+        watched = set(keys[flagged].tolist())
+        if len(self._alert_state):
+            # Look up the batch's own series, so the cost follows the batch
+            # rather than the number of open episodes
+            aircraft_ids = batch.aircraft_ids
+            watched.update(
+                pair for pair in np.unique(keys[~flagged]).tolist()
+                if (aircraft_ids[pair >> 8], SENSOR_TYPE_TABLE[pair & 0xFF]) in self._alert_state
+            )
+        if not watched:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(np.isin(keys, list(watched)) & ~flagged)
+        
+    def _threshold_breaches(self, codes: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Column of the first breached threshold per row, or -1."""
+        limits = self._threshold_table[codes]
+        column = values[:, None]
+        with np.errstate(invalid="ignore"):
+            breaches = np.concatenate(
+                (column >= limits[:, :2], column <= limits[:, 2:]), axis=1
+            )
+        first = breaches.argmax(axis=1)
+        return np.where(breaches.any(axis=1), first, -1)
+        
+    def _update_histories(
+        self,
+        batch: ReadingBatch,
+        check: np.ndarray,
+    ) -> Dict[int, AnomalyFinding]:
+        """
+        Append batch rows to their series histories, in row order per series.
+        Returns anomaly findings for rows where ``check`` is set.
+        
+        Series with a long run of fresh rows in the batch are appended in
+        bulk and checked with array operations; the rest go row by row.
+        """
+        keys = batch.aircraft_index.astype(np.int64) * 256 + batch.sensor_code
+        _, inverse, run_lengths = np.unique(keys, return_inverse=True, return_counts=True)
+        cutoff_ns = time.time_ns() - self._history_window_ns
+        findings: Dict[int, AnomalyFinding] = {}
+        
+        scalar_rows = run_lengths[inverse] < _VECTOR_MIN_ROWS
+        if not scalar_rows.all():
+            order = np.argsort(inverse, kind="stable")
+            ends = np.cumsum(run_lengths)
+            for series in np.flatnonzero(run_lengths >= _VECTOR_MIN_ROWS).tolist():
+                rows = order[ends[series] - run_lengths[series]:ends[series]]
+                history = self._history_for(batch, rows[0])
+                timestamps = batch.timestamp_ns[rows]
+                if timestamps.min() <= cutoff_ns:
+                    # Stale samples are evicted as they arrive; keep the exact path
+                    scalar_rows[rows] = True
+                    continue
+                found = self._scan_series_vectorized(
+                    history, timestamps, batch.value[rows], check[rows], cutoff_ns
+                )
+                for offset, finding in found:
+                    findings[int(rows[offset])] = finding
+                    
+        rows = np.flatnonzero(scalar_rows)
+        if len(rows):
+            histories: Dict[int, SeriesRingBuffer] = {}
+            for row, key, timestamp_ns, value, checked in zip(
+                rows.tolist(),
+                keys[rows].tolist(),
+                batch.timestamp_ns[rows].tolist(),
+                batch.value[rows].tolist(),
+                check[rows].tolist(),
+            ):
+                history = histories.get(key)
+                if history is None:
+                    history = histories[key] = self._history_for(batch, row)
+                history.append(timestamp_ns, value)
+                history.evict_before(cutoff_ns)
+                if checked:
+                    finding = self._detect_anomaly(history, value)
+                    if finding:
+                        findings[row] = finding
+        return findings
+        
+    def _history_for(self, batch: ReadingBatch, row: int) -> SeriesRingBuffer:
+        """History buffer of the series a batch row belongs to."""
+        aircraft_id = batch.aircraft_ids[batch.aircraft_index[row]]
+        sensor_type = SENSOR_TYPE_TABLE[batch.sensor_code[row]]
+        return self._sensor_history[f"{aircraft_id}_{sensor_type.value}"]
+        
+    def _scan_series_vectorized(
+        self,
+        history: SeriesRingBuffer,
+        timestamps: np.ndarray,
+        values: np.ndarray,
+        check: np.ndarray,
+        cutoff_ns: int,
+    ) -> List[Tuple[int, AnomalyFinding]]:
+        """
+        Append a run of fresh samples in bulk, then evaluate the rolling
+        statistics each sample would have seen over the combined window.
+        """
+        history.evict_before(cutoff_ns)
+        window = history.stats.window
+        prefix = history.tail(window - 1).copy()  # extend may overwrite the view
+        size_before = len(history)
+        history.extend(timestamps, values)
+        
+        series = np.concatenate((prefix, values))
+        offsets = np.arange(len(values))
+        positions = len(prefix) + offsets
+        history_len = np.minimum(size_before + offsets + 1, history.capacity)
+        candidates = np.flatnonzero(check & (history_len >= MIN_ANOMALY_HISTORY))
+        if not len(candidates):
+            return []
+            
+        # Rolling mean/std for every candidate; full windows in one pass
+        counts = np.minimum(history_len[candidates], window)
+        means = np.empty(len(candidates))
+        stds = np.empty(len(candidates))
+        full = counts == window
+        if full.any():
+            windows = np.lib.stride_tricks.sliding_window_view(series, window)
+            selected = windows[positions[candidates[full]] - window + 1]
+            means[full] = selected.mean(axis=1)
+            stds[full] = selected.std(axis=1)
+            # A constant window has exactly zero spread
+            stds[full] = np.where(selected.max(axis=1) == selected.min(axis=1), 0.0, stds[full])
+        for i in np.flatnonzero(~full).tolist():
+            end = positions[candidates[i]] + 1
+            selected = series[end - counts[i]:end]
+            means[i] = selected.mean()
+            stds[i] = 0.0 if selected.max() == selected.min() else selected.std()
+            
+        current = series[positions[candidates]]
+        trends = (current - series[positions[candidates] - (TREND_SPAN - 1)]) / TREND_SPAN
+        with np.errstate(divide="ignore", invalid="ignore"):
+            anomalous = (stds > 0) & (np.abs(current - means) / stds > ANOMALY_Z_SCORE)
+        trending = (stds > 0) & ~anomalous & (np.abs(trends) > stds * 0.5)
+        
+        found = []
+        for i in np.flatnonzero(anomalous | trending).tolist():
+            kind = "anomaly" if anomalous[i] else "trend"
+            found.append((int(candidates[i]), (kind, float(means[i]), float(stds[i]), float(trends[i]))))
+        return found
+        
+    def _check_thresholds(self, reading: SensorReading) -> Optional[str]:
+        """Check if reading exceeds defined thresholds. Returns the breached kind."""
         thresholds = self._thresholds.get(reading.sensor_type)
         if not thresholds:
             return None
@@ -96,75 +381,70 @@ class MonitoringEngine:
         
         # High value thresholds (temperature, vibration)
         if "critical" in thresholds and value >= thresholds["critical"]:
-            return Alert(
-                aircraft_id=reading.aircraft_id,
-                sensor_type=sensor_type,
-                severity=AlertSeverity.CRITICAL,
-                title=f"Critical {sensor_type.value} Alert",
-                message=f"{sensor_type.value} has reached critical level: {value:.2f} {reading.unit}",
-                value=value,
-                threshold=thresholds["critical"],
-            )
+            return "critical"
             
         if "warning" in thresholds and value >= thresholds["warning"]:
-            return Alert(
-                aircraft_id=reading.aircraft_id,
-                sensor_type=sensor_type,
-                severity=AlertSeverity.WARNING,
-                title=f"{sensor_type.value} Warning",
-                message=f"{sensor_type.value} is elevated: {value:.2f} {reading.unit}",
-                value=value,
-                threshold=thresholds["warning"],
-            )
+            return "warning"
             
         # Low value thresholds (pressure, fuel)
         if "low_critical" in thresholds and value <= thresholds["low_critical"]:
-            return Alert(
-                aircraft_id=reading.aircraft_id,
-                sensor_type=sensor_type,
-                severity=AlertSeverity.CRITICAL,
-                title=f"Critical Low {sensor_type.value}",
-                message=f"{sensor_type.value} critically low: {value:.2f} {reading.unit}",
-                value=value,
-                threshold=thresholds["low_critical"],
-            )
+            return "low_critical"
             
         if "low_warning" in thresholds and value <= thresholds["low_warning"]:
-            return Alert(
-                aircraft_id=reading.aircraft_id,
-                sensor_type=sensor_type,
-                severity=AlertSeverity.WARNING,
-                title=f"Low {sensor_type.value} Warning",
-                message=f"{sensor_type.value} is low: {value:.2f} {reading.unit}",
-                value=value,
-                threshold=thresholds["low_warning"],
-            )
+            return "low_warning"
             
         return None
         
-    def _detect_anomaly(self, reading: SensorReading) -> Optional[Alert]:
+    def _threshold_alert(self, reading: SensorReading, kind: str) -> Alert:
+        """Build the alert for a breached threshold kind."""
+        severity, title, message = _THRESHOLD_ALERTS[kind]
+        sensor = reading.sensor_type.value
+        return Alert(
+            aircraft_id=reading.aircraft_id,
+            sensor_type=reading.sensor_type,
+            severity=severity,
+            title=title.format(sensor=sensor),
+            message=message.format(sensor=sensor, value=reading.value, unit=reading.unit),
+            value=reading.value,
+            threshold=self._thresholds[reading.sensor_type][kind],
+        )
+        
+    def _detect_anomaly(self, history: SeriesRingBuffer, value: float) -> Optional[AnomalyFinding]:
         """
         Detect anomalies using statistical analysis.
         Enables early fault detection through trend analysis.
         """
-        key = f"{reading.aircraft_id}_{reading.sensor_type.value}"
-        history = self._sensor_history[key]
-        
-        if len(history) < 30:  # Need minimum data points
+        if len(history) < MIN_ANOMALY_HISTORY:  # Need minimum data points
             return None
             
-        # Calculate statistics
-        values = [r.value for r in history[-100:]]  # Last 100 readings
-        mean = np.mean(values)
-        std = np.std(values)
+        # Rolling statistics over the last 100 readings
+        stats = history.stats
+        mean = stats.mean
+        std = stats.std
         
         if std == 0:
             return None
             
         # Z-score anomaly detection
-        z_score = abs(reading.value - mean) / std
+        z_score = abs(value - mean) / std
+        
+        if z_score > ANOMALY_Z_SCORE:  # Strong anomaly
+            return ("anomaly", mean, std, 0.0)
+            
+        # Trend detection - rapid change
+        if len(history) >= TREND_SPAN:
+            trend = (history.value_at(-1) - history.value_at(-TREND_SPAN)) / TREND_SPAN
+            
+            # Alert on rapid increase/decrease
+            if abs(trend) > std * 0.5:
+                return ("trend", mean, std, trend)
+                
+        return None
         
-        if z_score > 3.5:  # Strong anomaly
+    def _anomaly_alert(self, reading: SensorReading, finding: AnomalyFinding) -> Alert:
+        """Build the alert for a statistical finding."""
+        kind, mean, std, trend = finding
+        if kind == "anomaly":
             return Alert(
                 aircraft_id=reading.aircraft_id,
                 sensor_type=reading.sensor_type,
@@ -175,38 +455,82 @@ class MonitoringEngine:
                 threshold=mean + 2 * std,
             )
             
-        # Trend detection - rapid change
-        if len(history) >= 10:
-            recent = [r.value for r in history[-10:]]
-            trend = (recent[-1] - recent[0]) / len(recent)
+        direction = "increasing" if trend > 0 else "decreasing"
+        return Alert(
+            aircraft_id=reading.aircraft_id,
+            sensor_type=reading.sensor_type,
+            severity=AlertSeverity.INFO,
+            title=f"Trend Alert: {reading.sensor_type.value}",
+            message=f"{reading.sensor_type.value} is rapidly {direction}. Monitor closely.",
+            value=reading.value,
+        )
+        
+    def _raise_alert(
+        self,
+        reading: SensorReading,
+        kind: Optional[str] = None,
+        finding: Optional[AnomalyFinding] = None,
+    ) -> Optional[Alert]:
+        """
+        Pass an alert condition (threshold kind or statistical finding)
+        through the alert state machine; publish it unless suppressed.
+        """
+        alert_key: AlertKey = (reading.aircraft_id, reading.sensor_type)
+        if kind:
+            alert = self._alert_state.on_alert(
+                alert_key,
+                _THRESHOLD_ALERTS[kind][0],
+                reading.value,
+                lambda: self._threshold_alert(reading, kind),
+                threshold=self._thresholds[reading.sensor_type][kind],
+                low=kind.startswith("low"),
+            )
+        else:
+            alert = self._alert_state.on_alert(
+                alert_key,
+                _FINDING_SEVERITY[finding[0]],
+                reading.value,
+                lambda: self._anomaly_alert(reading, finding),
+            )
             
-            # Alert on rapid increase/decrease
-            if abs(trend) > std * 0.5:
-                direction = "increasing" if trend > 0 else "decreasing"
-                return Alert(
-                    aircraft_id=reading.aircraft_id,
-                    sensor_type=reading.sensor_type,
-                    severity=AlertSeverity.INFO,
-                    title=f"Trend Alert: {reading.sensor_type.value}",
-                    message=f"{reading.sensor_type.value} is rapidly {direction}. Monitor closely.",
-                    value=reading.value,
-                )
-                
-        return None
+        if alert:
+            self._handle_alert(alert)
+        return alert
         
+    def _check_recovery(self, reading: SensorReading) -> None:
+        """Resolve the open alert episode if this normal reading clears it."""
+        alert_key: AlertKey = (reading.aircraft_id, reading.sensor_type)
+        if alert_key not in self._alert_state:
+            return
+        cleared = self._alert_state.on_normal(alert_key, reading.value)
+        if cleared:
+            if self.alert_store.resolve(cleared.id) is None:
+                # Superseded or archived: mark the alert itself
+                cleared.resolved = True
+                cleared.resolved_at = datetime.utcnow()
+            logger.info(f"Alert cleared: {cleared.title} ({cleared.aircraft_id})")
+            for callback in self.resolution_callbacks:
+                try:
+                    callback(cleared)
+                except Exception as e:
+                    logger.error(f"Resolution callback error: {e}")
+                    
     def _cleanup_history(self, key: str) -> None:
         """Remove old readings from history."""
-        cutoff = datetime.utcnow() - self._history_window
-        self._sensor_history[key] = [
-            r for r in self._sensor_history[key]
-            if r.timestamp > cutoff
-        ]
+        cutoff_ns = time.time_ns() - self._history_window_ns
+        self._sensor_history[key].evict_before(cutoff_ns)
         
     def _handle_alert(self, alert: Alert) -> None:
         """Handle new alert."""
+        self.publish_alert(alert)
+        
+    def publish_alert(self, alert: Alert) -> None:
+        """
+        Record an alert as active and notify callbacks.
+        Also used to merge alerts raised by ingest shards in other processes.
+        """
         # Store active alert
-        alert_key = f"{alert.aircraft_id}_{alert.sensor_type.value if alert.sensor_type else 'general'}"
-        self._active_alerts[alert_key] = alert
+        self.alert_store.add(alert)
         
         # Notify callbacks
         for callback in self.alert_callbacks:
@@ -223,18 +547,48 @@ class MonitoringEngine:
         """Register callback for alerts."""
         self.alert_callbacks.append(callback)
         
+    def register_resolution_callback(self, callback: Callable[[Alert], None]) -> None:
+        """Register callback for alerts resolved because their condition cleared."""
+        self.resolution_callbacks.append(callback)
+        
+    def register_operator_callback(self, callback: Callable[[str, Alert], None]) -> None:
+        """Register callback for operator actions, called with "acknowledge" or "resolve" and the alert."""
+        self.operator_callbacks.append(callback)
+        
+    def _notify_operator_action(self, action: str, alert: Alert) -> None:
+        for callback in self.operator_callbacks:
+            try:
+                callback(action, alert)
+            except Exception as e:
+                logger.error(f"Operator callback error: {e}")
+                
+    def apply_resolution(self, alert: Alert) -> None:
+        """Mark the matching active alert resolved (resolutions from ingest shards)."""
+        self.alert_store.resolve(alert.id, alert.resolved_at)
+        
     def get_active_alerts(self, aircraft_id: Optional[str] = None) -> List[Alert]:
         """Get active (unresolved) alerts."""
-        alerts = list(self._active_alerts.values())
-        if aircraft_id:
-            alerts = [a for a in alerts if a.aircraft_id == aircraft_id]
-        return [a for a in alerts if not a.resolved]
+        return self.alert_store.query(aircraft_id=aircraft_id, resolved=False)
+        
+    def acknowledge_alert(self, alert_id: str) -> bool:
+        """Mark alert as acknowledged."""
+        alert = self.alert_store.acknowledge(alert_id)
+        if alert is None:
+            return False
+        self._notify_operator_action("acknowledge", alert)
+        return True
         
     def resolve_alert(self, alert_id: str) -> bool:
         """Mark alert as resolved."""
-        for key, alert in self._active_alerts.items():
-            if alert.id == alert_id:
-                alert.resolved = True
-                alert.resolved_at = datetime.utcnow()
-                return True
-        return False
+        alert = self.alert_store.resolve(alert_id)
+        if alert is None:
+            return False
+        # A condition that persists raises a fresh alert
+        self._alert_state.clear((alert.aircraft_id, alert.sensor_type))
+        self._notify_operator_action("resolve", alert)
+        return True
+        
+    @property
+    def alert_stats(self) -> Dict[str, int]:
+        """Alert state machine counters (open episodes, notified, suppressed, cleared)."""
+        return self._alert_state.get_stats()
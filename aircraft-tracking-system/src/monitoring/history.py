@@ -0,0 +1,208 @@
+"""
+Sensor history storage for the Monitoring Engine.
+Fixed-capacity columnar ring buffers with time-based eviction.
+"""
+from typing import Optional
+import numpy as np
+
+
+class RollingWindowStats:
+    """
+    Windowed Welford accumulator for mean and population std.
+
+    The owning buffer reports values entering and leaving the window, so
+    mean/std are O(1) per sample. The accumulator is periodically rebuilt
+    from the window itself to bound floating-point drift.
+    """
+    
+    __slots__ = ("window", "count", "mean", "_m2", "_updates")
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+        
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self._updates += 1
+        
+    def remove(self, value: float) -> None:
+        if self.count <= 1:
+            self.reset()
+            return
+        self.count -= 1
+        delta = value - self.mean
+        self.mean -= delta / self.count
+        self._m2 -= delta * (value - self.mean)
+        self._updates += 1
+        
+    def replace(self, old: float, new: float) -> None:
+        """Slide a full window by one: drop ``old`` and add ``new``."""
+        old_mean = self.mean
+        diff = new - old
+        self.mean += diff / self.count
+        self._m2 += diff * (new - self.mean + old - old_mean)
+        self._updates += 1
+        
+    def reset(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._updates = 0
+        
+    def rebuild(self, values: np.ndarray) -> None:
+        """Recompute the accumulator exactly from the current window."""
+        self.count = len(values)
+        if self.count:
+            self.mean = float(np.mean(values))
+            self._m2 = float(np.var(values)) * self.count
+        else:
+            self.mean = 0.0
+            self._m2 = 0.0
+        self._updates = 0
+        
+    @property
+    def needs_rebuild(self) -> bool:
+        return self._updates >= 4 * self.window
+        
+    @property
+    def variance(self) -> float:
+        if self.count == 0 or self._m2 <= 0.0:
+            return 0.0
+        return self._m2 / self.count
+        
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+
+
+class SeriesRingBuffer:
+    """
+    Ring buffer holding (timestamp, value) pairs for one sensor series.
+
+    Timestamps (epoch ns) and values live in preallocated NumPy arrays.
+    Every sample is written twice, at ``i`` and ``i + capacity``, so the
+    most recent ``n`` samples are always a contiguous slice and ``tail``
+    never copies. When the buffer is full the oldest sample is overwritten.
+    
+    With ``stats_window`` set, a RollingWindowStats over the last
+    ``stats_window`` values is maintained as samples are appended/evicted.
+    """
+    
+    __slots__ = ("capacity", "stats", "_timestamps", "_values", "_start", "_size")
+    
+    def __init__(self, capacity: int, stats_window: Optional[int] = None):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.stats: Optional[RollingWindowStats] = (
+            RollingWindowStats(min(stats_window, capacity)) if stats_window else None
+        )
+        self._timestamps = np.zeros(2 * capacity, dtype=np.int64)
+        self._values = np.zeros(2 * capacity, dtype=np.float64)
+        self._start = 0  # Physical index of the oldest sample
+        self._size = 0
+        
+    def __len__(self) -> int:
+        return self._size
+        
+    def append(self, timestamp_ns: int, value: float) -> None:
+        """Append a sample, overwriting the oldest one when full."""
+        capacity = self.capacity
+        stats = self.stats
+        if stats is not None:
+            if self._size >= stats.window:
+                leaving = self._values[self._start + self._size - stats.window]
+                stats.replace(float(leaving), value)
+            else:
+                stats.add(value)
+                
+        if self._size == capacity:
+            pos = self._start
+            self._start = (self._start + 1) % capacity
+        else:
+            pos = (self._start + self._size) % capacity
+            self._size += 1
+            
+        self._timestamps[pos] = timestamp_ns
+        self._timestamps[pos + capacity] = timestamp_ns
+        self._values[pos] = value
+        self._values[pos + capacity] = value
+        
+        if stats is not None and stats.needs_rebuild:
+            stats.rebuild(self.tail(stats.window))
+            
+    def extend(self, timestamps_ns: np.ndarray, values: np.ndarray) -> None:
+        """Append samples in bulk (oldest first); stats are rebuilt once at the end."""
+        count = len(values)
+        if count == 0:
+            return
+        capacity = self.capacity
+        if count >= capacity:
+            # Only the newest ``capacity`` samples survive
+            timestamps_ns = timestamps_ns[-capacity:]
+            values = values[-capacity:]
+            count = capacity
+            self._start = 0
+            self._size = 0
+            
+        positions = (self._start + self._size + np.arange(count)) % capacity
+        self._timestamps[positions] = timestamps_ns
+        self._timestamps[positions + capacity] = timestamps_ns
+        self._values[positions] = values
+        self._values[positions + capacity] = values
+        
+        overflow = max(0, self._size + count - capacity)
+        self._start = (self._start + overflow) % capacity
+        self._size = min(capacity, self._size + count)
+        
+        if self.stats is not None:
+            self.stats.rebuild(self.tail(self.stats.window))
+            
+    def evict_before(self, cutoff_ns: int) -> int:
+        """
+        Drop samples with timestamp <= cutoff_ns from the old end.
+        Returns the number of samples evicted.
+        """
+        evicted = 0
+        timestamps = self._timestamps
+        stats = self.stats
+        while self._size and timestamps[self._start] <= cutoff_ns:
+            if stats is not None and self._size <= stats.window:
+                stats.remove(float(self._values[self._start]))
+            self._start = (self._start + 1) % self.capacity
+            self._size -= 1
+            evicted += 1
+        return evicted
+        
+    def tail(self, n: Optional[int] = None) -> np.ndarray:
+        """Read-only view of the last ``n`` values (all values if None)."""
+        return self._window(self._values, n)
+        
+    def tail_timestamps(self, n: Optional[int] = None) -> np.ndarray:
+        """Read-only view of the last ``n`` timestamps (all if None)."""
+        return self._window(self._timestamps, n)
+        
+    def _window(self, column: np.ndarray, n: Optional[int]) -> np.ndarray:
+        size = self._size if n is None else max(0, min(n, self._size))
+        end = self._start + self._size
+        view = column[end - size:end]
+        view.flags.writeable = False
+        return view
+        
+    def value_at(self, index: int) -> float:
+        """Value at logical index (negative indexes count from the newest)."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("ring buffer index out of range")
+        return float(self._values[self._start + index])
+        
+    @property
+    def oldest_timestamp_ns(self) -> Optional[int]:
+        return int(self._timestamps[self._start]) if self._size else None
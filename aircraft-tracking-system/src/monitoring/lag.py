@@ -0,0 +1,76 @@
+"""
+Event loop lag monitor for Aircraft Tracking System.
+Measures how late the asyncio loop wakes up, to expose blocking calls.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class LoopLagMonitor:
+    """
+    Samples event loop lag: a task sleeps ``interval`` seconds and records
+    how much later than that it actually resumed. Anything that blocks
+    the loop (a synchronous SDK call, a long callback) shows up as lag.
+    Lag above ``warn_threshold`` is logged.
+    """
+    
+    def __init__(
+        self,
+        interval: float = 0.1,
+        warn_threshold: float = 0.25,
+        samples: int = 3000,
+    ):
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples: Deque[float] = deque(maxlen=samples)
+        self._task: Optional[asyncio.Task] = None
+        self.max_lag = 0.0
+        
+    def start(self) -> None:
+        """Start sampling on the running loop."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+            
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+            
+    async def _run(self) -> None:
+        while True:
+            begin = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - begin - self.interval)
+            self._samples.append(lag)
+            if lag > self.max_lag:
+                self.max_lag = lag
+            if lag > self.warn_threshold:
+                logger.warning(f"Event loop lag {lag * 1000:.0f} ms")
+                
+    def reset(self) -> None:
+        self._samples.clear()
+        self.max_lag = 0.0
+        
+    def get_stats(self) -> Dict[str, float]:
+        """Lag percentiles over recent samples, in milliseconds."""
+        if not self._samples:
+            return {"samples": 0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+        samples = np.fromiter(self._samples, dtype=np.float64) * 1000
+        return {
+            "samples": len(samples),
+            "p50_ms": float(np.percentile(samples, 50)),
+            "p99_ms": float(np.percentile(samples, 99)),
+            "max_ms": self.max_lag * 1000,
+        }
@@ -0,0 +1,114 @@
+"""
+Compact binary sensor payload format.
+
+Frame layout (little-endian):
+
+    header  <BBH   magic (0xA5), version (1), record count
+    record  <Bqd   sensor code, timestamp (epoch ns), value
+
+One reading costs 17 bytes plus a 4-byte header per message, and
+decoding is a single ``struct`` call per record. The magic byte can never
+start a JSON document, so the collector accepts both formats on the same
+topics. Sensor codes are ``models.SENSOR_CODES``.
+"""
+import logging
+import struct
+import time
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .models import ReadingBatch, SensorType, SENSOR_CODES, SENSOR_TYPES_BY_CODE
+
+
+MAGIC = 0xA5
+VERSION = 1
+
+HEADER = struct.Struct("<BBH")
+RECORD = struct.Struct("<Bqd")
+
+MAX_RECORDS = 0xFFFF
+
+# Same layout as RECORD, for decoding a whole frame with np.frombuffer
+RECORD_DTYPE = np.dtype([("code", "u1"), ("timestamp_ns", "<i8"), ("value", "<f8")])
+
+_KNOWN_CODES = np.zeros(256, dtype=bool)
+_KNOWN_CODES[list(SENSOR_TYPES_BY_CODE)] = True
+
+logger = logging.getLogger(__name__)
+
+# (sensor code, timestamp ns, value)
+BinaryRecord = Tuple[int, int, float]
+
+
+class CodecError(ValueError):
+    """Raised for malformed binary payloads."""
+
+
+def is_binary(payload: bytes) -> bool:
+    """True if the payload starts with the binary frame magic byte."""
+    return len(payload) > 0 and payload[0] == MAGIC
+
+
+def encode_reading(
+    sensor_type: SensorType,
+    value: float,
+    timestamp_ns: Optional[int] = None,
+) -> bytes:
+    """Encode a single reading (timestamp defaults to now)."""
+    return encode_readings([(sensor_type, value, timestamp_ns)])
+
+
+def encode_readings(
+    readings: Iterable[Tuple[SensorType, float, Optional[int]]],
+) -> bytes:
+    """
+    Encode several readings of one aircraft into one frame.
+    Intended for edge gateways publishing to aircraft/{id}/sensors/...
+    """
+    now = time.time_ns()
+    records = [
+        RECORD.pack(SENSOR_CODES[sensor_type], now if ts is None else ts, value)
+        for sensor_type, value, ts in readings
+    ]
+    if len(records) > MAX_RECORDS:
+        raise CodecError(f"too many records for one frame ({len(records)})")
+    return HEADER.pack(MAGIC, VERSION, len(records)) + b"".join(records)
+
+
+def _frame_body(payload: bytes) -> memoryview:
+    """Validate the header and return the record bytes."""
+    if len(payload) < HEADER.size:
+        raise CodecError("payload shorter than header")
+    magic, version, count = HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise CodecError("bad magic byte")
+    if version != VERSION:
+        raise CodecError(f"unsupported version {version}")
+    body = memoryview(payload)[HEADER.size:]
+    if len(body) != count * RECORD.size:
+        raise CodecError(f"expected {count} records, got {len(body)} bytes")
+    return body
+
+
+def decode(payload: bytes) -> List[BinaryRecord]:
+    """Decode a binary frame into (sensor code, timestamp ns, value) records."""
+    return list(RECORD.iter_unpack(_frame_body(payload)))
+
+
+def decode_batch(aircraft_id: str, payload: bytes) -> ReadingBatch:
+    """
+    Decode a binary frame straight into a ReadingBatch for one aircraft.
+    Records with unknown sensor codes are skipped.
+    """
+    records = np.frombuffer(_frame_body(payload), dtype=RECORD_DTYPE)
+    known = _KNOWN_CODES[records["code"]]
+    if not known.all():
+        logger.error(f"Skipping {int((~known).sum())} records with unknown sensor codes from {aircraft_id}")
+        records = records[known]
+    return ReadingBatch.for_aircraft(
+        aircraft_id,
+        records["code"].copy(),
+        records["value"].copy(),
+        records["timestamp_ns"].copy(),
+    )
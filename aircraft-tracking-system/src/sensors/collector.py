@@ -5,16 +5,30 @@ Collects real-time data from aircraft sensors via MQTT.
 import asyncio
 import json
 import logging
-from datetime import datetime
-from typing import Callable, Dict, Any, Optional, List
+from collections import deque
+from typing import Callable, Deque, Dict, Any, Optional, List
+import numpy as np
 import paho.mqtt.client as mqtt
 
-from .models import SensorReading, SensorType, EngineData, FlightData
+from . import codec
+from .models import (
+    SensorReading, SensorType, EngineData, FlightData, ReadingBatch,
+    SENSOR_CODES, EMPTY_METADATA, parse_timestamp_ns,
+)
+from .ingest import IngestQueue, OverflowPolicy
+from .sharding import ShardedIngestor
 from config.settings import MQTTConfig
 
 
 logger = logging.getLogger(__name__)
 
+# Topic suffixes (aircraft/{id}/sensors/{suffix}) for multi-reading messages
+BATCH_SUFFIX = "batch"
+ENGINE_FRAME_SUFFIX = "engine"
+FLIGHT_FRAME_SUFFIX = "flight"
+
+_SENSOR_CODES_BY_NAME = {t.value: code for t, code in SENSOR_CODES.items()}
+
 
 class SensorDataCollector:
     """
@@ -26,8 +40,35 @@ class SensorDataCollector:
         self.config = config
         self.client: Optional[mqtt.Client] = None
         self.callbacks: Dict[str, List[Callable]] = {}
+        self.batch_callbacks: List[Callable[[ReadingBatch], None]] = []
         self._connected = False
-        self._readings_buffer: List[SensorReading] = []
+        # Storage buffer: batch chunks, bounded by total rows
+        self._buffer: Deque[ReadingBatch] = deque()
+        self._buffer_rows = 0
+        self._buffer_capacity = config.reading_buffer_size
+        self._buffer_dropped = 0
+        self._flush_threshold = 0
+        self._flush_listener: Optional[Callable[[], None]] = None
+        self._ingest_queue: Optional[IngestQueue[ReadingBatch]] = None
+        self._sharder: Optional[ShardedIngestor] = None
+        
+    def attach_event_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """
+        Deliver readings on the given event loop instead of the MQTT thread.
+        Parsed messages are queued and dispatched to callbacks in batches.
+        """
+        self._ingest_queue = IngestQueue(
+            loop,
+            self._dispatch_batch,
+            maxsize=self.config.ingest_queue_size,
+            policy=OverflowPolicy(self.config.ingest_overflow_policy),
+            batch_size=self.config.ingest_batch_size,
+            block_timeout=self.config.ingest_block_timeout,
+        )
+        
+    def enable_sharding(self, sharder: ShardedIngestor) -> None:
+        """Forward raw messages to worker processes keyed by aircraft_id."""
+        self._sharder = sharder
         
     def connect(self) -> None:
         """Establish connection to MQTT broker."""
@@ -69,27 +110,85 @@ class SensorDataCollector:
         
     def _on_message(self, client, userdata, msg):
         """Process incoming sensor data."""
+        if self._sharder is not None:
+            # Route the raw message; parsing happens in the owning worker
+            topic_parts = msg.topic.split("/", 2)
+            if len(topic_parts) >= 3:
+                self._sharder.submit(topic_parts[1], msg.topic, msg.payload)
+            return
+            
+        self.handle_message(msg.topic, msg.payload)
+        
+    def handle_message(self, topic: str, raw_payload: bytes) -> None:
+        """Parse one raw sensor message and dispatch its readings."""
         try:
             # Parse topic: aircraft/{aircraft_id}/sensors/{sensor_type}
-            topic_parts = msg.topic.split("/")
+            topic_parts = topic.split("/")
             if len(topic_parts) >= 4:
                 aircraft_id = topic_parts[1]
                 sensor_type_str = topic_parts[3]
                 
-                payload = json.loads(msg.payload.decode())
-                
-                reading = self._parse_sensor_reading(
-                    aircraft_id, 
-                    sensor_type_str, 
-                    payload
-                )
-                
-                if reading:
-                    self._process_reading(reading)
+                batch = self._parse_message(aircraft_id, sensor_type_str, raw_payload)
+                if len(batch):
+                    self._process_batch(batch)
                     
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             
+    def _parse_message(
+        self,
+        aircraft_id: str,
+        sensor_type_str: str,
+        raw_payload: bytes
+    ) -> ReadingBatch:
+        """
+        Decode a message into a batch of readings.
+        Handles binary frames, batch messages, engine/flight snapshot frames
+        and single JSON readings.
+        """
+        # Binary frames carry the sensor code themselves and decode straight
+        # into arrays, without per-reading objects
+        if codec.is_binary(raw_payload):
+            return codec.decode_batch(aircraft_id, raw_payload)
+            
+        payload = json.loads(raw_payload.decode())
+        
+        if sensor_type_str == BATCH_SUFFIX:
+            readings = self._parse_batch(aircraft_id, payload)
+        elif sensor_type_str == ENGINE_FRAME_SUFFIX:
+            readings = EngineData.from_dict(aircraft_id, payload).to_readings()
+        elif sensor_type_str == FLIGHT_FRAME_SUFFIX:
+            readings = FlightData.from_dict(aircraft_id, payload).to_readings()
+        else:
+            reading = self._parse_sensor_reading(
+                aircraft_id, 
+                sensor_type_str, 
+                payload
+            )
+            readings = [reading] if reading else []
+        return ReadingBatch.from_readings(readings)
+        
+    def _parse_batch(self, aircraft_id: str, payload: Any) -> List[SensorReading]:
+        """
+        Parse a batch message: a list of readings, or {"readings": [...]}
+        with an optional shared "timestamp".
+        """
+        if isinstance(payload, dict):
+            items = payload.get("readings", [])
+            shared_timestamp = payload.get("timestamp")
+        else:
+            items = payload
+            shared_timestamp = None
+            
+        readings = []
+        for item in items:
+            if shared_timestamp and "timestamp" not in item:
+                item = {**item, "timestamp": shared_timestamp}
+            reading = self._parse_sensor_reading(aircraft_id, item.get("sensor_type", ""), item)
+            if reading:
+                readings.append(reading)
+        return readings
+        
     def _parse_sensor_reading(
         self, 
         aircraft_id: str, 
@@ -106,32 +205,97 @@ class SensorDataCollector:
                 aircraft_id=aircraft_id,
                 value=float(payload["value"]),
                 unit=payload.get("unit", ""),
-                timestamp=datetime.fromisoformat(payload.get("timestamp", datetime.utcnow().isoformat())),
-                metadata=payload.get("metadata", {}),
+                timestamp_ns=parse_timestamp_ns(payload.get("timestamp")),
+                metadata=payload.get("metadata") or EMPTY_METADATA,
             )
         except (ValueError, KeyError) as e:
             logger.error(f"Failed to parse sensor reading: {e}")
             return None
             
-    def _process_reading(self, reading: SensorReading) -> None:
-        """Process and distribute sensor reading."""
-        # Buffer reading for batch storage
-        self._readings_buffer.append(reading)
+    def _process_batch(self, batch: ReadingBatch) -> None:
+        """Hand a parsed message to the event loop, or dispatch it inline if none is attached."""
+        if self._ingest_queue is not None:
+            self._ingest_queue.put(batch)
+        else:
+            self._dispatch_batch([batch])
+            
+    def _dispatch_batch(self, batches: List[ReadingBatch]) -> None:
+        """Process and distribute queued message batches as one ReadingBatch."""
+        batch = ReadingBatch.concat(batches)
+        if not len(batch):
+            return
+            
+        self._buffer_batch(batch)
         
-        # Notify registered callbacks
-        for callback in self.callbacks.get(reading.sensor_type.value, []):
-            try:
-                callback(reading)
-            except Exception as e:
-                logger.error(f"Callback error: {e}")
-                
-        # Notify all-sensors callbacks
-        for callback in self.callbacks.get("*", []):
+        if self.callbacks:
+            self._notify_reading_callbacks(batch)
+            
+        # Notify batch callbacks once per batch
+        for callback in self.batch_callbacks:
             try:
-                callback(reading)
+                callback(batch)
             except Exception as e:
-                logger.error(f"Callback error: {e}")
+                logger.error(f"Batch callback error: {e}")
                 
+    def _buffer_batch(self, batch: ReadingBatch) -> None:
+        """Buffer a batch for storage (bounded: oldest rows dropped when full)."""
+        before = self._buffer_rows
+        self._buffer.append(batch)
+        self._buffer_rows += len(batch)
+        
+        overflow = self._buffer_rows - self._buffer_capacity
+        if overflow > 0:
+            self._buffer_dropped += overflow
+            self._pop_buffered(overflow)
+            
+        if self._flush_listener and before < self._flush_threshold <= self._buffer_rows:
+            self._flush_listener()
+            
+    def _pop_buffered(self, rows: int) -> List[ReadingBatch]:
+        """Remove up to rows buffered readings from the front, oldest first."""
+        chunks = []
+        while rows > 0 and self._buffer:
+            head = self._buffer[0]
+            if len(head) <= rows:
+                self._buffer.popleft()
+            else:
+                self._buffer[0] = head.take(slice(rows, None))
+                head = head.take(slice(0, rows))
+            chunks.append(head)
+            rows -= len(head)
+            self._buffer_rows -= len(head)
+        return chunks
+        
+    def _notify_reading_callbacks(self, batch: ReadingBatch) -> None:
+        """Call per-reading callbacks, materializing only the rows they need."""
+        if self.callbacks.get("*"):
+            readings = batch.readings()
+        else:
+            # Only rows of subscribed sensor types become objects
+            codes = [
+                _SENSOR_CODES_BY_NAME[name] for name in self.callbacks
+                if name in _SENSOR_CODES_BY_NAME
+            ]
+            rows = np.flatnonzero(np.isin(batch.sensor_code, codes))
+            if not len(rows):
+                return
+            readings = batch.take(rows).readings()
+            
+        for reading in readings:
+            # Notify registered callbacks
+            for callback in self.callbacks.get(reading.sensor_type.value, ()):
+                try:
+                    callback(reading)
+                except Exception as e:
+                    logger.error(f"Callback error: {e}")
+                    
+            # Notify all-sensors callbacks
+            for callback in self.callbacks.get("*", ()):
+                try:
+                    callback(reading)
+                except Exception as e:
+                    logger.error(f"Callback error: {e}")
+                    
     def register_callback(
         self, 
         sensor_type: str, 
@@ -142,11 +306,26 @@ class SensorDataCollector:
             self.callbacks[sensor_type] = []
         self.callbacks[sensor_type].append(callback)
         
-    def get_buffered_readings(self) -> List[SensorReading]:
-        """Get and clear buffered readings."""
-        readings = self._readings_buffer.copy()
-        self._readings_buffer.clear()
-        return readings
+    def register_batch_callback(
+        self,
+        callback: Callable[[ReadingBatch], None]
+    ) -> None:
+        """Register callback receiving each dispatched ReadingBatch (all sensors)."""
+        self.batch_callbacks.append(callback)
+        
+    def get_buffered_batch(self, max_count: Optional[int] = None) -> ReadingBatch:
+        """Get and remove up to max_count buffered readings (all if None) as one batch, oldest first."""
+        rows = self._buffer_rows if max_count is None else min(max_count, self._buffer_rows)
+        return ReadingBatch.concat(self._pop_buffered(rows))
+        
+    def get_buffered_readings(self, max_count: Optional[int] = None) -> List[SensorReading]:
+        """Get and remove up to max_count buffered readings (all if None), oldest first."""
+        return self.get_buffered_batch(max_count).readings()
+        
+    def set_flush_listener(self, threshold: int, listener: Callable[[], None]) -> None:
+        """Call listener whenever the reading buffer fills up to threshold."""
+        self._flush_threshold = threshold
+        self._flush_listener = listener
         
     def start(self) -> None:
         """Start the data collector."""
@@ -165,3 +344,13 @@ class SensorDataCollector:
     @property
     def is_connected(self) -> bool:
         return self._connected
+        
+    @property
+    def ingest_stats(self) -> Dict[str, int]:
+        """Ingest queue counters (empty when dispatching inline)."""
+        return self._ingest_queue.get_stats() if self._ingest_queue else {}
+        
+    @property
+    def buffer_dropped(self) -> int:
+        """Readings discarded because the storage buffer was full."""
+        return self._buffer_dropped
@@ -0,0 +1,153 @@
+"""
+Ingest queue for the Sensor Data Collector.
+Hands parsed readings from the MQTT network thread to the asyncio event loop.
+"""
+import asyncio
+import logging
+import threading
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Generic, Iterable, List, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class OverflowPolicy(Enum):
+    """What to do when the ingest queue is full."""
+    BLOCK = "block"  # Producer waits for space (up to block_timeout)
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued item
+    DROP_NEWEST = "drop_newest"  # Discard the incoming item
+
+
+class IngestQueue(Generic[T]):
+    """
+    Bounded, thread-safe queue drained on the event loop in batches.
+
+    ``put`` may be called from any thread. The first item into an empty
+    queue schedules a drain with ``call_soon_threadsafe``; the drain hands
+    up to ``batch_size`` items to ``consumer`` on the loop thread and
+    reschedules itself until the queue is empty, so a burst costs one
+    wakeup rather than one per message.
+    
+    With OverflowPolicy.BLOCK the producer waits for the loop to make room,
+    so ``put`` must not be called from the loop thread in that mode.
+    """
+    
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        consumer: Callable[[List[T]], None],
+        maxsize: int = 10000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        batch_size: int = 500,
+        block_timeout: float = 1.0,
+    ):
+        if maxsize <= 0 or batch_size <= 0:
+            raise ValueError("maxsize and batch_size must be positive")
+        self._loop = loop
+        self._consumer = consumer
+        self.maxsize = maxsize
+        self.policy = policy
+        self.batch_size = batch_size
+        self.block_timeout = block_timeout
+        
+        self._items: Deque[T] = deque()
+        self._cond = threading.Condition()
+        self._drain_scheduled = False
+        
+        # Counters
+        self.enqueued = 0
+        self.dispatched = 0
+        self.dropped_oldest = 0
+        self.dropped_newest = 0
+        
+    def put(self, item: T) -> bool:
+        """
+        Enqueue an item from any thread.
+        Returns False if the item was dropped.
+        """
+        return self.put_many((item,)) == 1
+        
+    def put_many(self, items: Iterable[T]) -> int:
+        """
+        Enqueue several items under one lock acquisition.
+        Returns the number of items accepted.
+        """
+        accepted = 0
+        with self._cond:
+            for item in items:
+                if len(self._items) >= self.maxsize:
+                    if self.policy == OverflowPolicy.DROP_OLDEST:
+                        self._items.popleft()
+                        self.dropped_oldest += 1
+                    elif self.policy == OverflowPolicy.BLOCK:
+                        self._wakeup_locked()
+                        if not self._cond.wait_for(
+                            lambda: len(self._items) < self.maxsize,
+                            timeout=self.block_timeout,
+                        ):
+                            self.dropped_newest += 1
+                            continue
+                    else:
+                        self.dropped_newest += 1
+                        continue
+                        
+                self._items.append(item)
+                accepted += 1
+                
+            self.enqueued += accepted
+            if accepted:
+                self._wakeup_locked()
+        return accepted
+        
+    def _wakeup_locked(self) -> None:
+        """Schedule a drain on the loop unless one is pending (lock held)."""
+        if self._drain_scheduled or not self._items:
+            return
+        self._drain_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._drain)
+        except RuntimeError:
+            # Event loop closed during shutdown
+            logger.warning("Ingest queue drain skipped: event loop is closed")
+            
+    def _drain(self) -> None:
+        """Deliver one batch to the consumer (runs on the loop thread)."""
+        with self._cond:
+            count = min(self.batch_size, len(self._items))
+            batch = [self._items.popleft() for _ in range(count)]
+            more = bool(self._items)
+            self._drain_scheduled = more
+            self._cond.notify_all()
+            
+        if batch:
+            self.dispatched += len(batch)
+            try:
+                self._consumer(batch)
+            except Exception as e:
+                logger.error(f"Ingest consumer error: {e}")
+                
+        if more:
+            # Yield to other tasks between batches
+            self._loop.call_soon(self._drain)
+            
+    @property
+    def pending(self) -> int:
+        return len(self._items)
+        
+    @property
+    def dropped(self) -> int:
+        return self.dropped_oldest + self.dropped_newest
+        
+    def get_stats(self) -> dict:
+        """Queue counters for monitoring."""
+        return {
+            "pending": self.pending,
+            "enqueued": self.enqueued,
+            "dispatched": self.dispatched,
+            "dropped_oldest": self.dropped_oldest,
+            "dropped_newest": self.dropped_newest,
+        }
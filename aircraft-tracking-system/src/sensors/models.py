@@ -3,11 +3,15 @@ Sensor data models for Aircraft Tracking System.
 Defines data structures for various aircraft sensors.
 """
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Iterator, Mapping, Sequence, Tuple
+import time
 import uuid
 
+import numpy as np
+
 
 class SensorType(Enum):
     """Types of sensors in the aircraft."""
@@ -23,6 +27,36 @@ class SensorType(Enum):
     BRAKE_TEMP = "brake_temperature"
 
 
+# Stable numeric codes for compact wire formats (never renumber)
+SENSOR_CODES: Dict[SensorType, int] = {
+    SensorType.ENGINE_TEMP: 1,
+    SensorType.OIL_PRESSURE: 2,
+    SensorType.FUEL_LEVEL: 3,
+    SensorType.HYDRAULIC_PRESSURE: 4,
+    SensorType.VIBRATION: 5,
+    SensorType.ALTITUDE: 6,
+    SensorType.AIRSPEED: 7,
+    SensorType.GPS: 8,
+    SensorType.LANDING_GEAR: 9,
+    SensorType.BRAKE_TEMP: 10,
+}
+SENSOR_TYPES_BY_CODE: Dict[int, SensorType] = {code: t for t, code in SENSOR_CODES.items()}
+
+# Units assumed when a payload does not carry one
+DEFAULT_UNITS: Dict[SensorType, str] = {
+    SensorType.ENGINE_TEMP: "celsius",
+    SensorType.OIL_PRESSURE: "psi",
+    SensorType.FUEL_LEVEL: "percent",
+    SensorType.HYDRAULIC_PRESSURE: "psi",
+    SensorType.VIBRATION: "mm/s",
+    SensorType.ALTITUDE: "feet",
+    SensorType.AIRSPEED: "knots",
+    SensorType.GPS: "degrees",
+    SensorType.LANDING_GEAR: "state",
+    SensorType.BRAKE_TEMP: "celsius",
+}
+
+
 class AlertSeverity(Enum):
     """Alert severity levels."""
     INFO = "info"
@@ -31,17 +65,64 @@ class AlertSeverity(Enum):
     EMERGENCY = "emergency"
 
 
-@dataclass
+# Lookup table: sensor code -> SensorType (None for unused codes)
+SENSOR_TYPE_TABLE: List[Optional[SensorType]] = [
+    SENSOR_TYPES_BY_CODE.get(code) for code in range(max(SENSOR_TYPES_BY_CODE) + 1)
+]
+
+# Shared, read-only metadata for readings that carry none
+EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_epoch_ns(timestamp: datetime) -> int:
+    """Convert a datetime (naive values are treated as UTC) to epoch nanoseconds."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    delta = timestamp - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+def from_epoch_ns(timestamp_ns: int) -> datetime:
+    """Convert epoch nanoseconds to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1_000)
+
+
+def parse_timestamp_ns(value: Optional[str]) -> int:
+    """ISO-8601 timestamp from a payload as epoch ns, or now if absent."""
+    return to_epoch_ns(datetime.fromisoformat(value)) if value else time.time_ns()
+
+
+def _parse_timestamp(value: Optional[str]) -> datetime:
+    """ISO-8601 timestamp from a payload, or now (UTC) if absent."""
+    return datetime.fromisoformat(value) if value else datetime.utcnow()
+
+
+def _parse_optional_timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+@dataclass(slots=True)
 class SensorReading:
-    """Individual sensor reading."""
+    """
+    Individual sensor reading.
+    Slotted, with an integer epoch-ns timestamp and shared empty metadata,
+    to keep per-reading cost low at high ingest rates.
+    """
     sensor_id: str
     sensor_type: SensorType
     aircraft_id: str
     value: float
     unit: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: EMPTY_METADATA)
     
+    @property
+    def timestamp(self) -> datetime:
+        """Reading time as a naive UTC datetime."""
+        return from_epoch_ns(self.timestamp_ns)
+        
     def to_dict(self) -> Dict[str, Any]:
         return {
             "sensor_id": self.sensor_id,
@@ -50,10 +131,210 @@ class SensorReading:
             "value": self.value,
             "unit": self.unit,
             "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata,
+            "metadata": dict(self.metadata),
         }
 
 
+class ReadingBatch:
+    """
+    Columnar batch of sensor readings.
+    
+    Parallel NumPy arrays hold, per row, an index into ``aircraft_ids``,
+    the sensor code (see SENSOR_CODES), the value and the epoch-ns
+    timestamp. Batches built from SensorReading objects keep them so
+    ``readings()`` is free; otherwise readings are materialized on demand
+    with the default sensor id and unit.
+    """
+    
+    __slots__ = ("aircraft_ids", "aircraft_index", "sensor_code", "value", "timestamp_ns", "_readings")
+    
+    def __init__(
+        self,
+        aircraft_ids: List[str],
+        aircraft_index: np.ndarray,
+        sensor_code: np.ndarray,
+        value: np.ndarray,
+        timestamp_ns: np.ndarray,
+        readings: Optional[List[SensorReading]] = None,
+    ):
+        self.aircraft_ids = aircraft_ids
+        self.aircraft_index = aircraft_index
+        self.sensor_code = sensor_code
+        self.value = value
+        self.timestamp_ns = timestamp_ns
+        self._readings = readings
+        
+    @classmethod
+    def empty(cls) -> "ReadingBatch":
+        return cls(
+            [],
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=np.uint8),
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=np.int64),
+            [],
+        )
+        
+    @classmethod
+    def from_readings(cls, readings: Sequence[SensorReading]) -> "ReadingBatch":
+        """Build a batch from reading objects (kept for materialization)."""
+        count = len(readings)
+        ids: Dict[str, int] = {}
+        aircraft_index = np.fromiter(
+            (ids.setdefault(r.aircraft_id, len(ids)) for r in readings), dtype=np.int32, count=count
+        )
+        return cls(
+            list(ids),
+            aircraft_index,
+            np.fromiter((SENSOR_CODES[r.sensor_type] for r in readings), dtype=np.uint8, count=count),
+            np.fromiter((r.value for r in readings), dtype=np.float64, count=count),
+            np.fromiter((r.timestamp_ns for r in readings), dtype=np.int64, count=count),
+            list(readings),
+        )
+        
+    @classmethod
+    def for_aircraft(
+        cls,
+        aircraft_id: str,
+        sensor_code: np.ndarray,
+        value: np.ndarray,
+        timestamp_ns: np.ndarray,
+    ) -> "ReadingBatch":
+        """Build a single-aircraft batch from column arrays."""
+        return cls(
+            [aircraft_id],
+            np.zeros(len(value), dtype=np.int32),
+            sensor_code.astype(np.uint8, copy=False),
+            value.astype(np.float64, copy=False),
+            timestamp_ns.astype(np.int64, copy=False),
+        )
+        
+    @classmethod
+    def concat(cls, batches: Sequence["ReadingBatch"]) -> "ReadingBatch":
+        """Concatenate batches, merging their aircraft tables."""
+        if not batches:
+            return cls.empty()
+        if len(batches) == 1:
+            return batches[0]
+            
+        ids: Dict[str, int] = {}
+        indexes = []
+        for batch in batches:
+            remap = np.array(
+                [ids.setdefault(a, len(ids)) for a in batch.aircraft_ids], dtype=np.int32
+            )
+            indexes.append(remap[batch.aircraft_index] if len(batch) else batch.aircraft_index)
+            
+        readings = None
+        if all(batch._readings is not None for batch in batches):
+            readings = [r for batch in batches for r in batch._readings]
+            
+        return cls(
+            list(ids),
+            np.concatenate(indexes),
+            np.concatenate([b.sensor_code for b in batches]),
+            np.concatenate([b.value for b in batches]),
+            np.concatenate([b.timestamp_ns for b in batches]),
+            readings,
+        )
+        
+    def __len__(self) -> int:
+        return len(self.value)
+        
+    def take(self, rows) -> "ReadingBatch":
+        """Sub-batch of the given rows (slice, index array or boolean mask)."""
+        readings = None
+        if self._readings is not None:
+            if isinstance(rows, slice):
+                readings = self._readings[rows]
+            else:
+                selected = np.arange(len(self))[rows]
+                readings = [self._readings[i] for i in selected]
+        return ReadingBatch(
+            self.aircraft_ids,
+            self.aircraft_index[rows],
+            self.sensor_code[rows],
+            self.value[rows],
+            self.timestamp_ns[rows],
+            readings,
+        )
+        
+    def aircraft_id_at(self, row: int) -> str:
+        return self.aircraft_ids[self.aircraft_index[row]]
+        
+    def reading_at(self, row: int) -> SensorReading:
+        """One row as a SensorReading, without materializing the whole batch."""
+        if self._readings is not None:
+            return self._readings[row]
+        aircraft_id = self.aircraft_ids[self.aircraft_index[row]]
+        sensor_type = SENSOR_TYPE_TABLE[self.sensor_code[row]]
+        return SensorReading(
+            f"{aircraft_id}_{sensor_type.value}",
+            sensor_type,
+            aircraft_id,
+            float(self.value[row]),
+            DEFAULT_UNITS[sensor_type],
+            int(self.timestamp_ns[row]),
+        )
+        
+    def labels(self) -> Tuple[List[str], List[str], List[Mapping[str, Any]]]:
+        """Per-row sensor ids, units and metadata, without materializing readings."""
+        if self._readings is not None:
+            readings = self._readings
+            return (
+                [r.sensor_id for r in readings],
+                [r.unit for r in readings],
+                [r.metadata for r in readings],
+            )
+            
+        # Defaults depend only on (aircraft, sensor), so build each pair once
+        pairs, inverse = np.unique(
+            self.aircraft_index.astype(np.int64) * 256 + self.sensor_code, return_inverse=True
+        )
+        sensor_ids, units = [], []
+        for pair in pairs.tolist():
+            aircraft_id = self.aircraft_ids[pair >> 8]
+            sensor_type = SENSOR_TYPE_TABLE[pair & 0xFF]
+            sensor_ids.append(f"{aircraft_id}_{sensor_type.value}")
+            units.append(DEFAULT_UNITS[sensor_type])
+        rows = inverse.tolist()
+        return (
+            [sensor_ids[i] for i in rows],
+            [units[i] for i in rows],
+            [EMPTY_METADATA] * len(rows),
+        )
+        
+    def readings(self) -> List[SensorReading]:
+        """Rows as SensorReading objects (materialized once, then cached)."""
+        if self._readings is None:
+            aircraft_ids = self.aircraft_ids
+            readings = []
+            for index, code, value, timestamp_ns in zip(
+                self.aircraft_index.tolist(),
+                self.sensor_code.tolist(),
+                self.value.tolist(),
+                self.timestamp_ns.tolist(),
+            ):
+                aircraft_id = aircraft_ids[index]
+                sensor_type = SENSOR_TYPE_TABLE[code]
+                readings.append(SensorReading(
+                    f"{aircraft_id}_{sensor_type.value}",
+                    sensor_type,
+                    aircraft_id,
+                    value,
+                    DEFAULT_UNITS[sensor_type],
+                    timestamp_ns,
+                ))
+            self._readings = readings
+        return self._readings
+        
+    def __iter__(self) -> Iterator[SensorReading]:
+        return iter(self.readings())
+        
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [reading.to_dict() for reading in self.readings()]
+
+
 @dataclass
 class EngineData:
     """Engine performance data."""
@@ -69,6 +350,38 @@ class EngineData:
     n1: float  # Fan speed percentage
     n2: float  # Core speed percentage
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    @classmethod
+    def from_dict(cls, aircraft_id: str, data: Dict[str, Any]) -> "EngineData":
+        """Build from an engine snapshot frame payload."""
+        return cls(
+            aircraft_id=aircraft_id,
+            engine_number=int(data["engine_number"]),
+            temperature=float(data["temperature"]),
+            rpm=float(data.get("rpm", 0.0)),
+            oil_pressure=float(data["oil_pressure"]),
+            oil_temperature=float(data.get("oil_temperature", 0.0)),
+            fuel_flow=float(data.get("fuel_flow", 0.0)),
+            vibration=float(data["vibration"]),
+            egt=float(data.get("egt", 0.0)),
+            n1=float(data.get("n1", 0.0)),
+            n2=float(data.get("n2", 0.0)),
+            timestamp=_parse_timestamp(data.get("timestamp")),
+        )
+        
+    def to_readings(self) -> List[SensorReading]:
+        """Fan out the monitored engine parameters as sensor readings."""
+        prefix = f"{self.aircraft_id}-ENG{self.engine_number}"
+        metadata = MappingProxyType({"engine_number": self.engine_number})
+        timestamp_ns = to_epoch_ns(self.timestamp)
+        return [
+            SensorReading(f"{prefix}-TEMP", SensorType.ENGINE_TEMP, self.aircraft_id,
+                          self.temperature, "celsius", timestamp_ns, metadata),
+            SensorReading(f"{prefix}-OIL", SensorType.OIL_PRESSURE, self.aircraft_id,
+                          self.oil_pressure, "psi", timestamp_ns, metadata),
+            SensorReading(f"{prefix}-VIB", SensorType.VIBRATION, self.aircraft_id,
+                          self.vibration, "mm/s", timestamp_ns, metadata),
+        ]
 
 
 @dataclass
@@ -84,6 +397,35 @@ class FlightData:
     longitude: float
     fuel_remaining: float  # percentage
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    @classmethod
+    def from_dict(cls, aircraft_id: str, data: Dict[str, Any]) -> "FlightData":
+        """Build from a flight snapshot frame payload."""
+        return cls(
+            aircraft_id=aircraft_id,
+            altitude=float(data["altitude"]),
+            airspeed=float(data["airspeed"]),
+            ground_speed=float(data.get("ground_speed", 0.0)),
+            heading=float(data.get("heading", 0.0)),
+            vertical_speed=float(data.get("vertical_speed", 0.0)),
+            latitude=float(data.get("latitude", 0.0)),
+            longitude=float(data.get("longitude", 0.0)),
+            fuel_remaining=float(data["fuel_remaining"]),
+            timestamp=_parse_timestamp(data.get("timestamp")),
+        )
+        
+    def to_readings(self) -> List[SensorReading]:
+        """Fan out the monitored flight parameters as sensor readings."""
+        aircraft_id = self.aircraft_id
+        timestamp_ns = to_epoch_ns(self.timestamp)
+        return [
+            SensorReading(f"{aircraft_id}_altitude", SensorType.ALTITUDE, aircraft_id,
+                          self.altitude, "feet", timestamp_ns),
+            SensorReading(f"{aircraft_id}_airspeed", SensorType.AIRSPEED, aircraft_id,
+                          self.airspeed, "knots", timestamp_ns),
+            SensorReading(f"{aircraft_id}_fuel_level", SensorType.FUEL_LEVEL, aircraft_id,
+                          self.fuel_remaining, "percent", timestamp_ns),
+        ]
 
 
 @dataclass
@@ -119,3 +461,22 @@ class Alert:
             "acknowledged_at": self.acknowledged_at.isoformat() if self.acknowledged_at else None,
             "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None,
         }
+        
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Alert":
+        """Rebuild an alert from ``to_dict`` output."""
+        return cls(
+            id=data["id"],
+            aircraft_id=data.get("aircraft_id", ""),
+            sensor_type=SensorType(data["sensor_type"]) if data.get("sensor_type") else None,
+            severity=AlertSeverity(data.get("severity", AlertSeverity.INFO.value)),
+            title=data.get("title", ""),
+            message=data.get("message", ""),
+            value=data.get("value"),
+            threshold=data.get("threshold"),
+            acknowledged=bool(data.get("acknowledged", False)),
+            resolved=bool(data.get("resolved", False)),
+            created_at=_parse_timestamp(data.get("created_at")),
+            acknowledged_at=_parse_optional_timestamp(data.get("acknowledged_at")),
+            resolved_at=_parse_optional_timestamp(data.get("resolved_at")),
+        )
@@ -0,0 +1,284 @@
+"""
+Sharded ingestion for Aircraft Tracking System.
+Spreads parsing and monitoring across worker processes keyed by aircraft_id.
+"""
+import copy
+import logging
+import multiprocessing as mp
+import queue
+import threading
+import zlib
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+from src.sensors.models import Alert
+from config.settings import AlertConfig, MQTTConfig
+
+
+logger = logging.getLogger(__name__)
+
+# (topic, raw payload) as received from the broker
+RawMessage = Tuple[str, bytes]
+
+# (action, alert id): an operator "acknowledge" or "resolve" for a shard's alert
+ShardCommand = Tuple[str, str]
+
+
+def shard_for(aircraft_id: str, shards: int) -> int:
+    """Stable shard index for an aircraft (same in every process and run)."""
+    return zlib.crc32(aircraft_id.encode()) % shards
+
+
+def _worker_main(
+    shard: int,
+    mqtt_config: MQTTConfig,
+    alert_config: AlertConfig,
+    inbox: "mp.Queue",
+    outbox: "mp.Queue",
+    commands: "mp.Queue",
+) -> None:
+    """
+    Worker process: parse raw messages and run a MonitoringEngine shard.
+    Alerts raised (and alerts resolved because their condition cleared)
+    while handling one inbox batch are returned as one list. Operator
+    commands are applied before each batch.
+    """
+    # Imported here so the parent does not pay for it at module import
+    from src.monitoring.engine import MonitoringEngine
+    from src.sensors.collector import SensorDataCollector
+    
+    engine = MonitoringEngine(alert_config)
+    alerts: List[Alert] = []
+    # Snapshots: the engine keeps changing its alert objects (a raise and its
+    # resolution in one batch share one), and Queue.put pickles them later
+    def record(alert: Alert) -> None:
+        alerts.append(copy.copy(alert))
+        
+    engine.register_alert_callback(record)
+    engine.register_resolution_callback(record)
+    
+    parser = SensorDataCollector(mqtt_config)
+    parser.register_batch_callback(engine.process_batch)
+    
+    while True:
+        batch = inbox.get()
+        if batch is None:
+            break
+            
+        _apply_commands(engine, commands)
+        for topic, payload in batch:
+            parser.handle_message(topic, payload)
+        parser.get_buffered_batch()  # Persistence is not done per shard
+        
+        if alerts:
+            outbox.put((shard, alerts[:]))
+            alerts.clear()
+
+
+def _apply_commands(engine, commands: "mp.Queue") -> None:
+    """Apply the operator commands waiting for this shard's engine."""
+    while True:
+        try:
+            action, alert_id = commands.get_nowait()
+        except queue.Empty:
+            return
+        if action == "resolve":
+            # Also clears the alert state, so a persisting condition re-alerts
+            engine.resolve_alert(alert_id)
+        else:
+            engine.acknowledge_alert(alert_id)
+
+
+class ShardedIngestor:
+    """
+    Routes raw sensor messages to N worker processes by aircraft_id.
+
+    Every aircraft maps to exactly one worker, so its history stays local
+    to that worker's MonitoringEngine and its readings are processed in
+    arrival order. Messages are sent in batches of ``batch_size`` (or every
+    ``flush_interval`` seconds) to amortize IPC. Alerts from all workers
+    are merged and passed to ``on_alerts`` from a collector thread.
+
+    ``submit`` runs on the MQTT network thread and never blocks on a worker:
+    a batch whose inbox is full waits in that shard's backlog (retried on
+    every flush, oldest first), so a slow shard does not hold up the others.
+    Once a backlog also holds ``shard_queue_batches`` batches, its oldest
+    batch is dropped and counted.
+
+    Operator acknowledgements and resolutions made in the parent are
+    forwarded to the owning worker with ``forward_command``, so its alert
+    state and cooldowns follow them.
+
+    Per-reading collector callbacks and telemetry buffering happen inside
+    the workers' parsers and are not visible in the parent process.
+    """
+    
+    def __init__(
+        self,
+        mqtt_config: MQTTConfig,
+        alert_config: AlertConfig,
+        on_alerts: Callable[[List[Alert]], None],
+        workers: Optional[int] = None,
+    ):
+        self.mqtt_config = mqtt_config
+        self.alert_config = alert_config
+        self.on_alerts = on_alerts
+        self.workers = workers or mqtt_config.ingest_workers or mp.cpu_count()
+        self.batch_size = mqtt_config.shard_batch_size
+        self.flush_interval = mqtt_config.shard_flush_interval
+        
+        self._ctx = mp.get_context("spawn")
+        self._processes: List[mp.Process] = []
+        self._inboxes: List["mp.Queue"] = []
+        self._commands: List["mp.Queue"] = []
+        self._outbox: Optional["mp.Queue"] = None
+        self._pending: List[List[RawMessage]] = [[] for _ in range(self.workers)]
+        # Full batches waiting for inbox space, per shard
+        self._backlog: List[Deque[List[RawMessage]]] = [deque() for _ in range(self.workers)]
+        self._backlog_limit = mqtt_config.shard_queue_batches
+        # One lock per shard keeps each inbox's batches in order
+        self._locks = [threading.Lock() for _ in range(self.workers)]
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+        
+        # Counters
+        self.messages_routed = 0
+        self.messages_dropped = 0
+        self.alerts_received = 0
+        
+    def start(self) -> None:
+        """Spawn worker processes and the flush/alert threads."""
+        self._outbox = self._ctx.Queue()
+        for shard in range(self.workers):
+            inbox = self._ctx.Queue(maxsize=self.mqtt_config.shard_queue_batches)
+            commands = self._ctx.Queue()
+            process = self._ctx.Process(
+                target=_worker_main,
+                args=(shard, self.mqtt_config, self.alert_config, inbox, self._outbox, commands),
+                name=f"ingest-shard-{shard}",
+                daemon=True,
+            )
+            process.start()
+            self._inboxes.append(inbox)
+            self._commands.append(commands)
+            self._processes.append(process)
+            
+        self._stop.clear()
+        self._threads = [
+            threading.Thread(target=self._flush_periodically, name="shard-flush", daemon=True),
+            threading.Thread(target=self._collect_alerts, name="shard-alerts", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Sharded ingestion started with {self.workers} workers")
+        
+    def submit(self, aircraft_id: str, topic: str, payload: bytes) -> None:
+        """Queue a raw message for the shard that owns aircraft_id."""
+        shard = shard_for(aircraft_id, self.workers)
+        with self._locks[shard]:
+            pending = self._pending[shard]
+            pending.append((topic, payload))
+            self.messages_routed += 1
+            if len(pending) >= self.batch_size:
+                self._send(shard)
+                
+    def forward_command(self, action: str, alert: Alert) -> None:
+        """Send an operator "acknowledge" or "resolve" to the shard that owns the alert's aircraft."""
+        if self._commands:
+            self._commands[shard_for(alert.aircraft_id, self.workers)].put((action, alert.id))
+            
+    def flush(self) -> None:
+        """Send all partially filled batches (and backlogged ones) to their workers."""
+        for shard in range(self.workers):
+            with self._locks[shard]:
+                self._send(shard)
+                
+    def _send(self, shard: int) -> None:
+        """Move the shard's open batch to its backlog and put what fits into the inbox (lock held)."""
+        backlog = self._backlog[shard]
+        if self._pending[shard]:
+            backlog.append(self._pending[shard])
+            self._pending[shard] = []
+        inbox = self._inboxes[shard]
+        while backlog:
+            try:
+                inbox.put_nowait(backlog[0])
+            except queue.Full:
+                break
+            backlog.popleft()
+            
+        if len(backlog) > self._backlog_limit:
+            dropped = backlog.popleft()
+            if not self.messages_dropped:
+                logger.warning(f"Ingest shard {shard} is not keeping up; dropping its oldest messages")
+            self.messages_dropped += len(dropped)
+            
+    def _flush_periodically(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+            
+    def _collect_alerts(self) -> None:
+        while not self._stop.is_set():
+            try:
+                item = self._outbox.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                break
+            if item is None:
+                break
+            _, alerts = item
+            self.alerts_received += len(alerts)
+            try:
+                self.on_alerts(alerts)
+            except Exception as e:
+                logger.error(f"Shard alert callback error: {e}")
+                
+    def stop(self, timeout: float = 5.0) -> None:
+        """Flush, stop workers and join the helper threads."""
+        for shard, inbox in enumerate(self._inboxes):
+            with self._locks[shard]:
+                self._send(shard)
+                # Workers are still draining, so the rest may wait for space
+                backlog = self._backlog[shard]
+                try:
+                    while backlog:
+                        inbox.put(backlog[0], timeout=timeout)
+                        backlog.popleft()
+                    inbox.put(None, timeout=timeout)
+                except queue.Full:
+                    logger.warning(f"Ingest shard {shard} did not drain its queue before shutdown")
+                    backlog.clear()
+        for process, inbox, commands in zip(self._processes, self._inboxes, self._commands):
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+                # Batches it never read would keep the interpreter from exiting
+                inbox.cancel_join_thread()
+                commands.cancel_join_thread()
+                
+        self._stop.set()
+        # Workers have exited, so this sentinel follows their last alerts
+        self._outbox.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+            
+        # Deliver alerts that arrived after the last poll
+        while True:
+            try:
+                item = self._outbox.get_nowait()
+            except (queue.Empty, EOFError, OSError):
+                break
+            if item is None:
+                break
+            _, alerts = item
+            self.alerts_received += len(alerts)
+            self.on_alerts(alerts)
+            
+        self._processes.clear()
+        self._inboxes.clear()
+        self._commands.clear()
+        logger.info(
+            f"Sharded ingestion stopped ({self.messages_routed} messages, "
+            f"{self.messages_dropped} dropped, {self.alerts_received} alerts)"
+        )
@@ -0,0 +1,211 @@
+"""
+Telemetry persistence for Aircraft Tracking System.
+Batches buffered sensor readings into a time-partitioned PostgreSQL table.
+"""
+import asyncio
+import json
+import logging
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.sensors.collector import SensorDataCollector
+from src.sensors.models import SENSOR_TYPE_TABLE, ReadingBatch
+from config.settings import DatabaseConfig
+
+
+logger = logging.getLogger(__name__)
+
+COLUMNS = ("time", "aircraft_id", "sensor_type", "sensor_id", "value", "unit", "metadata")
+
+
+class TelemetryWriter:
+    """
+    Drains the collector's reading buffer and bulk-loads it with COPY.
+
+    A flush is triggered when the buffer reaches ``batch_size`` readings or
+    every ``flush_interval`` seconds, whichever comes first. Batches wait
+    in a queue of at most ``max_pending_batches``; when the database falls
+    behind the drain loop stops pulling from the collector, whose bounded
+    buffer then sheds the oldest readings instead of growing.
+    """
+    
+    def __init__(self, config: DatabaseConfig, collector: SensorDataCollector):
+        self.config = config
+        self.collector = collector
+        self.table = config.telemetry_table
+        
+        self._pool = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake = asyncio.Event()
+        self._batches: "asyncio.Queue[ReadingBatch]" = asyncio.Queue(
+            maxsize=config.max_pending_batches
+        )
+        self._tasks: List[asyncio.Task] = []
+        self._partitions: Set[date] = set()
+        self._partition_lock = asyncio.Lock()
+        self._running = False
+        
+        # Counters
+        self.rows_written = 0
+        self.rows_failed = 0
+        
+    async def start(self) -> None:
+        """Connect, create the schema and start the flush/write loops."""
+        import asyncpg
+        
+        self._pool = await asyncpg.create_pool(
+            self.config.dsn,
+            min_size=1,
+            max_size=self.config.pool_size,
+        )
+        await self._ensure_schema()
+        
+        self._loop = asyncio.get_running_loop()
+        self.collector.set_flush_listener(
+            self.config.batch_size,
+            lambda: self._loop.call_soon_threadsafe(self._wake.set),
+        )
+        
+        self._running = True
+        self._tasks.append(asyncio.create_task(self._flush_loop()))
+        for _ in range(self.config.pool_size):
+            self._tasks.append(asyncio.create_task(self._write_loop()))
+        logger.info(f"Telemetry writer started (table={self.table})")
+        
+    async def stop(self) -> None:
+        """Flush what is buffered, then stop and close the pool."""
+        self._running = False
+        self._wake.set()
+        
+        await self._enqueue_buffered(final=True)
+        await self._batches.join()
+        
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        
+        if self._pool:
+            await self._pool.close()
+        logger.info(
+            f"Telemetry writer stopped ({self.rows_written} rows written, "
+            f"{self.rows_failed} failed)"
+        )
+        
+    async def _flush_loop(self) -> None:
+        """Move readings from the collector buffer into the batch queue."""
+        while self._running:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.config.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self._enqueue_buffered()
+            
+    async def _enqueue_buffered(self, final: bool = False) -> None:
+        """Queue full batches, plus the partial remainder on a timed or final flush."""
+        batch_size = self.config.batch_size
+        while True:
+            batch = self.collector.get_buffered_batch(batch_size)
+            if not len(batch):
+                return
+            # Blocks while max_pending_batches are already waiting (backpressure)
+            await self._batches.put(batch)
+            if len(batch) < batch_size and not final:
+                return
+                
+    async def _write_loop(self) -> None:
+        """Write queued batches to the database."""
+        while True:
+            batch = await self._batches.get()
+            try:
+                await self._write_batch(batch)
+            except Exception as e:
+                # A bad batch must not take a writer down with it
+                self.rows_failed += len(batch)
+                logger.error(f"Dropping telemetry batch of {len(batch)} readings: {e}")
+            finally:
+                self._batches.task_done()
+                
+    async def _write_batch(self, batch: ReadingBatch) -> None:
+        """COPY one batch, retrying with backoff on transient errors."""
+        records = self._to_records(batch)
+        days = np.unique(batch.timestamp_ns.astype("datetime64[ns]").astype("datetime64[D]"))
+        
+        for attempt in range(self.config.write_retries + 1):
+            try:
+                await self._ensure_partitions(set(days.tolist()))
+                async with self._pool.acquire() as conn:
+                    await conn.copy_records_to_table(
+                        self.table,
+                        records=records,
+                        columns=COLUMNS,
+                    )
+                self.rows_written += len(records)
+                return
+            except Exception as e:
+                if attempt == self.config.write_retries:
+                    self.rows_failed += len(records)
+                    logger.error(f"Dropping telemetry batch of {len(records)} readings: {e}")
+                    return
+                delay = 0.5 * (2 ** attempt)
+                logger.warning(f"Telemetry write failed ({e}); retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                
+    @staticmethod
+    def _to_records(batch: ReadingBatch) -> List[Tuple]:
+        """COPY records built from the batch columns (in COLUMNS order)."""
+        times = batch.timestamp_ns.astype("datetime64[ns]").astype("datetime64[us]").tolist()
+        sensor_ids, units, metadata = batch.labels()
+        return list(zip(
+            [t.replace(tzinfo=timezone.utc) for t in times],
+            np.array(batch.aircraft_ids, dtype=object)[batch.aircraft_index].tolist(),
+            [SENSOR_TYPE_TABLE[code].value for code in batch.sensor_code.tolist()],
+            sensor_ids,
+            batch.value.tolist(),
+            units,
+            [json.dumps(dict(m)) if m else None for m in metadata],
+        ))
+        
+    async def _ensure_schema(self) -> None:
+        """Create the partitioned parent table and its index."""
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.table} (
+                    time TIMESTAMPTZ NOT NULL,
+                    aircraft_id TEXT NOT NULL,
+                    sensor_type TEXT NOT NULL,
+                    sensor_id TEXT NOT NULL,
+                    value DOUBLE PRECISION NOT NULL,
+                    unit TEXT NOT NULL DEFAULT '',
+                    metadata JSONB
+                ) PARTITION BY RANGE (time)
+                """
+            )
+            await conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_aircraft_sensor_time_idx "
+                f"ON {self.table} (aircraft_id, sensor_type, time)"
+            )
+            
+    async def _ensure_partitions(self, days: Set[date]) -> None:
+        """Create daily partitions that have not been seen yet."""
+        if days <= self._partitions:
+            return
+        async with self._partition_lock, self._pool.acquire() as conn:
+            for day in sorted(days - self._partitions):
+                start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+                end = start + timedelta(days=1)
+                await conn.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table}_{day:%Y%m%d} "
+                    f"PARTITION OF {self.table} "
+                    f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+                )
+                self._partitions.add(day)
+                
+    @property
+    def is_backlogged(self) -> bool:
+        """True while the batch queue is full and the flush loop is waiting."""
+        return self._batches.full()
@@ -0,0 +1,130 @@
+"""
+Alert state tracker tests for Aircraft Tracking System.
+"""
+from src.monitoring.alert_state import AlertStateTracker
+from src.sensors.models import Alert, AlertSeverity, SensorType
+
+
+KEY = ("AC1", SensorType.ENGINE_TEMP)
+COOLDOWNS = {
+    AlertSeverity.INFO: 60.0,
+    AlertSeverity.WARNING: 60.0,
+    AlertSeverity.CRITICAL: 30.0,
+    AlertSeverity.EMERGENCY: 10.0,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_tracker():
+    clock = FakeClock()
+    return AlertStateTracker(COOLDOWNS, hysteresis=0.05, clock=clock), clock
+
+
+def warning(tracker, value, threshold=85.0):
+    return tracker.on_alert(
+        KEY, AlertSeverity.WARNING, value, lambda: Alert(aircraft_id="AC1", value=value),
+        threshold=threshold,
+    )
+
+
+def test_repeat_is_suppressed_until_the_cooldown_passes():
+    tracker, clock = make_tracker()
+    first = warning(tracker, 90.0)
+    
+    clock.now += 59
+    assert warning(tracker, 91.0) is None
+    
+    clock.now += 1
+    reminder = warning(tracker, 92.0)
+    assert reminder is not None and reminder.id != first.id
+    # The reminder restarts the cooldown
+    clock.now += 30
+    assert warning(tracker, 92.0) is None
+    assert tracker.get_stats() == {"open": 1, "notified": 2, "suppressed": 2, "cleared": 0}
+
+
+def test_escalation_is_notified_inside_the_cooldown():
+    tracker, _ = make_tracker()
+    warning(tracker, 90.0)
+    
+    critical = tracker.on_alert(
+        KEY, AlertSeverity.CRITICAL, 96.0, lambda: Alert(aircraft_id="AC1", value=96.0),
+        threshold=95.0,
+    )
+    
+    assert critical is not None
+
+
+def test_value_inside_the_band_does_not_clear():
+    tracker, _ = make_tracker()
+    alert = warning(tracker, 90.0)
+    
+    # 85 - 5% = 80.75: readings back under the limit but inside the band keep it open
+    assert tracker.on_normal(KEY, 84.0) is None
+    assert tracker.on_normal(KEY, 80.8) is None
+    assert KEY in tracker
+    # Hovering at the limit cannot re-notify while the episode is open
+    assert warning(tracker, 85.5) is None
+    
+    assert tracker.on_normal(KEY, 80.5) is alert
+    assert KEY not in tracker
+    assert tracker.cleared == 1
+
+
+def test_recovery_rearms_the_alert():
+    tracker, _ = make_tracker()
+    first = warning(tracker, 90.0)
+    tracker.on_normal(KEY, 70.0)
+    
+    # No cooldown applies to a new episode
+    second = warning(tracker, 90.0)
+    
+    assert second is not None and second.id != first.id
+
+
+def test_low_limit_clears_above_the_band():
+    tracker, _ = make_tracker()
+    key = ("AC1", SensorType.OIL_PRESSURE)
+    alert = tracker.on_alert(
+        key, AlertSeverity.WARNING, 20.0, lambda: Alert(aircraft_id="AC1", value=20.0),
+        threshold=25.0, low=True,
+    )
+    
+    # 25 + 5% = 26.25
+    assert tracker.on_normal(key, 26.0) is None
+    assert tracker.on_normal(key, 26.5) is alert
+
+
+def test_deescalation_waits_for_the_band():
+    tracker, _ = make_tracker()
+    tracker.on_alert(
+        KEY, AlertSeverity.CRITICAL, 96.0, lambda: Alert(aircraft_id="AC1", value=96.0),
+        threshold=95.0,
+    )
+    
+    # Under the critical limit but inside the band: the episode stays critical
+    assert warning(tracker, 94.0) is None
+    assert tracker._states[KEY].severity == AlertSeverity.CRITICAL
+    
+    # Beyond the band (95 - 4.75): quietly becomes a warning episode
+    assert warning(tracker, 90.0) is None
+    assert tracker._states[KEY].severity == AlertSeverity.WARNING
+
+
+def test_statistical_alert_never_interrupts_a_threshold_episode():
+    tracker, clock = make_tracker()
+    warning(tracker, 90.0)
+    clock.now += 3600
+    
+    anomaly = tracker.on_alert(
+        KEY, AlertSeverity.WARNING, 88.0, lambda: Alert(aircraft_id="AC1", value=88.0)
+    )
+    
+    assert anomaly is None
@@ -0,0 +1,75 @@
+"""
+API endpoint tests for Aircraft Tracking System.
+Endpoints are called directly against a live scheduler.
+"""
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from config.settings import MaintenanceConfig
+from src.api import main as api
+from src.maintenance.models import AircraftStatus, MaintenanceEventType, MaintenanceStatus, MaintenanceTask
+from src.maintenance.scheduler import MaintenanceScheduler
+
+
+logging.disable(logging.CRITICAL)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    scheduler.register_aircraft(AircraftStatus("AC1", "N001", "A320", 0.0, 0))
+    api.attach_maintenance_scheduler(scheduler)
+    yield scheduler
+    api.attach_maintenance_scheduler(None)
+
+
+async def test_overdue_listing_leaves_deadlines_to_the_scheduler(scheduler):
+    task = scheduler.create_task(MaintenanceTask(
+        aircraft_id="AC1", title="Inspection", scheduled_date=datetime.utcnow() - timedelta(hours=1),
+    ))
+    
+    page = await api.get_overdue_maintenance(aircraft_id=None, cursor=None, limit=100)
+    assert page["overdue"] == []
+    assert task.status == MaintenanceStatus.SCHEDULED
+    
+    # The scheduler still emits the due event and marks the task
+    events = scheduler.pop_due_events()
+    assert [(e.event_type, e.task.id) for e in events] == [(MaintenanceEventType.DUE, task.id)]
+    page = await api.get_overdue_maintenance(aircraft_id=None, cursor=None, limit=100)
+    assert [t["id"] for t in page["overdue"]] == [task.id]
+
+
+async def test_invalid_status_transitions_conflict(scheduler):
+    task = scheduler.create_task(MaintenanceTask(aircraft_id="AC1", title="Inspection"))
+    
+    def patch(status, technician=None):
+        return api.update_maintenance_task(task.id, api.MaintenanceTaskUpdate(status=status, technician=technician))
+        
+    await patch("in_progress", "jdoe")
+    with pytest.raises(HTTPException) as error:
+        await patch("in_progress", "jdoe")
+    assert error.value.status_code == 409
+    
+    await patch("completed")
+    completed_at = task.completed_at
+    for status in ("cancelled", "in_progress", "completed"):
+        with pytest.raises(HTTPException) as error:
+            await patch(status, "jdoe")
+        assert error.value.status_code == 409
+    assert task.status == MaintenanceStatus.COMPLETED and task.completed_at == completed_at
+    
+    with pytest.raises(HTTPException) as error:
+        await patch("overdue")
+    assert error.value.status_code == 400
+    
+    cancelled = scheduler.create_task(MaintenanceTask(aircraft_id="AC1", title="Inspection"))
+    scheduler.cancel_task(cancelled.id)
+    with pytest.raises(HTTPException) as error:
+        await api.update_maintenance_task(
+            cancelled.id, api.MaintenanceTaskUpdate(status="in_progress", technician="jdoe")
+        )
+    assert error.value.status_code == 409
+    assert scheduler.start_task(cancelled.id, "jdoe").status == MaintenanceStatus.CANCELLED
@@ -0,0 +1,85 @@
+"""
+Monitoring engine tests for Aircraft Tracking System.
+"""
+import logging
+import time
+
+import numpy as np
+import pytest
+
+from config.settings import AlertConfig
+from src.monitoring.engine import MonitoringEngine
+from src.sensors.models import SENSOR_CODES, ReadingBatch, SensorType
+
+
+logging.disable(logging.CRITICAL)
+
+# Nominal value, noise and fault value per sensor; faults cross the thresholds
+PROFILES = {
+    SensorType.ENGINE_TEMP: (75.0, 2.0, 97.0),
+    SensorType.OIL_PRESSURE: (45.0, 1.5, 12.0),
+    SensorType.FUEL_LEVEL: (60.0, 0.5, 8.0),
+    SensorType.VIBRATION: (2.0, 0.3, 7.5),
+    SensorType.ALTITUDE: (35000.0, 50.0, 35000.0),
+}
+
+
+def fleet_batches(seed: int, aircraft: int = 4, rows: int = 3000, batch_size: int = 250):
+    """Column batches of noisy readings with faults, near-limit values and jumps."""
+    rng = np.random.default_rng(seed)
+    ids = [f"AC{n}" for n in range(aircraft)]
+    sensors = list(PROFILES)
+    aircraft_index = rng.integers(0, aircraft, rows).astype(np.int32)
+    sensor = rng.integers(0, len(sensors), rows)
+    nominal, noise, fault = (np.array([PROFILES[sensors[s]][i] for s in sensor]) for i in range(3))
+    values = nominal + rng.normal(0, 1, rows) * noise
+    # Faults, values just inside the limit (hysteresis band) and step changes (anomalies)
+    kind = rng.random(rows)
+    values = np.where(kind < 0.03, fault, values)
+    values = np.where((kind >= 0.03) & (kind < 0.06), fault * 0.97 + nominal * 0.03, values)
+    values = np.where((kind >= 0.06) & (kind < 0.08), nominal + 12 * noise, values)
+    codes = np.array([SENSOR_CODES[sensors[s]] for s in sensor], dtype=np.uint8)
+    timestamps = time.time_ns() - (rows - np.arange(rows, dtype=np.int64)) * 1_000_000
+    
+    # Some series get long runs within one batch (the vectorized history path)
+    runs = rng.random(rows) < 0.5
+    aircraft_index[runs] = 0
+    codes[runs] = SENSOR_CODES[SensorType.ENGINE_TEMP]
+    
+    return [
+        ReadingBatch(ids, aircraft_index[start:start + batch_size], codes[start:start + batch_size],
+                     values[start:start + batch_size], timestamps[start:start + batch_size])
+        for start in range(0, rows, batch_size)
+    ]
+
+
+def summary(alerts):
+    return [
+        (a.aircraft_id, a.sensor_type, a.severity, a.title, a.value, a.threshold)
+        for a in alerts
+    ]
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+@pytest.mark.parametrize("cooldown", [0.0, 300.0])
+def test_process_batch_matches_process_reading(seed, cooldown):
+    config = AlertConfig(
+        alert_cooldown_info=cooldown,
+        alert_cooldown_warning=cooldown,
+        alert_cooldown_critical=cooldown,
+        alert_cooldown_emergency=cooldown,
+    )
+    by_batch, by_reading = MonitoringEngine(config), MonitoringEngine(config)
+    batch_alerts, reading_alerts = [], []
+    
+    for batch in fleet_batches(seed):
+        batch_alerts.extend(by_batch.process_batch(batch))
+        for reading in batch.readings():
+            alert = by_reading.process_reading(reading)
+            if alert:
+                reading_alerts.append(alert)
+                
+    assert len(batch_alerts) > 10
+    assert summary(batch_alerts) == summary(reading_alerts)
+    assert summary(by_batch.get_active_alerts()) == summary(by_reading.get_active_alerts())
+    assert by_batch.alert_stats == by_reading.alert_stats
@@ -0,0 +1,126 @@
+"""
+WebSocket monitoring hub tests for Aircraft Tracking System.
+"""
+import asyncio
+import json
+import logging
+import time
+
+import numpy as np
+
+from src.api.hub import CLOSE_TRY_AGAIN_LATER, MonitoringHub
+from src.sensors.models import SENSOR_CODES, ReadingBatch, SensorType
+
+
+logging.disable(logging.CRITICAL)
+
+
+class FakeWebSocket:
+    """Records sent messages; sends wait while ``gate`` is closed, or forever if stuck."""
+    
+    def __init__(self, stuck: bool = False):
+        self.stuck = stuck
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.messages = []
+        self.close_code = None
+        self.closed = asyncio.Event()
+        
+    async def accept(self) -> None:
+        pass
+        
+    async def receive(self) -> dict:
+        await self.closed.wait()
+        return {"type": "websocket.disconnect"}
+        
+    async def send_text(self, text: str) -> None:
+        if self.stuck:
+            await asyncio.Event().wait()
+        await self.gate.wait()
+        self.messages.append(json.loads(text))
+        
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+        self.closed.set()
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+async def test_full_queue_drops_oldest_and_tells_the_client():
+    hub = MonitoringHub(queue_size=2)
+    websocket = FakeWebSocket()
+    serving = asyncio.create_task(hub.serve(websocket, "AC1"))
+    await wait_for(lambda: hub.get_stats()["subscribers"] == 1)
+    
+    # The first message is being sent while four more arrive for two slots
+    websocket.gate.clear()
+    for n in range(5):
+        hub.publish("AC1", {"type": "alert", "n": n})
+        await asyncio.sleep(0)
+    websocket.gate.set()
+    await wait_for(lambda: len(websocket.messages) == 4)
+    await hub.stop()
+    await serving
+    
+    assert websocket.messages == [
+        {"type": "alert", "n": 0},
+        {"type": "dropped", "count": 2},
+        {"type": "alert", "n": 3},
+        {"type": "alert", "n": 4},
+    ]
+    assert hub.dropped == 2
+
+
+async def test_watchdog_evicts_a_stalled_sender_only():
+    hub = MonitoringHub(send_timeout=0.1)
+    hub.start()
+    stalled, healthy = FakeWebSocket(stuck=True), FakeWebSocket()
+    stalled_serving = asyncio.create_task(hub.serve(stalled, "AC1"))
+    healthy_serving = asyncio.create_task(hub.serve(healthy, "AC1"))
+    await wait_for(lambda: hub.get_stats()["subscribers"] == 2)
+    
+    hub.publish("AC1", {"type": "alert", "n": 0})
+    await asyncio.wait_for(stalled_serving, timeout=2)
+    hub.publish("AC1", {"type": "alert", "n": 1})
+    await wait_for(lambda: len(healthy.messages) == 2)
+    
+    assert stalled.close_code == CLOSE_TRY_AGAIN_LATER
+    assert hub.evicted == 1
+    assert hub.get_stats()["subscribers"] == 1
+    assert not healthy.closed.is_set()
+    
+    await hub.stop()
+    await healthy_serving
+
+
+async def test_snapshots_send_the_latest_value_per_watched_aircraft():
+    hub = MonitoringHub(snapshot_interval=3600)
+    websocket = FakeWebSocket()
+    serving = asyncio.create_task(hub.serve(websocket, "AC1"))
+    await wait_for(lambda: hub.get_stats()["subscribers"] == 1)
+    
+    temp, fuel = SENSOR_CODES[SensorType.ENGINE_TEMP], SENSOR_CODES[SensorType.FUEL_LEVEL]
+    for values in ([70.0, 80.0, 81.0], [72.0, 79.0, 82.0]):
+        hub.on_batch(ReadingBatch(
+            ["AC1", "AC2"],
+            np.array([0, 0, 1], dtype=np.int32),
+            np.array([temp, fuel, temp], dtype=np.uint8),
+            np.array(values),
+            np.zeros(3, dtype=np.int64),
+        ))
+    
+    assert hub.publish_snapshots() == 1
+    assert hub.publish_snapshots() == 0
+    await wait_for(lambda: websocket.messages)
+    await hub.stop()
+    await serving
+    
+    (snapshot,) = websocket.messages
+    assert snapshot["type"] == "sensor_data"
+    assert snapshot["aircraft_id"] == "AC1"
+    assert snapshot["sensors"] == {"engine_temperature": 72.0, "fuel_level": 79.0}
@@ -0,0 +1,82 @@
+"""
+Alert notifier tests for Aircraft Tracking System.
+"""
+import asyncio
+import logging
+
+import pytest
+
+from config.settings import AlertConfig
+from src.alerts.notifier import AlertNotifier, NotificationChannel, WebhookNotifier
+from src.sensors.models import Alert, AlertSeverity
+
+
+logging.disable(logging.CRITICAL)
+
+
+class RecordingWebhook(WebhookNotifier):
+    """Webhook channel that records alerts instead of posting them."""
+    
+    def __init__(self, webhook_url: str):
+        super().__init__(webhook_url)
+        self.received = []
+        
+    async def start(self) -> None:
+        pass
+        
+    async def send(self, alert: Alert) -> bool:
+        self.received.append(alert.id)
+        return True
+
+
+def make_notifier(tmp_path) -> AlertNotifier:
+    config = AlertConfig(
+        telegram_bot_token=None,
+        twilio_account_sid=None,
+        outbox_path=str(tmp_path / "outbox.db"),
+        digest_window=0,
+    )
+    return AlertNotifier(config)
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition() and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+
+
+async def test_outbox_delivers_to_each_of_two_webhooks(tmp_path):
+    notifier = make_notifier(tmp_path)
+    first, second = RecordingWebhook("http://a/hook"), RecordingWebhook("http://b/hook")
+    notifier.add_channel(first)
+    notifier.add_channel(second)
+    await notifier.start()
+    
+    # Added while running, to the same URL as an existing channel
+    duplicate = RecordingWebhook("http://a/hook")
+    notifier.add_channel(duplicate)
+    
+    alert = Alert(aircraft_id="AC1", severity=AlertSeverity.CRITICAL, title="test")
+    await notifier.notify(alert)
+    channels = (first, second, duplicate)
+    await wait_for(lambda: all(channel.received for channel in channels))
+    await notifier.close()
+    
+    assert [channel.received for channel in channels] == [[alert.id]] * 3
+
+
+def test_blocking_channel_must_implement_send_blocking(tmp_path):
+    with pytest.raises(TypeError):
+        class SyncChannel(NotificationChannel):
+            name = "sync"
+            blocking = True
+            
+            async def send(self, alert: Alert) -> bool:
+                return True
+                
+    # Flagged per instance instead: rejected when added
+    channel = RecordingWebhook("http://a/hook")
+    channel.blocking = True
+    with pytest.raises(TypeError):
+        make_notifier(tmp_path).add_channel(channel)
@@ -0,0 +1,147 @@
+"""
+Maintenance repository tests for Aircraft Tracking System.
+Run against a temporary sqlite+aiosqlite database as the local stand-in.
+"""
+import logging
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select
+
+from config.settings import DatabaseConfig, MaintenanceConfig
+from src.maintenance.models import AircraftStatus, MaintenanceStatus, MaintenanceTask, MaintenanceType
+from src.maintenance.repository import MaintenanceRepository, maintenance_tasks
+from src.maintenance.scheduler import MaintenanceScheduler
+
+
+logging.disable(logging.CRITICAL)
+
+
+@pytest.fixture
+async def repository(tmp_path):
+    repository = MaintenanceRepository(DatabaseConfig(), url=f"sqlite+aiosqlite:///{tmp_path / 'maintenance.db'}")
+    await repository.start()
+    await repository.create_schema()
+    yield repository
+    await repository.close()
+
+
+def make_task(aircraft_id: str = "AC1", created_offset: int = 0, **values) -> MaintenanceTask:
+    created = datetime(2024, 1, 1) + timedelta(minutes=created_offset)
+    return MaintenanceTask(aircraft_id=aircraft_id, title="A CHECK Due", created_at=created, **values)
+
+
+async def count_tasks(repository: MaintenanceRepository) -> int:
+    async with repository._engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(maintenance_tasks))).scalar()
+
+
+async def test_save_and_load_round_trip(repository):
+    status = AircraftStatus(
+        "AC1", "N001", "A320", 1234.5, 321,
+        last_a_check=datetime(2024, 3, 1, 12, 30), hours_since_a_check=42.0,
+    )
+    task = make_task(
+        maintenance_type=MaintenanceType.COMPONENT,
+        status=MaintenanceStatus.IN_PROGRESS,
+        description="Replace oil filter",
+        scheduled_date=datetime(2024, 4, 1, 8, 0),
+        due_flight_hours=1500.0,
+        started_at=datetime(2024, 3, 30, 9, 15),
+        technician="jdoe",
+        notes="parts ordered",
+        component_id="AC1:oil_filter",
+        component_name="oil_filter",
+    )
+    component = {
+        "component_id": "AC1:oil_filter", "aircraft_id": "AC1", "component_name": "oil_filter",
+        "interval_hours": 500.0, "interval_cycles": 0, "hours": 120.5, "cycles": 40,
+    }
+    await repository.save([status], [task], [component])
+    
+    assert await repository.load_aircraft() == [status]
+    assert await repository.load_tasks() == [task]
+    assert await repository.load_components() == [component]
+
+
+async def test_save_upserts_existing_rows(repository):
+    status = AircraftStatus("AC1", "N001", "A320", 100.0, 10)
+    task = make_task()
+    await repository.save([status], [task])
+    
+    status.total_flight_hours = 150.0
+    task.status = MaintenanceStatus.COMPLETED
+    task.completed_at = datetime(2024, 2, 1)
+    other = make_task(created_offset=1)
+    await repository.save([status], [task, other])
+    
+    assert await count_tasks(repository) == 2
+    assert (await repository.load_aircraft())[0].total_flight_hours == 150.0
+    # Completed tasks are not open, but stay in the database
+    assert [t.id for t in await repository.load_tasks()] == [other.id]
+    history = await repository.load_tasks(statuses=None)
+    assert [(t.id, t.status, t.completed_at) for t in history] == [
+        (task.id, MaintenanceStatus.COMPLETED, datetime(2024, 2, 1)),
+        (other.id, MaintenanceStatus.SCHEDULED, None),
+    ]
+
+
+async def test_persist_keeps_changes_pending_after_failed_write(tmp_path):
+    # No schema yet, so the first write fails
+    repository = MaintenanceRepository(DatabaseConfig(), url=f"sqlite+aiosqlite:///{tmp_path / 'empty.db'}")
+    await repository.start()
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    scheduler.register_aircraft(AircraftStatus("AC1", "N001", "A320", 0.0, 0))
+    scheduler.update_flight_hours("AC1", 480)
+    tasks = scheduler.get_tasks()
+    assert tasks
+    
+    with pytest.raises(Exception):
+        await scheduler.persist(repository)
+        
+    await repository.create_schema()
+    written = await scheduler.persist(repository)
+    assert written == len(tasks) + 1 + len(scheduler.components)
+    assert await scheduler.persist(repository) == 0
+    assert {t.id for t in await repository.load_tasks()} == {t.id for t in tasks}
+    assert (await repository.load_aircraft())[0].total_flight_hours == 480
+    await repository.close()
+
+
+async def test_load_tasks_filters_and_orders_by_creation(repository):
+    tasks = [
+        make_task("AC2", 3),
+        make_task("AC1", 1, status=MaintenanceStatus.OVERDUE),
+        make_task("AC1", 2, status=MaintenanceStatus.CANCELLED),
+        make_task("AC1", 0, status=MaintenanceStatus.IN_PROGRESS),
+        make_task("AC2", 4, status=MaintenanceStatus.COMPLETED),
+    ]
+    await repository.save(tasks=tasks)
+    
+    def ids(*indexes):
+        return [tasks[index].id for index in indexes]
+        
+    assert [t.id for t in await repository.load_tasks()] == ids(3, 1, 0)
+    assert [t.id for t in await repository.load_tasks(aircraft_id="AC1")] == ids(3, 1)
+    assert [t.id for t in await repository.load_tasks(statuses=None, aircraft_id="AC2")] == ids(0, 4)
+    cancelled = await repository.load_tasks(statuses=[MaintenanceStatus.CANCELLED])
+    assert [t.id for t in cancelled] == ids(2)
+
+
+async def test_restore_from_repository(repository):
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    scheduler.register_aircraft(AircraftStatus("AC1", "N001", "A320", 0.0, 0))
+    scheduler.update_flight_hours("AC1", 480)
+    await scheduler.persist(repository)
+    
+    restored = MaintenanceScheduler(MaintenanceConfig())
+    restored.restore(
+        await repository.load_aircraft(),
+        await repository.load_tasks(),
+        await repository.load_components(),
+    )
+    assert [t.id for t in restored.get_tasks()] == [t.id for t in scheduler.get_tasks()]
+    assert restored.get_due_components() == scheduler.get_due_components()
+    # Nothing is rewritten, and the open checks are not scheduled again
+    assert await restored.persist(repository) == 0
+    assert restored.update_flight_hours("AC1", 481) == []
@@ -0,0 +1,48 @@
+"""
+Maintenance scheduler tests for Aircraft Tracking System.
+"""
+import logging
+
+import pytest
+
+from config.settings import MaintenanceConfig
+from src.maintenance.models import AircraftStatus, MaintenanceStatus, MaintenanceType
+from src.maintenance.scheduler import MaintenanceScheduler
+
+
+logging.disable(logging.CRITICAL)
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = MaintenanceScheduler(MaintenanceConfig())
+    scheduler.register_aircraft(AircraftStatus("AC1", "N001", "A320", 0.0, 0))
+    return scheduler
+
+
+def overdue_then_fly(scheduler):
+    """Take AC1 past its A-check and oil filter interval, let the tasks go overdue, then keep flying."""
+    scheduler.bulk_update_flight_hours({"AC1": 510})
+    scheduler.pop_due_events()
+    scheduler.add_flight_time({"AC1": 0.5})
+    scheduler.add_flight_time({"AC1": 0.5})
+
+
+def test_overdue_component_is_not_scheduled_again(scheduler):
+    overdue_then_fly(scheduler)
+    tasks = scheduler.get_tasks("AC1", maintenance_type=MaintenanceType.COMPONENT)
+    oil_filter = [task for task in tasks if task.component_id == "AC1:oil_filter"]
+    assert len(oil_filter) == 1
+    assert oil_filter[0].status == MaintenanceStatus.OVERDUE
+
+
+def test_overdue_check_is_not_scheduled_again(scheduler):
+    overdue_then_fly(scheduler)
+    tasks = scheduler.get_tasks("AC1", maintenance_type=MaintenanceType.A_CHECK)
+    assert len(tasks) == 1
+    assert tasks[0].status == MaintenanceStatus.OVERDUE
+    
+    # Completing it resets the counter; the next check is scheduled on time
+    scheduler.complete_task(tasks[0].id)
+    assert scheduler.update_flight_hours("AC1", 511) == []
+    assert len(scheduler.update_flight_hours("AC1", 1000)) >= 1
@@ -0,0 +1,84 @@
+"""
+Sharded ingestion tests for Aircraft Tracking System.
+"""
+import logging
+import queue
+import threading
+
+from config.settings import AlertConfig, MQTTConfig
+from src.sensors.sharding import ShardedIngestor, _worker_main, shard_for
+
+
+logging.disable(logging.CRITICAL)
+
+
+def aircraft_on_shard(shard: int, shards: int = 2) -> str:
+    return next(f"AC{n}" for n in range(1000) if shard_for(f"AC{n}", shards) == shard)
+
+
+def test_full_shard_does_not_block_the_others():
+    config = MQTTConfig(shard_batch_size=1, shard_queue_batches=2)
+    ingestor = ShardedIngestor(config, AlertConfig(), on_alerts=lambda alerts: None, workers=2)
+    # Stand-in inboxes with room for one batch each, never drained by a worker
+    ingestor._inboxes = [queue.Queue(maxsize=1), queue.Queue(maxsize=1)]
+    slow, fast = aircraft_on_shard(0), aircraft_on_shard(1)
+    
+    for n in range(5):
+        ingestor.submit(slow, f"slow/{n}", b"")
+    ingestor.submit(fast, "fast/0", b"")
+    
+    # Shard 1 got its batch; shard 0 holds one in its inbox, two in its backlog
+    assert ingestor._inboxes[1].get_nowait() == [("fast/0", b"")]
+    assert ingestor.messages_dropped == 2
+    
+    # Once the worker catches up, backlogged batches follow in order
+    received = []
+    for _ in range(3):
+        received.extend(topic for topic, _ in ingestor._inboxes[0].get_nowait())
+        ingestor.flush()
+    assert received == ["slow/0", "slow/3", "slow/4"]
+
+
+def test_worker_applies_operator_resolve():
+    inbox, outbox, commands = queue.Queue(), queue.Queue(), queue.Queue()
+    worker = threading.Thread(
+        target=_worker_main, args=(0, MQTTConfig(), AlertConfig(), inbox, outbox, commands)
+    )
+    worker.start()
+    hot = [("aircraft/AC1/sensors/engine_temperature", b'{"value": 120.0}')]
+    
+    inbox.put(hot)
+    _, (first,) = outbox.get(timeout=5)
+    # Still inside the cooldown: the repeat is suppressed
+    inbox.put(hot)
+    
+    # Once an operator resolves the alert, the persisting condition alerts again
+    ingestor = ShardedIngestor(MQTTConfig(), AlertConfig(), on_alerts=lambda alerts: None, workers=1)
+    ingestor._commands = [commands]
+    ingestor.forward_command("resolve", first)
+    inbox.put(hot)
+    _, (second,) = outbox.get(timeout=5)
+    inbox.put(None)
+    worker.join(5)
+    
+    assert second.id != first.id
+    assert outbox.empty()
+
+
+def test_alert_raised_and_cleared_in_one_batch_arrives_twice():
+    inbox, outbox, commands = queue.Queue(), queue.Queue(), queue.Queue()
+    worker = threading.Thread(
+        target=_worker_main, args=(0, MQTTConfig(), AlertConfig(), inbox, outbox, commands)
+    )
+    worker.start()
+    topic = "aircraft/AC1/sensors/engine_temperature"
+    
+    inbox.put([(topic, b'{"value": 120.0}'), (topic, b'{"value": 70.0}')])
+    inbox.put(None)
+    worker.join(5)
+    _, (raised, cleared) = outbox.get_nowait()
+    
+    # The parent must see the alert raised before it is resolved
+    assert raised.id == cleared.id
+    assert not raised.resolved
+    assert cleared.resolved
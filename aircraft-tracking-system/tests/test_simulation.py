@@ -0,0 +1,95 @@
+"""
+Fleet maintenance simulation tests for Aircraft Tracking System.
+"""
+import numpy as np
+import pytest
+
+from config.settings import MaintenanceConfig
+from src.maintenance.models import AircraftStatus, MaintenanceType
+from src.maintenance.scheduler import MaintenanceScheduler
+from src.maintenance.simulation import DAYS_PER_WEEK, FleetSimulation
+
+
+# Short intervals, so aircraft reach several checks a week
+CONFIG = MaintenanceConfig(a_check_hours=40, b_check_hours=100, c_check_hours=300, d_check_hours=700)
+INTERVALS = [40.0, 100.0, 300.0, 700.0]
+
+
+def small_fleet(seed: int, aircraft: int = 12):
+    rng = np.random.default_rng(seed)
+    hours_since = rng.uniform(0, 1, (aircraft, 4)) * INTERVALS
+    hours_since[0, 0] = INTERVALS[0]  # Already due at the start
+    hours_per_day = rng.uniform(2, 12, aircraft)
+    return hours_since, hours_per_day
+
+
+def reference(hours_since: np.ndarray, hours_per_day: np.ndarray, weeks: int):
+    """Each aircraft on its own: fly, and perform every check the moment it is due."""
+    due = np.zeros((weeks, 4), dtype=np.int64)
+    flight_hours = np.zeros(weeks)
+    for aircraft in range(len(hours_since)):
+        since = [min(h, i) for h, i in zip(hours_since[aircraft], INTERVALS)]
+        for week in range(weeks):
+            left = hours_per_day[aircraft] * DAYS_PER_WEEK
+            while True:
+                for column, interval in enumerate(INTERVALS):
+                    if since[column] >= interval:
+                        due[week, column] += 1
+                        since[column] = 0.0
+                if left <= 0:
+                    break
+                step = min(left, min(i - h for h, i in zip(since, INTERVALS)))
+                since = [h + step for h in since]
+                left -= step
+                flight_hours[week] += step
+    return due, flight_hours
+
+
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_unlimited_capacity_matches_a_per_aircraft_loop(seed):
+    hours_since, hours_per_day = small_fleet(seed)
+    simulation = FleetSimulation(CONFIG, [f"AC{n}" for n in range(len(hours_since))], hours_since, hours_per_day)
+    
+    result = simulation.run(years=1)
+    due, flight_hours = reference(hours_since, hours_per_day, result.weeks)
+    
+    assert (result.due == due).all()
+    assert (result.performed == due).all()
+    assert result.backlog.sum() == 0
+    assert np.allclose(result.flight_hours, flight_hours)
+
+
+def test_check_reached_after_a_mid_week_release_is_due_that_week():
+    # Waits for its B check from week 0, then flies 70 h: through an A check
+    # (40 h) and 30 h towards the next one
+    hours_since = [[0.0, 100.0, 0.0, 0.0]]
+    simulation = FleetSimulation(CONFIG, ["AC1"], hours_since, hours_per_day=10.0)
+    
+    limited = simulation.run(years=2 / 52, hangar_capacity=1)
+    unlimited = simulation.run(years=2 / 52)
+    
+    # One slot a week: the B check takes week 0's, the A check waits a week
+    assert limited.due[0].tolist() == [1, 1, 0, 0]
+    assert limited.performed[0].tolist() == [0, 1, 0, 0]
+    assert limited.backlog[0].tolist() == [1, 0, 0, 0]
+    assert limited.performed[1].tolist() == [1, 0, 0, 0]
+    assert limited.delay_weeks.tolist() == [1.0, 0.0, 0.0, 0.0]
+    # Unlimited: done the week it falls due, and the aircraft flies the rest
+    assert unlimited.performed[0].tolist() == [1, 1, 0, 0]
+    assert unlimited.flight_hours[0] == 70.0
+
+
+def test_from_scheduler_starts_from_the_registered_fleet():
+    scheduler = MaintenanceScheduler(CONFIG)
+    scheduler.register_aircraft(AircraftStatus(
+        aircraft_id="AC1", registration="N1", model="A320", total_flight_hours=0, cycles=0,
+        hours_since_a_check=10.0, hours_since_b_check=20.0, hours_since_c_check=30.0,
+        hours_since_d_check=40.0,
+    ))
+    
+    simulation = FleetSimulation.from_scheduler(scheduler)
+    simulation.hours_since[0, 0] = 0.0
+    
+    assert simulation.aircraft_ids == ["AC1"]
+    # The simulation works on a copy of the scheduler's counters
+    assert scheduler.get_hours_since_checks()[1].tolist() == [[10.0, 20.0, 30.0, 40.0]]
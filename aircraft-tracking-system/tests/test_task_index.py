@@ -0,0 +1,86 @@
+"""
+Maintenance task index tests for Aircraft Tracking System.
+"""
+import itertools
+import random
+from datetime import datetime, timedelta
+
+from src.maintenance.models import MaintenanceStatus, MaintenanceTask, MaintenanceType
+from src.maintenance.task_index import TaskIndex
+
+
+def build(seed: int = 7, count: int = 2000):
+    rng = random.Random(seed)
+    index = TaskIndex()
+    now = datetime(2024, 1, 1)
+    tasks = []
+    for n in range(count):
+        task = MaintenanceTask(
+            aircraft_id=f"AC{n % 20}",
+            maintenance_type=rng.choice(list(MaintenanceType)),
+            # Repeated dates exercise the entry-number tie break; a few undated
+            scheduled_date=None if n % 50 == 0 else now + timedelta(days=rng.randrange(200)),
+        )
+        index.add(task)
+        tasks.append(task)
+        
+    # Reschedule, complete and pop some, leaving stale entries behind
+    for task in rng.sample(tasks, count // 3):
+        if rng.random() < 0.5:
+            task.scheduled_date = now + timedelta(days=rng.randrange(200))
+        else:
+            task.status = rng.choice([MaintenanceStatus.COMPLETED, MaintenanceStatus.CANCELLED])
+        index.reindex(task)
+    for task in index.pop_due(now + timedelta(days=20)):
+        task.status = MaintenanceStatus.OVERDUE
+        index.reindex(task)
+    return index
+
+
+def expected_scheduled(index: TaskIndex, until=None):
+    """Scheduled task ids by a full sort: dated up to ``until`` by date, then undated."""
+    scheduled = [
+        task for task in index
+        if task.status == MaintenanceStatus.SCHEDULED
+        and (until is None or task.scheduled_date is None or task.scheduled_date <= until)
+    ]
+    return [task.id for task in sorted(scheduled, key=lambda task: index.scheduled_position(task.id))]
+
+
+def pages(index: TaskIndex, until, limit: int):
+    ids, after = [], None
+    while True:
+        page = list(itertools.islice(index.scheduled(until=until, after=after), limit))
+        ids.extend(task.id for task in page)
+        if len(page) < limit:
+            return ids
+        after = index.scheduled_position(page[-1].id)
+
+
+def test_scheduled_pages_match_a_full_sort():
+    index = build()
+    for until in (None, datetime(2024, 3, 1)):
+        expected = expected_scheduled(index, until)
+        for limit in (1, 7, 100):
+            assert pages(index, until, limit) == expected
+
+
+def test_scheduled_resumes_after_changes_behind_the_cursor():
+    index = build(seed=11, count=300)
+    page = list(itertools.islice(index.scheduled(), 10))
+    after = index.scheduled_position(page[-1].id)
+    
+    # Tasks added or moved before the cursor are not listed; those after it are
+    early = MaintenanceTask(aircraft_id="AC1", scheduled_date=datetime(2000, 1, 1))
+    late = MaintenanceTask(aircraft_id="AC1", scheduled_date=datetime(2000, 1, 1))
+    index.add(early)
+    index.add(late)
+    late.scheduled_date = datetime(2100, 1, 1)
+    index.reindex(late)
+    page[0].scheduled_date = datetime(2099, 1, 1)
+    index.reindex(page[0])
+    
+    remaining = [task.id for task in index.scheduled(after=after)]
+    assert early.id not in remaining
+    assert late.id in remaining and page[0].id in remaining
+    assert remaining == [task_id for task_id in expected_scheduled(index) if index.scheduled_position(task_id) > after]
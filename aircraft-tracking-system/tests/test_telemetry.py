@@ -0,0 +1,100 @@
+"""
+Telemetry writer tests for Aircraft Tracking System.
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+
+import numpy as np
+
+from config.settings import DatabaseConfig
+from src.sensors.models import SENSOR_CODES, EngineData, ReadingBatch, SensorType
+from src.storage.telemetry import COLUMNS, TelemetryWriter
+
+
+logging.disable(logging.CRITICAL)
+
+
+class RecordingPool:
+    """Stand-in asyncpg pool that keeps the copied records."""
+    
+    def __init__(self):
+        self.records = []
+        
+    def acquire(self) -> "RecordingPool":
+        return self
+        
+    async def __aenter__(self) -> "RecordingPool":
+        return self
+        
+    async def __aexit__(self, *exc) -> None:
+        pass
+        
+    async def execute(self, query: str) -> None:
+        pass
+        
+    async def copy_records_to_table(self, table, records, columns) -> None:
+        self.records.extend(records)
+
+
+def engine_frame() -> EngineData:
+    return EngineData(
+        aircraft_id="AC1", engine_number=2, temperature=640.0, rpm=0.0,
+        oil_pressure=48.0, oil_temperature=0.0, fuel_flow=0.0, vibration=1.2,
+        egt=0.0, n1=0.0, n2=0.0, timestamp=datetime(2026, 10, 17, 12, 0, 0),
+    )
+
+
+def column_batch() -> ReadingBatch:
+    codes = [SENSOR_CODES[SensorType.ALTITUDE], SENSOR_CODES[SensorType.FUEL_LEVEL]]
+    return ReadingBatch.for_aircraft(
+        "AC2",
+        np.array(codes * 2),
+        np.array([35000.0, 80.0, 35010.0, 79.9]),
+        np.array([1, 1, 2, 2]) * 1_000_000_000 + 1_792_238_400_000_000_000,
+    )
+
+
+def test_engine_frame_metadata_is_serialized():
+    batch = ReadingBatch.from_readings(engine_frame().to_readings())
+    
+    records = TelemetryWriter._to_records(batch)
+    
+    assert len(records) == 3
+    for record in records:
+        row = dict(zip(COLUMNS, record))
+        assert row["aircraft_id"] == "AC1"
+        assert row["time"] == datetime(2026, 10, 17, 12, 0, 0, tzinfo=timezone.utc)
+        assert json.loads(row["metadata"]) == {"engine_number": 2}
+
+
+def test_column_records_match_materialized_readings():
+    batch = column_batch()
+    expected = [
+        (
+            r.timestamp.replace(tzinfo=timezone.utc), r.aircraft_id, r.sensor_type.value,
+            r.sensor_id, r.value, r.unit, None,
+        )
+        for r in column_batch().readings()
+    ]
+    
+    assert TelemetryWriter._to_records(batch) == expected
+    assert batch._readings is None
+
+
+async def test_bad_batch_is_counted_and_writer_keeps_going():
+    writer = TelemetryWriter(DatabaseConfig(write_retries=0), collector=None)
+    writer._pool = RecordingPool()
+    task = asyncio.create_task(writer._write_loop())
+    # Sensor code 0 is unassigned, so building its records fails
+    bad = ReadingBatch.for_aircraft("AC3", np.array([0]), np.array([1.0]), np.array([0]))
+    
+    await writer._batches.put(bad)
+    await writer._batches.put(column_batch())
+    await asyncio.wait_for(writer._batches.join(), timeout=1)
+    task.cancel()
+    
+    assert writer.rows_failed == 1
+    assert writer.rows_written == 4
+    assert len(writer._pool.records) == 4